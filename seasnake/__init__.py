@@ -1,3 +1,4 @@
 from .auth import MermaidAuth  # noqa: F401
 from .io import to_geojson  # noqa: F401
 from .projects import Project  # noqa: F401
+from .loader import ProjectLoader  # noqa: F401
@@ -0,0 +1,168 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class AdaptiveController:
+    """
+    Tunes the page size and number of concurrent requests of a client.
+
+    The controller is fed every response a client receives. While a download runs,
+    it hill-climbs the number of pages in flight: after each round of pages it adds
+    a worker if throughput improved and removes one if it didn't, and it halves the
+    number of workers whenever the server answers with a 5xx error. The page size
+    can't change mid-download without shifting page boundaries, so it is adjusted
+    between downloads from the observed latency and error rate.
+
+    Args:
+        page_size (int): The initial number of records per page. Defaults to 1000.
+        workers (int): The initial number of pages in flight. Defaults to 4.
+        min_page_size (int): The smallest page size. Defaults to 100.
+        max_page_size (int): The largest page size. Defaults to 5000.
+        min_workers (int): The fewest pages in flight. Defaults to 1.
+        max_workers (int): The most pages in flight. Defaults to 12.
+        target_latency (float): The page latency, in seconds, the page size is tuned
+            towards. Defaults to 5.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth
+    from seasnake.summaries import FishBeltTransect
+
+    auth = MermaidAuth()
+    fish_belt = FishBeltTransect(token=auth.get_token(), adaptive=True)
+    fish_belt.observations("AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE")
+    print(fish_belt.controller.stats())
+    ```
+    """
+
+    GROWTH_THRESHOLD = 1.05
+
+    def __init__(
+        self,
+        page_size: int = 1000,
+        workers: int = 4,
+        min_page_size: int = 100,
+        max_page_size: int = 5000,
+        min_workers: int = 1,
+        max_workers: int = 12,
+        target_latency: float = 5.0,
+    ):
+        self.page_size = page_size
+        self.workers = workers
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.target_latency = target_latency
+        self._lock = threading.Lock()
+        self._last_stats: Dict[str, Any] = {}
+        self.start()
+
+    def start(self):
+        """
+        Resets the statistics at the start of a download.
+        """
+
+        with self._lock:
+            self._started = time.monotonic()
+            self._responses = 0
+            self._errors = 0
+            self._bytes = 0
+            self._latency = 0.0
+            self._round_started = self._started
+            self._round_pages = 0
+            self._round_throughput: Optional[float] = None
+
+    def record(self, latency: float, num_bytes: int = 0, errors: int = 0):
+        """
+        Records a response.
+
+        Args:
+            latency (float): The time taken by the request, in seconds.
+            num_bytes (int): The size of the response body. Defaults to 0.
+            errors (int): The number of 5xx responses seen while sending the
+                request, including retried ones. Defaults to 0.
+        """
+
+        with self._lock:
+            self._responses += 1
+            self._bytes += num_bytes
+            self._latency += latency
+            if errors:
+                self._errors += errors
+                self.workers = max(self.min_workers, self.workers // 2)
+                self._start_round()
+                return
+
+            self._round_pages += 1
+            if self._round_pages >= self.workers:
+                self._end_round()
+
+    def _start_round(self):
+        self._round_started = time.monotonic()
+        self._round_pages = 0
+
+    def _end_round(self):
+        elapsed = max(time.monotonic() - self._round_started, 1e-6)
+        throughput = self._round_pages / elapsed
+        previous = self._round_throughput
+        if previous is None or throughput > previous * self.GROWTH_THRESHOLD:
+            self.workers = min(self.max_workers, self.workers + 1)
+        else:
+            self.workers = max(self.min_workers, self.workers - 1)
+        self._round_throughput = throughput
+        self._start_round()
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Ends a download, tunes the page size for the next one and returns the
+        download's statistics.
+
+        Returns:
+            Dict[str, Any]: See `stats`.
+        """
+
+        with self._lock:
+            stats = self._stats()
+            mean_latency = stats["mean_latency"]
+            if self._errors or mean_latency > self.target_latency:
+                self.page_size = max(self.min_page_size, self.page_size // 2)
+            elif self._responses and mean_latency < self.target_latency / 2:
+                self.page_size = min(self.max_page_size, self.page_size * 2)
+            self._last_stats = stats
+        return stats
+
+    def _stats(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        responses = self._responses
+        return {
+            "page_size": self.page_size,
+            "workers": self.workers,
+            "responses": responses,
+            "errors": self._errors,
+            "error_rate": self._errors / (responses + self._errors or 1),
+            "bytes": self._bytes,
+            "elapsed": elapsed,
+            "mean_latency": self._latency / responses if responses else 0.0,
+            "pages_per_second": responses / elapsed,
+            "bytes_per_second": self._bytes / elapsed,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the settings chosen by the controller and the throughput observed
+        during the last finished download.
+
+        Returns:
+            Dict[str, Any]: The current `page_size` and `workers`, and the last
+                download's `responses`, `errors`, `error_rate`, `bytes`, `elapsed`,
+                `mean_latency`, `pages_per_second` and `bytes_per_second`.
+        """
+
+        with self._lock:
+            return {
+                **self._last_stats,
+                "page_size": self.page_size,
+                "workers": self.workers,
+            }
@@ -0,0 +1,443 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+from .schemas import COMMON_SCHEMA
+
+SAMPLE_UNIT_KEY = "sample_unit_id"
+SAMPLE_EVENT_KEY = "sample_event_id"
+
+# Columns describing a sample event, copied to its sample units and sample events.
+SAMPLE_EVENT_COLUMNS: List[str] = [
+    column
+    for column in COMMON_SCHEMA
+    if column not in (SAMPLE_UNIT_KEY, SAMPLE_EVENT_KEY, "created_on", "updated_on")
+]
+
+# Columns describing a sample unit, copied from its observations.
+SAMPLE_UNIT_COLUMNS: List[str] = [
+    "transect_number",
+    "label",
+    "transect_length",
+    "transect_width",
+    "transect_width_name",
+    "size_bin",
+    "interval_size",
+    "interval_start",
+    "quadrat_size",
+    "num_quadrats",
+    "num_points_per_quadrat",
+    "depth",
+    "reef_slope",
+    "sample_time",
+    "observers",
+]
+
+# Sample unit columns that are averaged over sample events as well.
+SAMPLE_EVENT_METRICS: List[str] = ["depth"]
+
+BLEACHED_COUNTS = ["count_20", "count_50", "count_80", "count_100"]
+COLONY_COUNTS = ["count_normal", "count_pale", *BLEACHED_COUNTS, "count_dead"]
+
+
+def _groupby(df: DataFrame, keys: Sequence[str]):
+    return df.groupby(list(keys), observed=True, sort=False)
+
+
+def _pivot(
+    df: DataFrame, keys: Sequence[str], column: str, values: Optional[str] = None
+) -> Optional[DataFrame]:
+    # One row per sample unit and one column per value of `column`, holding the
+    # sum of `values` or the number of observations.
+    if column not in df.columns or (values is not None and values not in df.columns):
+        return None
+    grouped = _groupby(df, [*keys, column])
+    totals = grouped.size() if values is None else grouped[values].sum()
+    wide = totals.unstack(column, fill_value=0)
+    wide.columns = wide.columns.astype(str)
+    return wide
+
+
+def _percent(wide: Optional[DataFrame]) -> Optional[DataFrame]:
+    if wide is None:
+        return None
+    return wide.div(wide.sum(axis=1).replace(0, np.nan), axis=0) * 100
+
+
+def _dicts(wide: Optional[DataFrame], index: pd.Index) -> Optional[Series]:
+    if wide is None:
+        return None
+    wide = wide.reindex(index, fill_value=0)
+    return Series(wide.to_dict("records"), index=index, dtype=object)
+
+
+def _frame(index: pd.Index, **columns: Optional[Series]) -> DataFrame:
+    return DataFrame(
+        {name: values for name, values in columns.items() if values is not None},
+        index=index,
+    )
+
+
+def _index(df: DataFrame, keys: Sequence[str]) -> pd.Index:
+    return _groupby(df, keys).size().index
+
+
+def _beltfish(frames: Sequence[DataFrame], keys: Sequence[str]) -> DataFrame:
+    (observations,) = frames
+    index = _index(observations, keys)
+    grouped = _groupby(observations, keys)
+    return _frame(
+        index,
+        biomass_kgha=grouped["biomass_kgha"].sum(),
+        total_abundance=(
+            grouped["count"].sum() if "count" in observations.columns else None
+        ),
+        biomass_kgha_trophic_group=_dicts(
+            _pivot(observations, keys, "trophic_group", "biomass_kgha"), index
+        ),
+        biomass_kgha_fish_family=_dicts(
+            _pivot(observations, keys, "fish_family", "biomass_kgha"), index
+        ),
+    )
+
+
+def _benthic_cover(values: Optional[str]):
+    def aggregate(frames: Sequence[DataFrame], keys: Sequence[str]) -> DataFrame:
+        (observations,) = frames
+        index = _index(observations, keys)
+        return _frame(
+            index,
+            percent_cover_benthic_category=_dicts(
+                _percent(_pivot(observations, keys, "benthic_category", values)),
+                index,
+            ),
+        )
+
+    return aggregate
+
+
+def _habitat_complexity(frames: Sequence[DataFrame], keys: Sequence[str]) -> DataFrame:
+    (observations,) = frames
+    return _frame(
+        _index(observations, keys),
+        score_avg=_groupby(observations, keys)["score"].mean(),
+    )
+
+
+def _bleaching(frames: Sequence[DataFrame], keys: Sequence[str]) -> DataFrame:
+    colonies, percent_cover = frames
+    result = DataFrame()
+    if not colonies.empty:
+        result = _colonies(colonies, keys)
+    if not percent_cover.empty:
+        result = result.join(_percent_cover(percent_cover, keys), how="outer")
+    return result
+
+
+def _colonies(colonies: DataFrame, keys: Sequence[str]) -> DataFrame:
+    grouped = _groupby(colonies, keys)
+    counts = grouped[[c for c in COLONY_COUNTS if c in colonies.columns]].sum()
+    total = counts.sum(axis=1)
+    share = counts.div(total.replace(0, np.nan), axis=0) * 100
+    bleached = [c for c in BLEACHED_COUNTS if c in share.columns]
+    return _frame(
+        counts.index,
+        count_genera=grouped["benthic_attribute"].nunique(),
+        count_total=total,
+        percent_normal=share.get("count_normal"),
+        percent_pale=share.get("count_pale"),
+        percent_bleached=share[bleached].sum(axis=1, min_count=1) if bleached else None,
+    )
+
+
+def _percent_cover(percent_cover: DataFrame, keys: Sequence[str]) -> DataFrame:
+    grouped = _groupby(percent_cover, keys)
+    return _frame(
+        _index(percent_cover, keys),
+        quadrat_count=grouped.size(),
+        **{
+            f"{column}_avg": grouped[column].mean()
+            for column in ("percent_hard", "percent_soft", "percent_algae")
+            if column in percent_cover.columns
+        },
+    )
+
+
+# The function computing the metrics of each protocol's sample units from its
+# observations, keyed by the protocol's name, see `register_aggregate`.
+AGGREGATES: Dict[str, Callable[[Sequence[DataFrame], Sequence[str]], DataFrame]] = {
+    "beltfish": _beltfish,
+    "benthiclit": _benthic_cover("length"),
+    "benthicpit": _benthic_cover(None),
+    "benthicpqt": _benthic_cover("num_points"),
+    "bleachingqc": _bleaching,
+    "habitatcomplexity": _habitat_complexity,
+}
+
+
+def register_aggregate(
+    protocol: str,
+    aggregate: Callable[[Sequence[DataFrame], Sequence[str]], DataFrame],
+):
+    """
+    Registers how a protocol's sample units are computed from its observations.
+
+    Args:
+        protocol (str): The protocol's name, for example `"beltfish"`.
+        aggregate (Callable[[Sequence[DataFrame], Sequence[str]], DataFrame]): A
+            function taking the protocol's observation frames and the columns
+            identifying a sample unit, and returning one row of metrics per sample
+            unit, indexed by those columns.
+    """
+
+    AGGREGATES[protocol] = aggregate
+
+
+def sample_units(
+    protocol: str, *observations: DataFrame, keys: Sequence[str] = (SAMPLE_UNIT_KEY,)
+) -> DataFrame:
+    """
+    Computes a protocol's sample units from its observations, like the API's
+    `sampleunits` summaries:
+
+    - beltfish: `biomass_kgha`, `total_abundance`, and biomass by
+      `trophic_group` and `fish_family`
+    - benthiclit, benthicpit, benthicpqt: `percent_cover_benthic_category`, from
+      the length, number of points or number of quadrat points of each category
+    - bleachingqc: colony counts and percentages, and average percent cover of
+      the quadrats
+    - habitatcomplexity: `score_avg`
+
+    The columns describing the sample event and sample unit are copied from the
+    observations. Use `validate` to compare the result with the API's.
+
+    Args:
+        protocol (str): The protocol's name, for example `"beltfish"`.
+        *observations (DataFrame): The protocol's observations, e.g. a cached
+            `FishBeltTransect.observations` frame. Bleaching takes the colonies
+            bleached and percent cover observations, in that order.
+        keys (Sequence[str]): The columns identifying a sample unit. Defaults to
+            `sample_unit_id`.
+
+    Returns:
+        DataFrame: One row per sample unit.
+
+    Raises:
+        ValueError: If the protocol has no registered aggregate.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth, FishBeltTransect
+    from seasnake import aggregate
+
+    auth = MermaidAuth()
+    fish_belt = FishBeltTransect(token=auth.get_token())
+    project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+    observations = fish_belt.observations(project_id)
+    print(aggregate.sample_units("beltfish", observations))
+    ```
+    """
+
+    if protocol not in AGGREGATES:
+        raise ValueError(f"No aggregate registered for protocol: {protocol}")
+    keys = list(keys)
+    frames = [df for df in observations if not df.empty]
+    if not frames:
+        return DataFrame(columns=keys)
+
+    context_columns = [
+        column
+        for column in [SAMPLE_EVENT_KEY, *SAMPLE_EVENT_COLUMNS, *SAMPLE_UNIT_COLUMNS]
+        if column not in keys
+    ]
+    context: Optional[DataFrame] = None
+    for df in frames:
+        present = [column for column in context_columns if column in df.columns]
+        first = _groupby(df, keys)[present].first()
+        context = first if context is None else context.combine_first(first)
+    assert context is not None
+
+    metrics = AGGREGATES[protocol](list(observations), keys)
+    result = context.join(metrics, how="outer")
+    return result.reset_index()
+
+
+def sample_events(
+    sample_units: DataFrame, keys: Sequence[str] = (SAMPLE_EVENT_KEY,)
+) -> DataFrame:
+    """
+    Computes sample events from sample units, e.g. the result of `sample_units` or
+    the API's `sampleunits` summaries, like the API's `sampleevents` summaries.
+
+    Each numeric metric of the sample units is averaged into a `<metric>_avg`
+    column with its standard deviation in `<metric>_sd`, and metrics holding a
+    dict per sample unit, such as percent cover by benthic category, are averaged
+    by key into a `<metric>_avg` dict, counting missing keys as zero.
+
+    Args:
+        sample_units (DataFrame): The sample units.
+        keys (Sequence[str]): The columns identifying a sample event. Defaults to
+            `sample_event_id`.
+
+    Returns:
+        DataFrame: One row per sample event, with its `sample_unit_count`.
+    """
+
+    keys = list(keys)
+    if sample_units.empty:
+        return DataFrame(columns=keys)
+
+    descriptive = {
+        SAMPLE_UNIT_KEY,
+        "sample_unit_ids",
+        "id",
+        *keys,
+        *SAMPLE_EVENT_COLUMNS,
+        *SAMPLE_UNIT_COLUMNS,
+    } - set(SAMPLE_EVENT_METRICS)
+    metrics = [c for c in sample_units.columns if c not in descriptive]
+    grouped = _groupby(sample_units, keys)
+
+    present = [c for c in SAMPLE_EVENT_COLUMNS if c in sample_units.columns]
+    result = grouped.size().to_frame("sample_unit_count")
+    if present:
+        result = grouped[present].first().join(result)
+    for column in metrics:
+        values = sample_units[column]
+        if _is_dict_column(values):
+            wide = DataFrame(
+                [value if isinstance(value, dict) else {} for value in values],
+                index=sample_units.index,
+            ).fillna(0)
+            averages = wide.groupby(
+                [sample_units[key] for key in keys], observed=True, sort=False
+            ).mean()
+            result[f"{column}_avg"] = _dicts(averages, result.index)
+        elif pd.api.types.is_numeric_dtype(values) and not (
+            pd.api.types.is_bool_dtype(values)
+        ):
+            result[f"{column}_avg"] = grouped[column].mean()
+            result[f"{column}_sd"] = grouped[column].std()
+    return result.reset_index()
+
+
+def _is_dict_column(values: Series) -> bool:
+    if values.dtype != object:
+        return False
+    non_null = values.dropna()
+    return not non_null.empty and isinstance(non_null.iloc[0], dict)
+
+
+def validate(
+    local: DataFrame,
+    server: DataFrame,
+    key: str,
+    columns: Optional[Sequence[str]] = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-6,
+) -> DataFrame:
+    """
+    Compares locally computed sample units or sample events with the API's.
+
+    Server sample units that merge several sample units list them in
+    `sample_unit_ids` and are compared with each of them, and server rows are
+    otherwise matched by their `id` when they have no `key` column. Numbers are
+    compared within a tolerance, and dicts key by key, counting missing keys as
+    zero.
+
+    Args:
+        local (DataFrame): The result of `sample_units` or `sample_events`.
+        server (DataFrame): The API's summary of the same level.
+        key (str): The column identifying a row, e.g. `sample_unit_id`.
+        columns (Optional[Sequence[str]]): The columns to compare. Defaults to the
+            metrics present in both frames.
+        rtol (float): The relative tolerance of numbers. Defaults to 1e-6.
+        atol (float): The absolute tolerance of numbers. Defaults to 1e-6.
+
+    Returns:
+        DataFrame: One row per difference with the `key` value, the `column` and
+            the `local` and `server` values. Rows found in only one frame are
+            reported with `key` as their column. Empty when the frames match.
+    """
+
+    if key not in server.columns:
+        if "sample_unit_ids" in server.columns and key == SAMPLE_UNIT_KEY:
+            server = server.explode("sample_unit_ids").rename(
+                columns={"sample_unit_ids": key}
+            )
+        elif "id" in server.columns:
+            server = server.rename(columns={"id": key})
+    local = local.assign(**{key: local[key].astype(str)})
+    server = server.assign(**{key: server[key].astype(str)})
+
+    if columns is None:
+        descriptive = {key, SAMPLE_EVENT_KEY, *SAMPLE_EVENT_COLUMNS}
+        descriptive |= set(SAMPLE_UNIT_COLUMNS) - set(SAMPLE_EVENT_METRICS)
+        columns = [
+            column
+            for column in local.columns
+            if column in server.columns and column not in descriptive
+        ]
+
+    merged = local[[key, *columns]].merge(
+        server[[key, *columns]],
+        on=key,
+        how="outer",
+        suffixes=("_local", "_server"),
+        indicator=True,
+    )
+    rows: List[Dict[str, Any]] = []
+    for value, side in zip(merged[key], merged["_merge"]):
+        if side != "both":
+            rows.append(
+                {
+                    key: value,
+                    "column": key,
+                    "local": value if side == "left_only" else None,
+                    "server": value if side == "right_only" else None,
+                }
+            )
+    both = merged[merged["_merge"] == "both"]
+    for column in columns:
+        left, right = both[f"{column}_local"], both[f"{column}_server"]
+        differs = ~_equal(left, right, rtol, atol)
+        for value, a, b in zip(both[key][differs], left[differs], right[differs]):
+            rows.append({key: value, "column": column, "local": a, "server": b})
+    return DataFrame(rows, columns=[key, "column", "local", "server"])
+
+
+def _equal(left: Series, right: Series, rtol: float, atol: float) -> np.ndarray:
+    if _is_dict_column(left) or _is_dict_column(right):
+        return np.array(
+            [_dicts_equal(a, b, rtol, atol) for a, b in zip(left, right)], dtype=bool
+        )
+    if pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right):
+        return np.isclose(
+            left.to_numpy(dtype=float),
+            right.to_numpy(dtype=float),
+            rtol=rtol,
+            atol=atol,
+            equal_nan=True,
+        )
+    return np.array([_values_equal(a, b) for a, b in zip(left, right)], dtype=bool)
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    if pd.api.types.is_scalar(a) and pd.api.types.is_scalar(b):
+        if pd.isna(a) and pd.isna(b):
+            return True
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def _dicts_equal(a: Any, b: Any, rtol: float, atol: float) -> bool:
+    a = a if isinstance(a, dict) else {}
+    b = b if isinstance(b, dict) else {}
+    return all(
+        np.isclose(a.get(k, 0) or 0, b.get(k, 0) or 0, rtol=rtol, atol=atol)
+        for k in set(a) | set(b)
+    )
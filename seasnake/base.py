@@ -1,13 +1,43 @@
+import asyncio
+import functools
+import itertools
 import math
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 import requests
 from pandas import DataFrame
 from requests.adapters import HTTPAdapter, Retry
 
+from .adaptive import AdaptiveController
+from .cache import CacheBackend, CachePolicy, CacheStore, default_backend
+from .cache.client import CacheMixin
+from .cache.memory import MEMORY_CACHE, MemoryCache
+from .columnar import ColumnarDecoder
+from .ratelimit import RATE_LIMITER, RateLimiter, retry_after_seconds
+from .schemas import get_fields_param, get_schema
+from .streaming import parse_page
+
 PROJECT_STATUS_OPEN = 90
 PROJECT_STATUS_TEST = 80
 PROJECT_STATUS_LOCKED = 10
@@ -41,19 +71,210 @@ def requires_token(func):
     return wrapper
 
 
-class MermaidBase:
+def create_session(pool_size: int) -> requests.Session:
+    """
+    Creates a session that retries failed connections and 502, 503 and 504
+    responses, with a connection pool of `pool_size` keep-alive connections.
+
+    Args:
+        pool_size (int): The most connections kept open, which should be at least
+            the number of threads sharing the session.
+
+    Returns:
+        requests.Session
+    """
+
+    retries = Retry(
+        total=MAX_RETRIES, backoff_factor=1, status_forcelist=[502, 503, 504]
+    )
+    adapter = HTTPAdapter(
+        max_retries=retries, pool_connections=1, pool_maxsize=pool_size
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def default_num_threads() -> int:
+    """
+    Returns the default number of worker threads used to fetch pages.
+
+    Returns:
+        int
+    """
+
+    cpu_count = os.cpu_count() or 1
+    return min((1 if cpu_count <= 1 else cpu_count - 1) * 2, MAX_THREADS)
+
+
+class MermaidBase(CacheMixin):
     """
     Base class for the Mermaid API client.
 
+    The client owns a pooled `requests.Session` that is created on first use and
+    reused by every request, including the worker threads of `fetch_list`, so
+    keep-alive connections are shared across pages. Call `close()` or use the
+    client as a context manager to release the pooled connections. A session
+    shared with other clients can be passed in as `session`; it's left open by
+    `close()`.
+
     Attributes:
         REQUEST_LIMIT (int): The maximum number of records to retrieve in a single request.
+        MIN_THREADED_PAGES (int): The number of remaining pages from which `fetch_list`
+            fetches pages on worker threads rather than one after another.
         token (Optional[str]): The access token for the Mermaid API.
+        num_threads (int): The number of worker threads `fetch_list` uses, which is
+            also the size of the session's connection pool.
+        rate_limiter (RateLimiter): Paces requests and coordinates backoff when the
+            API throttles them. Defaults to `seasnake.ratelimit.RATE_LIMITER`, which
+            is shared by every client in the process.
+        timeout (Tuple[float, float]): The connect and read timeouts, in seconds, of
+            each request. Defaults to `(CONNECT_TIMEOUT, READ_TIMEOUT)`.
+        hedge_percentile (Optional[float]): When set, a page that has been running
+            longer than this percentile (0-100) of recent page latencies is requested
+            a second time and whichever response arrives first is used. Hedging
+            starts once `HEDGE_MIN_SAMPLES` pages have been timed.
+        controller (Optional[AdaptiveController]): Tunes the page size and number of
+            pages in flight from observed latency, throughput and errors when the
+            client is created with `adaptive=True`.
+        cache_backend (CacheBackend): The file format of cached DataFrames, see
+            `seasnake.cache`. Defaults to Parquet when `pyarrow` is installed.
+        cache_policy (CachePolicy): When cached DataFrames are served without
+            checking the API for changes. Defaults to checking on every read.
+        on_refresh (Optional[Callable[[str, DataFrame], None]]): Called with the URL
+            and the new DataFrame when a background refresh, see
+            `CachePolicy.stale_while_revalidate`, finds fresher data. It runs on a
+            background thread.
+        memory_cache (MemoryCache): Holds recently read cache files in memory.
+            Defaults to a cache shared by every client.
+        cache_store (Optional[CacheStore]): The cache directory, its size limit and
+            eviction policy, e.g. `CacheStore(path, max_bytes=..., eviction="lfu")`.
+            Defaults to the store of `seasnake.cache.client.CACHE_DIR` shared by
+            every client, see `cache`.
+        executor (Optional[Executor]): A worker pool shared with other clients that
+            `fetch_pages` runs pages on, instead of starting its own threads. It
+            isn't shut down by the client.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth, Project
+
+    auth = MermaidAuth()
+    with Project(token=auth.get_token()) as project:
+        print(project.my_projects())
+    ```
     """
 
     REQUEST_LIMIT = 1000
+    MIN_THREADED_PAGES = 5
+    CONNECT_TIMEOUT = 10.0
+    READ_TIMEOUT = 60.0
+    HEDGE_MIN_SAMPLES = 5
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        adaptive: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        timeout: Optional[Tuple[float, float]] = None,
+        hedge_percentile: Optional[float] = None,
+        cache_backend: Optional[CacheBackend] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        on_refresh: Optional[Callable[[str, DataFrame], None]] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        cache_store: Optional[CacheStore] = None,
+        session: Optional[requests.Session] = None,
+        executor: Optional[Executor] = None,
+    ):
         self.token = token
+        self.num_threads = num_threads or default_num_threads()
+        self.rate_limiter = rate_limiter or RATE_LIMITER
+        self.timeout = timeout or (self.CONNECT_TIMEOUT, self.READ_TIMEOUT)
+        self.hedge_percentile = hedge_percentile
+        self._page_latencies: Deque[float] = deque(maxlen=200)
+        self.controller: Optional[AdaptiveController] = None
+        if adaptive:
+            self.controller = AdaptiveController(
+                page_size=self.REQUEST_LIMIT,
+                workers=self.num_threads,
+                max_workers=self.num_threads * 2,
+            )
+        self._session: Optional[requests.Session] = session
+        self._owns_session = session is None
+        self._session_lock = threading.Lock()
+        self.executor = executor
+        self.cache_backend = cache_backend or default_backend()
+        self.cache_policy = cache_policy or CachePolicy()
+        self.on_refresh = on_refresh
+        self.memory_cache = MEMORY_CACHE if memory_cache is None else memory_cache
+        self.cache_store = cache_store
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The pooled session used for all requests made by this client.
+
+        The session is created lazily and is safe to share between the worker
+        threads of `fetch_list`. Its connection pool holds one keep-alive
+        connection per worker thread.
+
+        Returns:
+            requests.Session
+        """
+
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @property
+    def page_size(self) -> int:
+        """
+        The number of records requested per page.
+
+        Returns:
+            int
+        """
+
+        return self.controller.page_size if self.controller else self.REQUEST_LIMIT
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The most pages this client fetches concurrently.
+
+        Returns:
+            int
+        """
+
+        return self.controller.max_workers if self.controller else self.num_threads
+
+    def _create_session(self) -> requests.Session:
+        return create_session(self.max_workers)
+
+    def close(self):
+        """
+        Closes the pooled session and its keep-alive connections.
+
+        The client can still be used afterwards; a new session is created on
+        the next request. A session passed to the client is left open.
+        """
+
+        if not self._owns_session:
+            return
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     def get_full_url(self, url: str) -> str:
         """
@@ -75,10 +296,17 @@ class MermaidBase:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         method: str = "GET",
+        stream: bool = False,
+        timeout: Optional[Tuple[float, float]] = None,
     ) -> Dict[str, Any]:
         """
         Sends an API request.
 
+        Requests are paced by the client's rate limiter. A `429 Too Many Requests`
+        response pauses every request sharing the rate limiter for the duration
+        given by its `Retry-After` header, or an exponential, jittered backoff, and
+        the request is retried up to `MAX_RETRIES` times.
+
         Args:
             url (str): The URL for the API endpoint.
             payload (Optional[Dict[str, Any]]): The payload to include in the request.
@@ -88,6 +316,11 @@ class MermaidBase:
             headers (Optional[Dict[str, str]]): The headers to include in the request.
                 Defaults to None.
             method (str): The HTTP method to use for the request. Defaults to "GET".
+            stream (bool): Whether to decode the `results` of a paginated response
+                incrementally from the response stream, see `seasnake.streaming`.
+                Defaults to False.
+            timeout (Optional[Tuple[float, float]]): The connect and read timeouts,
+                in seconds. Defaults to the client's `timeout`.
 
         Returns:
             A dictionary containing the response from the API.
@@ -97,37 +330,74 @@ class MermaidBase:
             Exception: If the response status code is not 200.
         """
 
+        resp = self._send(url, payload, params, headers, method, stream, timeout)
+        if resp.status_code != 200:
+            raise Exception(f"Error fetching data: {resp.text}")
+
+        return parse_page(resp) if stream else resp.json()
+
+    def _send(
+        self,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        stream: bool = False,
+        timeout: Optional[Tuple[float, float]] = None,
+    ) -> requests.Response:
+        # Sends a request, pacing and retrying it as described in `fetch`, and
+        # returns the response whatever its status.
         _headers = {"Content-Type": "application/json", "User-Agent": "python"}
         _headers |= headers or {}
         payload = payload or {}
         url = self.get_full_url(url)
 
-        with requests.Session() as session:
-            retries = Retry(
-                total=MAX_RETRIES, backoff_factor=1, status_forcelist=[502, 503, 504]
-            )
-
-            session.mount("https://", HTTPAdapter(max_retries=retries))
-            method = method.upper()
-            if method == "GET":
-                request_method = session.get  # type: ignore
-            elif method == "POST":
-                request_method = session.post  # type: ignore
-            else:
-                raise requests.RequestException(f"Unsupported method: {method}")
+        method = method.upper()
+        if method == "GET":
+            request_method = self.session.get  # type: ignore
+        elif method == "POST":
+            request_method = self.session.post  # type: ignore
+        else:
+            raise requests.RequestException(f"Unsupported method: {method}")
 
+        for attempt in range(MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            started = time.monotonic()
             resp = request_method(
                 url,
                 data=payload,
                 params=params,
                 headers=_headers,
+                stream=stream,
+                timeout=timeout or self.timeout,
             )
-            if resp.status_code != 200:
-                raise Exception(f"Error fetching data: {resp.text}")
+            if self.controller is not None:
+                self._record_response(resp, started, stream)
+            if resp.status_code != 429 or attempt == MAX_RETRIES:
+                break
 
-            return resp.json()
+            retry_after = retry_after_seconds(resp.headers.get("Retry-After"))
+            resp.close()
+            self.rate_limiter.throttle(attempt, retry_after)
 
-    def fetch_list(
+        if resp.status_code != 429:
+            self.rate_limiter.succeeded()
+        return resp
+
+    def _record_response(self, resp: requests.Response, started: float, stream: bool):
+        retries = getattr(resp.raw, "retries", None)
+        history = getattr(retries, "history", None) or ()
+        errors = sum(1 for attempt in history if (attempt.status or 0) >= 500)
+        if resp.status_code >= 500:
+            errors += 1
+        num_bytes = int(resp.headers.get("Content-Length") or 0)
+        if not stream:
+            num_bytes = len(resp.content)
+        if self.controller is not None:
+            self.controller.record(time.monotonic() - started, num_bytes, errors)
+
+    def fetch_pages(
         self,
         url: str,
         query_params: Optional[Dict[str, Any]] = None,
@@ -135,9 +405,24 @@ class MermaidBase:
         headers: Optional[Dict[str, str]] = None,
         method: str = "GET",
         num_threads: Optional[int] = None,
-    ):
+        prefetch: Optional[int] = None,
+        page_handler: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        stream: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Any]:
         """
-        Sends multiple requests to the Mermaid API and returns a generator of results.
+        Sends multiple requests to the Mermaid API and returns a generator of pages.
+
+        Pages are yielded in page order. When several threads are used, at most
+        `prefetch` pages are requested ahead of the page being consumed, which bounds
+        the number of responses held in memory.
+
+        A `page_handler` runs on each page in the thread that fetched it, so pages can
+        be reduced, e.g. decoded into columns, before they are handed back.
+
+        When the client has a `hedge_percentile`, a GET page that is slower than
+        that percentile of recent pages is requested again and the first response
+        wins, so a single slow response doesn't hold up the pages behind it.
 
         Args:
             url (str): The URL for the API endpoint.
@@ -149,52 +434,281 @@ class MermaidBase:
                 Defaults to None.
             method (str): The HTTP method to use for the request. Defaults to "GET".
             num_threads (Optional[int]): The number of threads to use for making requests.
+                Defaults to the client's `num_threads`.
+            prefetch (Optional[int]): The maximum number of pages in flight.
+                Defaults to twice the number of threads.
+            page_handler (Optional[Callable[[Dict[str, Any]], Any]]): A function applied
+                to each page; its return value is yielded instead of the page.
                 Defaults to None.
+            stream (bool): Whether to decode each page's `results` incrementally,
+                see `fetch`. Defaults to False.
+            deadline (Optional[float]): The time, in seconds, allowed for fetching all
+                pages. Request timeouts are shortened to fit within it. Defaults to None.
 
         Yields:
-            A generator of dictionaries containing records from the API.
+            The API response for each page, or the page handler's result.
 
         Raises:
             Exception: If the response status code is not 200.
+            TimeoutError: If the deadline passes before all pages are fetched.
         """
 
         query_params = query_params or {}
-        result = self.fetch(
-            url, payload, params=query_params, headers=headers, method=method
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        request_page = functools.partial(
+            self._request_page,
+            url,
+            query_params,
+            deadline_at,
+            payload=payload,
+            headers=headers,
+            method=method,
+            stream=stream,
         )
-        total_records = result.get("count") or 0
-        num_calls = math.ceil(total_records / self.REQUEST_LIMIT) - 1
-        yield from result.get("results") or []
 
+        def handle_page(result: Dict[str, Any]) -> Any:
+            return result if page_handler is None else page_handler(result)
+
+        def fetch_page(page: int) -> Any:
+            started = time.monotonic()
+            result = handle_page(request_page(page))
+            self._page_latencies.append(time.monotonic() - started)
+            return result
+
+        controller = self.controller
+        if controller is not None:
+            controller.start()
+
+        try:
+            result = request_page(1)
+            num_calls = self._num_remaining_pages(query_params, result)
+            yield handle_page(result)
+            yield from self._fetch_remaining_pages(
+                range(2, num_calls + 2),
+                fetch_page,
+                num_threads,
+                prefetch,
+                deadline_at,
+                hedge=method.upper() == "GET",
+            )
+        finally:
+            if controller is not None:
+                controller.finish()
+
+    def _request_page(
+        self,
+        url: str,
+        query_params: Dict[str, Any],
+        deadline_at: Optional[float],
+        page: int,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        params = query_params if page == 1 else {**query_params, "page": page}
+        try:
+            return self.fetch(
+                url, params=params, timeout=self._timeout_before(deadline_at), **kwargs
+            )
+        except requests.Timeout as e:
+            if self._remaining(deadline_at) == 0:
+                raise TimeoutError("Deadline exceeded while fetching pages") from e
+            raise
+
+    def _fetch_remaining_pages(
+        self,
+        pages: range,
+        fetch_page: Callable[[int], Any],
+        num_threads: Optional[int],
+        prefetch: Optional[int],
+        deadline_at: Optional[float],
+        hedge: bool = False,
+    ) -> Iterator[Any]:
+        # Fetches the pages after the first, on worker threads when there are enough
+        # of them, with at most `window()` pages in flight.
+        controller = self.controller
         if num_threads is None:
-            cpu_count = os.cpu_count() or 1
-            num_threads = min((1 if cpu_count <= 1 else cpu_count - 1) * 2, MAX_THREADS)
-
-        if num_calls >= 5 and num_threads > 1:
-            with ThreadPoolExecutor(max_workers=num_threads) as executor:
-                futures = []
-                for n in range(num_calls):
-                    query_params["page"] = n + 2
-                    futures.append(
-                        executor.submit(
-                            self.fetch,
-                            url,
-                            payload,
-                            params=query_params,
-                            headers=headers,
-                            method=method,
-                        )
-                    )
+            num_threads = self.num_threads if controller is None else self.max_workers
+        threads = num_threads
+
+        def window() -> int:
+            if prefetch:
+                return prefetch
+            return threads * 2 if controller is None else controller.workers
 
-                for future in as_completed(futures):
-                    yield from future.result().get("results") or []
+        min_pages = self.MIN_THREADED_PAGES if controller is None else 2
+        if len(pages) >= min_pages and (num_threads > 1 or self.executor):
+            yield from self._fetch_pages_threaded(
+                pages, fetch_page, num_threads, window, deadline_at, hedge=hedge
+            )
         else:
-            for n in range(num_calls):
-                query_params["page"] = n + 2
-                result = self.fetch(
-                    url, payload, params=query_params, headers=headers, method=method
+            for page in pages:
+                yield fetch_page(page)
+
+    def _fetch_pages_threaded(
+        self,
+        pages: Iterable[int],
+        fetch_page: Callable[[int], Any],
+        num_threads: int,
+        window: Callable[[], int],
+        deadline_at: Optional[float],
+        hedge: bool = False,
+    ) -> Iterator[Any]:
+        in_flight: Deque[Tuple[int, Future]] = deque()
+        started: Dict[int, float] = {}
+
+        def run(page: int) -> Any:
+            started.setdefault(page, time.monotonic())
+            return fetch_page(page)
+
+        # Executors are shut down without waiting, so a request that lost a hedge
+        # race or outlived the deadline doesn't hold up the caller. A shared
+        # executor is left running.
+        executor = self.executor or ThreadPoolExecutor(max_workers=num_threads)
+        hedges = ThreadPoolExecutor(max_workers=2) if hedge else None
+        try:
+            for page in pages:
+                while len(in_flight) >= max(window(), 1):
+                    yield self._wait_page(
+                        *in_flight.popleft(), started, run, hedges, deadline_at
+                    )
+                in_flight.append((page, executor.submit(run, page)))
+
+            while in_flight:
+                yield self._wait_page(
+                    *in_flight.popleft(), started, run, hedges, deadline_at
                 )
-                yield from result.get("results") or []
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            if executor is not self.executor:
+                executor.shutdown(wait=False)
+            if hedges is not None:
+                hedges.shutdown(wait=False)
+
+    def _wait_page(
+        self,
+        page: int,
+        future: Future,
+        started: Dict[int, float],
+        run: Callable[[int], Any],
+        hedges: Optional[ThreadPoolExecutor],
+        deadline_at: Optional[float],
+    ) -> Any:
+        hedge_after = self._hedge_after() if hedges is not None else None
+        while hedge_after is not None and not future.done():
+            # Once the page has been running longer than the hedging threshold,
+            # race it against a duplicate request for the same page.
+            page_started = started.get(page)
+            if page_started is None:
+                delay = 0.05
+            else:
+                delay = page_started + hedge_after - time.monotonic()
+                if delay <= 0:
+                    hedge = hedges.submit(run, page)  # type: ignore
+                    return self._race(future, hedge, deadline_at=deadline_at)
+            wait([future], timeout=self._remaining(deadline_at, delay))
+            if self._remaining(deadline_at) == 0:
+                break
+
+        try:
+            return future.result(timeout=self._remaining(deadline_at))
+        except FutureTimeoutError as e:
+            raise TimeoutError("Deadline exceeded while fetching pages") from e
+
+    def _race(self, *futures: Future, deadline_at: Optional[float] = None) -> Any:
+        pending = set(futures)
+        failed: Optional[Future] = None
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=self._remaining(deadline_at),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                raise TimeoutError("Deadline exceeded while fetching pages")
+            for finished in done:
+                if finished.exception() is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return finished.result()
+                failed = finished
+        return failed.result()  # type: ignore
+
+    def _hedge_after(self) -> Optional[float]:
+        latencies = list(self._page_latencies)
+        if self.hedge_percentile is None or len(latencies) < self.HEDGE_MIN_SAMPLES:
+            return None
+        return float(np.percentile(latencies, self.hedge_percentile))
+
+    def _remaining(
+        self, deadline_at: Optional[float], limit: Optional[float] = None
+    ) -> Optional[float]:
+        if deadline_at is None:
+            return None if limit is None else max(limit, 0.0)
+        remaining = max(deadline_at - time.monotonic(), 0.0)
+        return remaining if limit is None else min(remaining, max(limit, 0.0))
+
+    def _timeout_before(
+        self, deadline_at: Optional[float]
+    ) -> Optional[Tuple[float, float]]:
+        if deadline_at is None:
+            return None
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Deadline exceeded while fetching pages")
+        connect_timeout, read_timeout = self.timeout
+        return min(connect_timeout, remaining), min(read_timeout, remaining)
+
+    def fetch_list(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        num_threads: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Sends multiple requests to the Mermaid API and returns a generator of results.
+
+        Records are yielded in page order, see `fetch_pages`.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, str]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+            num_threads (Optional[int]): The number of threads to use for making requests.
+                Defaults to the client's `num_threads`.
+            prefetch (Optional[int]): The maximum number of pages in flight.
+                Defaults to twice the number of threads.
+            deadline (Optional[float]): The time, in seconds, allowed for fetching all
+                pages, see `fetch_pages`. Defaults to None.
+
+        Yields:
+            A generator of dictionaries containing records from the API.
+
+        Raises:
+            Exception: If the response status code is not 200.
+            TimeoutError: If the deadline passes before all pages are fetched.
+        """
+
+        for result in self.fetch_pages(
+            url,
+            query_params=query_params,
+            payload=payload,
+            headers=headers,
+            method=method,
+            num_threads=num_threads,
+            prefetch=prefetch,
+            deadline=deadline,
+        ):
+            yield from result.get("results") or []
 
     def data_frame_from_url(
         self,
@@ -206,6 +720,9 @@ class MermaidBase:
         columns: Optional[Union[List[str], Tuple[str]]] = None,
         rename_columns: Optional[Dict[str, str]] = None,
         requires_auth: bool = True,
+        schema: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        deadline: Optional[float] = None,
     ) -> DataFrame:
         """Returns a pandas DataFrame from the data retrieved from a Mermaid API endpoint.
 
@@ -219,11 +736,330 @@ class MermaidBase:
                 Defaults to None.
             method (str): The HTTP method to use for the request. Defaults to "GET".
             columns (Optional[Union[List[str], Tuple[str]]]): The columns to include in the
-                resulting DataFrame. Defaults to None.
+                resulting DataFrame. Other fields are dropped while pages are decoded.
+                Defaults to None.
+            rename_columns (Optional[Dict[str, str]]): A dictionary of old and new column names
+                to rename the columns in the resulting DataFrame. Defaults to None.
+            requires_auth (bool): Whether authorization is required to access the API
+                endpoint. Defaults to True.
+            schema (Optional[Dict[str, str]]): The column types used to decode records,
+                see `seasnake.schemas`. Defaults to the schema registered for the endpoint.
+            stream (bool): Whether to decode each page incrementally from the response
+                stream in the thread that fetched it, rather than decoding whole pages.
+                This lowers peak memory when many pages are in flight. Records are
+                parsed incrementally when the optional `ijson` package is installed.
+                Defaults to False.
+            deadline (Optional[float]): The time, in seconds, allowed for downloading
+                all pages, see `fetch_pages`. Defaults to None.
+
+        Returns:
+            DataFrame
+
+        Raises:
+            Exception: If the response status code is not 200.
+            TimeoutError: If the deadline passes before all pages are fetched.
+        """
+
+        query_params, headers = self._request_options(
+            query_params, headers, requires_auth
+        )
+        schema = get_schema(url) if schema is None else schema
+        source_columns = self._project_columns(
+            url, query_params, columns, rename_columns
+        )
+        decoder = ColumnarDecoder(schema, columns=source_columns)
+
+        def decode_page(page: Dict[str, Any]) -> ColumnarDecoder:
+            page_decoder = ColumnarDecoder(schema, columns=source_columns)
+            page_decoder.append_iter(page.get("results") or [])
+            return page_decoder
+
+        for page in self.fetch_pages(
+            url,
+            query_params=query_params,
+            payload=payload,
+            headers=headers,
+            method=method,
+            page_handler=decode_page if stream else None,
+            stream=stream,
+            deadline=deadline,
+        ):
+            if stream:
+                decoder.merge(page)
+            else:
+                decoder.append(page.get("results") or [])
+        return self._select_columns(decoder.to_data_frame(), columns, rename_columns)
+
+    def iter_data_frames(
+        self,
+        url,
+        query_params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        columns: Optional[Union[List[str], Tuple[str]]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+        requires_auth: bool = True,
+        schema: Optional[Dict[str, str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        """Returns a generator of pandas DataFrames from a Mermaid API endpoint.
+
+        Unlike `data_frame_from_url`, records are never collected into a single list,
+        so only the pages in flight and the current chunk are held in memory.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, Any]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+            columns (Optional[Union[List[str], Tuple[str]]]): The columns to include in the
+                resulting DataFrames. Other fields are dropped while pages are decoded.
+                Defaults to None.
+            rename_columns (Optional[Dict[str, str]]): A dictionary of old and new column names
+                to rename the columns in the resulting DataFrames. Defaults to None.
+            requires_auth (bool): Whether authorization is required to access the API
+                endpoint. Defaults to True.
+            schema (Optional[Dict[str, str]]): The column types used to decode records,
+                see `seasnake.schemas`. Defaults to the schema registered for the endpoint.
+            chunk_size (Optional[int]): The number of rows in each DataFrame. Defaults to
+                None, which yields one DataFrame per page.
+
+        Yields:
+            DataFrame
+
+        Raises:
+            Exception: If the response status code is not 200.
+        """
+
+        query_params, headers = self._request_options(
+            query_params, headers, requires_auth
+        )
+        source_columns = self._project_columns(
+            url, query_params, columns, rename_columns
+        )
+        pages = self.fetch_pages(
+            url,
+            query_params=query_params,
+            payload=payload,
+            headers=headers,
+            method=method,
+        )
+
+        schema = get_schema(url) if schema is None else schema
+        buffer: List[Dict[str, Any]] = []
+
+        def to_data_frame(records: List[Dict[str, Any]]) -> DataFrame:
+            decoder = ColumnarDecoder(schema, columns=source_columns)
+            decoder.append(records)
+            return self._select_columns(
+                decoder.to_data_frame(), columns, rename_columns
+            )
+
+        for page in pages:
+            buffer.extend(page.get("results") or [])
+            size = chunk_size or len(buffer)
+            while buffer and len(buffer) >= size:
+                chunk, buffer = buffer[:size], buffer[size:]
+                yield to_data_frame(chunk)
+
+        if buffer:
+            yield to_data_frame(buffer)
+
+    async def fetch_async(
+        self,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+    ) -> Dict[str, Any]:
+        """
+        Sends an API request without blocking the running event loop.
+
+        The request is sent with the client's pooled session from the event loop's
+        default executor, so no thread pool is created per call.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            params (Optional[Dict[str, Any]]): The query parameters to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, str]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+
+        Returns:
+            A dictionary containing the response from the API.
+
+        Raises:
+            requests.RequestException: If an error occurs while sending the request.
+            Exception: If the response status code is not 200.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.fetch, url, payload, params=params, headers=headers, method=method
+            ),
+        )
+
+    async def fetch_pages_async(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        semaphore: Optional[asyncio.Semaphore] = None,
+        prefetch: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Sends multiple requests to the Mermaid API and returns an async generator of pages.
+
+        Pages are requested concurrently, bounded by `semaphore`, and are yielded
+        in page order. At most `prefetch` pages are requested ahead of the page being
+        consumed, which bounds the number of responses held in memory.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, str]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Pass the same semaphore to several calls, or to several clients,
+                to share one concurrency budget between them. Defaults to a semaphore
+                allowing the client's `num_threads` requests.
+            prefetch (Optional[int]): The maximum number of pages requested ahead.
+                Defaults to twice the client's `num_threads`, like `fetch_pages`.
+
+        Yields:
+            Dictionaries containing the API response for each page.
+
+        Raises:
+            Exception: If the response status code is not 200.
+        """
+
+        query_params = query_params or {}
+        semaphore = semaphore or asyncio.Semaphore(self.num_threads)
+
+        async def fetch_page(page: int) -> Dict[str, Any]:
+            params = query_params if page == 1 else {**query_params, "page": page}
+            async with semaphore:
+                return await self.fetch_async(
+                    url, payload, params=params, headers=headers, method=method
+                )
+
+        result = await fetch_page(1)
+        num_calls = self._num_remaining_pages(query_params, result)
+        yield result
+
+        pages = iter(range(2, num_calls + 2))
+        window = max(prefetch or self.num_threads * 2, 1)
+        tasks: Deque[asyncio.Future] = deque(
+            asyncio.ensure_future(fetch_page(page))
+            for page in itertools.islice(pages, window)
+        )
+        try:
+            while tasks:
+                result = await tasks.popleft()
+                # Keep the window full while the caller handles the page.
+                for page in itertools.islice(pages, 1):
+                    tasks.append(asyncio.ensure_future(fetch_page(page)))
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def fetch_list_async(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Sends multiple requests to the Mermaid API and returns an async generator of results.
+
+        Records are yielded in page order, see `fetch_pages_async`.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, str]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+
+        Yields:
+            Dictionaries containing records from the API.
+
+        Raises:
+            Exception: If the response status code is not 200.
+        """
+
+        async for result in self.fetch_pages_async(
+            url,
+            query_params=query_params,
+            payload=payload,
+            headers=headers,
+            method=method,
+            semaphore=semaphore,
+        ):
+            for record in result.get("results") or []:
+                yield record
+
+    async def data_frame_from_url_async(
+        self,
+        url,
+        query_params: Optional[Dict[str, Any]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        columns: Optional[Union[List[str], Tuple[str]]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+        requires_auth: bool = True,
+        schema: Optional[Dict[str, str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> DataFrame:
+        """Async version of `data_frame_from_url`.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            payload (Optional[Dict[str, Any]]): The payload to include in the request.
+                Defaults to None.
+            headers (Optional[Dict[str, Any]]): The headers to include in the request.
+                Defaults to None.
+            method (str): The HTTP method to use for the request. Defaults to "GET".
+            columns (Optional[Union[List[str], Tuple[str]]]): The columns to include in the
+                resulting DataFrame. Other fields are dropped while pages are decoded.
+                Defaults to None.
             rename_columns (Optional[Dict[str, str]]): A dictionary of old and new column names
                 to rename the columns in the resulting DataFrame. Defaults to None.
             requires_auth (bool): Whether authorization is required to access the API
                 endpoint. Defaults to True.
+            schema (Optional[Dict[str, str]]): The column types used to decode records,
+                see `seasnake.schemas`. Defaults to the schema registered for the endpoint.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
 
         Returns:
             DataFrame
@@ -232,28 +1068,85 @@ class MermaidBase:
             Exception: If the response status code is not 200.
         """
 
+        query_params, headers = self._request_options(
+            query_params, headers, requires_auth
+        )
+        decoder = ColumnarDecoder(
+            get_schema(url) if schema is None else schema,
+            columns=self._project_columns(url, query_params, columns, rename_columns),
+        )
+        async for page in self.fetch_pages_async(
+            url,
+            query_params=query_params,
+            payload=payload,
+            headers=headers,
+            method=method,
+            semaphore=semaphore,
+        ):
+            decoder.append(page.get("results") or [])
+        return self._select_columns(decoder.to_data_frame(), columns, rename_columns)
+
+    def _request_options(
+        self,
+        query_params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, Any]],
+        requires_auth: bool,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         headers = headers or {}
         query_params = query_params or {}
 
         if "limit" not in query_params:
-            query_params["limit"] = 1000
+            query_params["limit"] = self.page_size
 
         if requires_auth and "Authorization" not in headers:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        data = list(
-            self.fetch_list(
-                url,
-                query_params=query_params,
-                payload=payload,
-                headers=headers,
-                method=method,
-            )
-        )
-        if not data:
-            return DataFrame()
+        return query_params, headers
+
+    def _num_remaining_pages(
+        self, query_params: Dict[str, Any], result: Dict[str, Any]
+    ) -> int:
+        total_records = result.get("count") or 0
+        page_size = int(query_params.get("limit") or self.REQUEST_LIMIT)
+        results = result.get("results")
+        if (
+            page_size > self.REQUEST_LIMIT
+            and isinstance(results, list)
+            and 0 < len(results) < min(page_size, total_records)
+        ):
+            # The server capped a page size grown beyond the default limit.
+            page_size = len(results)
+        return max(math.ceil(total_records / page_size) - 1, 0)
+
+    def _project_columns(
+        self,
+        url: str,
+        query_params: Dict[str, Any],
+        columns: Optional[Union[List[str], Tuple[str]]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+    ) -> Optional[List[str]]:
+        # Maps the requested columns back to record keys so the decoder can drop
+        # everything else, and asks the API for only those fields when it can.
+        if not columns:
+            return None
+
+        source_names = {new: old for old, new in (rename_columns or {}).items()}
+        source_columns = [source_names.get(column, column) for column in columns]
+
+        fields_param = get_fields_param(url)
+        if fields_param and fields_param not in query_params:
+            query_params[fields_param] = ",".join(source_columns)
 
-        df = DataFrame(data)
+        return source_columns
+
+    def _select_columns(
+        self,
+        df: DataFrame,
+        columns: Optional[Union[List[str], Tuple[str]]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+    ) -> DataFrame:
+        if df.empty:
+            return df
 
         if rename_columns:
             df = df.rename(columns=rename_columns)
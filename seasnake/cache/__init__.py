@@ -0,0 +1,10 @@
+from .backends import (  # noqa: F401
+    ArrowBackend,
+    CacheBackend,
+    ParquetBackend,
+    PickleBackend,
+    default_backend,
+)
+from .memory import MEMORY_CACHE, MemoryCache  # noqa: F401
+from .policy import CachePolicy  # noqa: F401
+from .store import CacheStore, get_store  # noqa: F401
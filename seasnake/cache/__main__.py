@@ -0,0 +1,111 @@
+import argparse
+import sys
+import time
+from typing import Optional, Sequence
+
+from .policy import CachePolicy
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the cache commands:
+
+    ```
+    python -m seasnake.cache warm [--project ID ...] [--protocol NAME ...] [--workers N]
+    python -m seasnake.cache stats
+    python -m seasnake.cache benchmark [--rows N] [--repeat N] [--directory DIR]
+    ```
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments. Defaults to
+            `sys.argv`.
+
+    Returns:
+        int: The exit code, 1 if any summary failed to warm.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m seasnake.cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = commands.add_parser(
+        "warm", help="Fill the cache with every summary of your projects."
+    )
+    warm_parser.add_argument(
+        "--token",
+        help="The API access token. Defaults to $MERMAID_TOKEN, or logging in.",
+    )
+    warm_parser.add_argument(
+        "--project",
+        action="append",
+        dest="projects",
+        help="A project to warm, may be repeated. Defaults to all your projects.",
+    )
+    warm_parser.add_argument(
+        "--protocol",
+        action="append",
+        dest="protocols",
+        help="A protocol to warm, may be repeated. Defaults to all protocols.",
+    )
+    warm_parser.add_argument("--workers", type=int, default=4)
+    warm_parser.add_argument(
+        "--ttl",
+        type=float,
+        default=0,
+        help="Skip summaries validated within this many seconds.",
+    )
+
+    commands.add_parser("stats", help="Print a summary of the cache.")
+
+    # The benchmark's options are parsed by `seasnake.cache.benchmark.main`.
+    commands.add_parser(
+        "benchmark", help="Compare cache backends and codecs.", add_help=False
+    )
+
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command == "benchmark":
+        from . import benchmark
+
+        benchmark.main(rest)
+        return 0
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+
+    if args.command == "stats":
+        from . import client
+        from .store import get_store
+
+        for key, value in get_store(client.CACHE_DIR).stats().items():
+            print(f"{key}: {value}")
+        return 0
+
+    from .warm import default_token, warm
+
+    token = args.token or default_token()
+    if not token:
+        print("An access token is required.", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    report = warm(
+        token,
+        project_ids=args.projects,
+        protocols=args.protocols,
+        max_workers=args.workers,
+        cache_policy=CachePolicy(ttl=args.ttl),
+    )
+    print(report.drop(columns="error").to_string(index=False))
+    outcomes = report["outcome"].value_counts()
+    print(
+        ", ".join(f"{count} {outcome}" for outcome, count in outcomes.items()),
+        f"in {time.perf_counter() - started:.1f}s, {report['bytes'].sum()} bytes",
+    )
+    for row in report[report["outcome"] == "failed"].itertuples():
+        print(
+            f"{row.project_id} {row.protocol}.{row.method}: {row.error}",
+            file=sys.stderr,
+        )
+    return 1 if (report["outcome"] == "failed").any() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+# A filter on cached rows, in the `[(column, op, value), ...]` form used by
+# `pandas.read_parquet`, e.g. `[("site_name", "==", "Reef A")]`.
+Filters = Sequence[Tuple[str, str, Any]]
+
+# The schema metadata key listing the columns stored as JSON strings.
+_JSON_COLUMNS = b"seasnake.json_columns"
+
+
+class CacheBackend:
+    """
+    Reads and writes cached DataFrames in a file format.
+
+    Attributes:
+        extension (str): The file extension of cache files.
+        compression (str): The codec compressing cache files, or "none".
+        compression_level (Optional[int]): The codec's compression level, or None
+            for the codec's default.
+    """
+
+    extension = ""
+    compression = "none"
+    compression_level: Optional[int] = None
+
+    def write(self, path: Path, df: DataFrame):
+        """
+        Writes a DataFrame to a cache file.
+
+        Args:
+            path (Path): The cache file.
+            df (DataFrame): The DataFrame to cache.
+        """
+
+        raise NotImplementedError
+
+    def read(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> DataFrame:
+        """
+        Reads a DataFrame from a cache file.
+
+        Args:
+            path (Path): The cache file.
+            columns (Optional[List[str]]): The columns to read. Defaults to all columns.
+            filters (Optional[Filters]): Only rows matching every filter are returned.
+                Defaults to None.
+
+        Returns:
+            DataFrame
+        """
+
+        raise NotImplementedError
+
+
+class PickleBackend(CacheBackend):
+    """
+    Caches DataFrames as compressed pickles.
+
+    Every read decompresses and unpickles the whole frame, and pickles can't be read
+    by other pandas versions, so this backend is only the fallback when `pyarrow`
+    isn't installed. Faster codecs trade disk space for read speed; "zstd" needs
+    the `zstandard` package and "lz4" the `lz4` package.
+
+    Args:
+        compression (Optional[str]): The codec, one of `CODECS`. Defaults to "gzip".
+        compression_level (Optional[int]): The codec's compression level, or None
+            for the codec's default. Defaults to 1 for gzip.
+
+    Attributes:
+        CODECS (Tuple[str, ...]): The supported codecs.
+    """
+
+    CODECS = ("none", "gzip", "bz2", "xz", "zstd", "lz4")
+    extension = ".tar.gz"
+
+    def __init__(
+        self,
+        compression: Optional[str] = "gzip",
+        compression_level: Optional[int] = None,
+    ):
+        compression = compression or "none"
+        _require_codec(compression, self.CODECS)
+        if compression in _CODEC_PACKAGES:
+            package = _CODEC_PACKAGES[compression]
+            if importlib.util.find_spec(package) is None:
+                raise ImportError(
+                    f"{package} is required for {compression} compression, "
+                    f"install it with `pip install {package}`"
+                )
+        if compression == "gzip" and compression_level is None:
+            compression_level = 1
+        self.compression = compression
+        self.compression_level = compression_level
+        # Gzip files keep the extension used by earlier versions.
+        if compression != "gzip":
+            self.extension = f".pkl{_CODEC_SUFFIXES.get(compression, '')}"
+
+    def _pandas_compression(self, write: bool = False) -> Optional[Dict[str, Any]]:
+        if self.compression == "none":
+            return None
+        options: Dict[str, Any] = {"method": self.compression}
+        if write and self.compression == "gzip":
+            # A fixed timestamp keeps files with the same frame identical.
+            options["mtime"] = 1
+        if write and self.compression_level is not None:
+            options[_PICKLE_LEVEL_OPTIONS[self.compression]] = self.compression_level
+        return options
+
+    def write(self, path: Path, df: DataFrame):
+        if self.compression == "lz4":
+            import lz4.frame
+
+            with lz4.frame.open(
+                path, "wb", compression_level=self.compression_level or 0
+            ) as f:
+                df.to_pickle(f, compression=None)
+        else:
+            df.to_pickle(path, compression=self._pandas_compression(write=True))
+
+    def read(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> DataFrame:
+        if self.compression == "lz4":
+            import lz4.frame
+
+            with lz4.frame.open(path, "rb") as f:
+                df = pd.read_pickle(f, compression=None)
+        else:
+            df = pd.read_pickle(path, compression=self._pandas_compression())
+        if filters:
+            df = df[_filter_mask(df, filters)].reset_index(drop=True)
+        return df if columns is None else df[[c for c in columns if c in df]]
+
+
+class ParquetBackend(CacheBackend):
+    """
+    Caches DataFrames as Parquet files.
+
+    Columns are stored separately, so reading a few columns only decodes those
+    columns, and rows are split into row groups whose statistics let `filters`
+    skip groups without decoding them. Requires `pyarrow`.
+
+    Args:
+        compression (Optional[str]): The codec, one of `CODECS`. Defaults to "zstd".
+        compression_level (Optional[int]): The codec's compression level, or None
+            for the codec's default. Defaults to None.
+        row_group_size (int): The number of rows per row group. Defaults to 50000.
+        memory_map (bool): Whether to memory-map cache files when reading them.
+            Defaults to True.
+
+    Attributes:
+        CODECS (Tuple[str, ...]): The supported codecs.
+    """
+
+    CODECS = ("none", "snappy", "gzip", "brotli", "lz4", "zstd")
+    extension = ".parquet"
+
+    def __init__(
+        self,
+        compression: Optional[str] = "zstd",
+        compression_level: Optional[int] = None,
+        row_group_size: int = 50_000,
+        memory_map: bool = True,
+    ):
+        _require_pyarrow()
+        self.compression = compression or "none"
+        _require_codec(self.compression, self.CODECS, arrow=True)
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        self.memory_map = memory_map
+
+    def write(self, path: Path, df: DataFrame):
+        table = _to_table(df)
+        pq.write_table(
+            table,
+            path,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            row_group_size=self.row_group_size,
+        )
+
+    def read(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> DataFrame:
+        if columns is not None:
+            names = pq.read_schema(path, memory_map=self.memory_map).names
+            columns = [c for c in columns if c in names]
+        table = pq.read_table(
+            path,
+            columns=columns,
+            filters=list(filters) if filters else None,
+            memory_map=self.memory_map,
+        )
+        return _from_table(table)
+
+
+class ArrowBackend(CacheBackend):
+    """
+    Caches DataFrames as Arrow IPC (Feather v2) files.
+
+    Uncompressed files are memory-mapped, so reads are nearly free and only the
+    requested columns are paged in from disk. Requires `pyarrow`.
+
+    Args:
+        compression (Optional[str]): The IPC buffer codec, one of `CODECS`.
+            Compressed buffers must be decompressed into memory when read.
+            Defaults to None.
+        compression_level (Optional[int]): The codec's compression level, or None
+            for the codec's default. Defaults to None.
+        memory_map (bool): Whether to memory-map cache files when reading them.
+            Defaults to True.
+
+    Attributes:
+        CODECS (Tuple[str, ...]): The supported codecs.
+    """
+
+    CODECS = ("none", "lz4", "zstd")
+    extension = ".arrow"
+
+    def __init__(
+        self,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        memory_map: bool = True,
+    ):
+        _require_pyarrow()
+        self.compression = compression or "none"
+        _require_codec(self.compression, self.CODECS, arrow=True)
+        self.compression_level = compression_level
+        self.memory_map = memory_map
+
+    def write(self, path: Path, df: DataFrame):
+        table = _to_table(df)
+        feather.write_feather(
+            table,
+            path,
+            compression=(
+                "uncompressed" if self.compression == "none" else self.compression
+            ),
+            compression_level=self.compression_level,
+        )
+
+    def read(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> DataFrame:
+        table = feather.read_table(path, memory_map=self.memory_map)
+        if filters:
+            table = table.filter(pq.filters_to_expression(list(filters)))
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        return _from_table(table)
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for columnar caching, "
+            "install it with `pip install py-seasnake[parquet]`"
+        )
+
+
+# The file suffixes of pickles per codec, and the packages some codecs need.
+_CODEC_SUFFIXES = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "xz": ".xz",
+    "zstd": ".zst",
+    "lz4": ".lz4",
+}
+_CODEC_PACKAGES = {"zstd": "zstandard", "lz4": "lz4"}
+# The name of the compression level option in pandas' `compression` argument.
+_PICKLE_LEVEL_OPTIONS = {
+    "gzip": "compresslevel",
+    "bz2": "compresslevel",
+    "xz": "preset",
+    "zstd": "level",
+}
+
+
+def _require_codec(compression: str, codecs: Sequence[str], arrow: bool = False):
+    if compression not in codecs:
+        raise ValueError(
+            f"Unsupported compression: {compression}, use one of {', '.join(codecs)}"
+        )
+    if arrow and compression != "none" and not pa.Codec.is_available(compression):
+        raise ValueError(f"pyarrow was built without {compression} compression")
+
+
+def _is_nested(value: Any) -> bool:
+    return isinstance(value, (dict, list))
+
+
+def _to_table(df: DataFrame) -> "pa.Table":
+    # Columns holding dicts or lists, e.g. `protocols` of sample events, are stored
+    # as JSON strings so they're read back as the same Python objects rather than
+    # Arrow structs and NumPy arrays.
+    json_columns = [
+        column
+        for column in df.columns
+        if df[column].dtype == object and df[column].map(_is_nested).any()
+    ]
+    if json_columns:
+        df = df.copy(deep=False)
+        for column in json_columns:
+            df[column] = df[column].map(
+                lambda value: None if value is None else json.dumps(value)
+            )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if not json_columns:
+        return table
+    metadata = dict(table.schema.metadata or {})
+    metadata[_JSON_COLUMNS] = json.dumps(json_columns).encode("utf-8")
+    return table.replace_schema_metadata(metadata)
+
+
+def _from_table(table: "pa.Table") -> DataFrame:
+    metadata = table.schema.metadata or {}
+    df = table.to_pandas()
+    for column in json.loads(metadata.get(_JSON_COLUMNS, b"[]")):
+        if column in df.columns:
+            df[column] = (
+                df[column]
+                .map(
+                    lambda value: json.loads(value) if isinstance(value, str) else None
+                )
+                .astype(object)
+            )
+    return df
+
+
+_OPERATORS = {
+    "==": "__eq__",
+    "=": "__eq__",
+    "!=": "__ne__",
+    "<": "__lt__",
+    "<=": "__le__",
+    ">": "__gt__",
+    ">=": "__ge__",
+}
+
+
+def _filter_mask(df: DataFrame, filters: Filters) -> pd.Series:
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if op == "in":
+            mask &= df[column].isin(value)
+        elif op == "not in":
+            mask &= ~df[column].isin(value)
+        else:
+            mask &= getattr(df[column], _OPERATORS[op])(value)
+    return mask
+
+
+def default_backend() -> CacheBackend:
+    """
+    Returns the cache backend used when none is given.
+
+    Returns:
+        CacheBackend: A `ParquetBackend` when `pyarrow` is installed, otherwise a
+            `PickleBackend`.
+    """
+
+    return PickleBackend() if pa is None else ParquetBackend()
@@ -0,0 +1,182 @@
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from .backends import ArrowBackend, CacheBackend, ParquetBackend, PickleBackend
+
+BACKENDS = (PickleBackend, ParquetBackend, ArrowBackend)
+
+
+def synthetic_observations(num_rows: int = 100_000, seed: int = 0) -> DataFrame:
+    """
+    Returns a DataFrame shaped like a benthic PIT observations summary: repeated
+    site, management and benthic attribute names, float32 coordinates, dates,
+    counts and free-text notes.
+
+    Args:
+        num_rows (int): The number of rows. Defaults to 100000.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        DataFrame
+    """
+
+    rng = np.random.default_rng(seed)
+
+    def names(prefix: str, count: int):
+        categories = pd.Index([f"{prefix} {i}" for i in range(count)])
+        return pd.Categorical.from_codes(
+            rng.integers(0, count, num_rows), categories=categories
+        )
+
+    sample_dates = pd.Timestamp("2018-01-01") + pd.to_timedelta(
+        rng.integers(0, 5 * 365, num_rows), unit="D"
+    )
+    created_on = pd.Timestamp("2023-01-01", tz="UTC") + pd.to_timedelta(
+        rng.integers(0, 365 * 24 * 3600, num_rows), unit="s"
+    )
+    notes = [
+        f"Transect note {i}" if has_note else None
+        for i, has_note in enumerate(rng.random(num_rows) < 0.2)
+    ]
+    return DataFrame(
+        {
+            "id": [f"{i:08x}-0000-4000-8000-{i:012x}" for i in range(num_rows)],
+            "project_name": names("Project", 20),
+            "country_name": names("Country", 10),
+            "site_name": names("Site", 500),
+            "management_name": names("Management", 100),
+            "latitude": rng.uniform(-30, 30, num_rows).astype("float32"),
+            "longitude": rng.uniform(-180, 180, num_rows).astype("float32"),
+            "sample_date": sample_dates,
+            "transect_number": rng.integers(1, 6, num_rows),
+            "interval": rng.integers(1, 100, num_rows) * 0.5,
+            "benthic_category": names("Benthic category", 12),
+            "benthic_attribute": names("Benthic attribute", 250),
+            "growth_form": names("Growth form", 8),
+            "observers": names("Observer", 200),
+            "notes": notes,
+            "created_on": created_on,
+            "updated_on": created_on,
+        }
+    )
+
+
+def default_backends() -> Iterator[CacheBackend]:
+    """
+    Yields every backend with each codec available in this environment, at the
+    codec's default compression level.
+
+    Yields:
+        CacheBackend
+    """
+
+    for backend in BACKENDS:
+        for codec in backend.CODECS:
+            try:
+                yield backend(compression=codec)
+            except (ImportError, ValueError):
+                continue
+
+
+def benchmark(
+    df: Optional[DataFrame] = None,
+    backends: Optional[Sequence[CacheBackend]] = None,
+    repeat: int = 3,
+    directory: Union[None, str, Path] = None,
+) -> DataFrame:
+    """
+    Writes and reads a DataFrame with each backend and reports the best time of
+    `repeat` runs.
+
+    Args:
+        df (Optional[DataFrame]): The DataFrame to cache. Defaults to
+            `synthetic_observations()`.
+        backends (Optional[Sequence[CacheBackend]]): The backends to compare.
+            Defaults to `default_backends()`.
+        repeat (int): The number of times each file is written and read.
+            Defaults to 3.
+        directory (Union[None, str, Path]): Where the files are written, e.g. the
+            cache volume. Defaults to a temporary directory.
+
+    Returns:
+        DataFrame: One row per backend with its `backend`, `compression`,
+            `compression_level`, file size in `bytes`, compression `ratio` against
+            the frame's memory use, and `write_mb_s` and `read_mb_s` throughput in
+            MB of in-memory frame per second, sorted by read throughput.
+    """
+
+    df = synthetic_observations() if df is None else df
+    backends = list(default_backends()) if backends is None else backends
+    frame_bytes = int(df.memory_usage(index=True, deep=True).sum())
+    rows: List[dict] = []
+    with tempfile.TemporaryDirectory(dir=directory) as tmp_dir:
+        for i, backend in enumerate(backends):
+            path = Path(tmp_dir, f"frame-{i}{backend.extension}")
+            write_time = _best_time(lambda: backend.write(path, df), repeat)
+            read_time = _best_time(lambda: backend.read(path), repeat)
+            size = path.stat().st_size
+            rows.append(
+                {
+                    "backend": type(backend).__name__,
+                    "compression": backend.compression,
+                    "compression_level": backend.compression_level,
+                    "bytes": size,
+                    "ratio": frame_bytes / size if size else float("nan"),
+                    "write_mb_s": frame_bytes / 1e6 / write_time,
+                    "read_mb_s": frame_bytes / 1e6 / read_time,
+                }
+            )
+    results = DataFrame(rows)
+    results["compression_level"] = results["compression_level"].astype("Int64")
+    return results.sort_values("read_mb_s", ascending=False).reset_index(drop=True)
+
+
+def _best_time(run, repeat: int) -> float:
+    times = []
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return max(min(times), 1e-9)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    Prints the results of `benchmark`. Run it from the command line, preferably
+    writing to the volume the cache lives on:
+
+    ```
+    python -m seasnake.cache.benchmark --rows 500000 --repeat 3 --directory .cache
+    ```
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments. Defaults to
+            `sys.argv`.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m seasnake.cache.benchmark",
+        description="Compare cache backends and codecs on synthetic observations.",
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--directory", help="Where files are written. Defaults to a temporary one."
+    )
+    args = parser.parse_args(argv)
+
+    results = benchmark(
+        synthetic_observations(args.rows), repeat=args.repeat, directory=args.directory
+    )
+    print(results.to_string(index=False, float_format="{:.1f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,941 @@
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+import jwt
+import pandas as pd
+import requests
+from pandas import DataFrame
+
+from ..schemas import get_delta_param, get_fields_param
+from .backends import CacheBackend, Filters, PickleBackend
+from .locks import async_file_lock, file_lock
+from .memory import MemoryCache
+from .policy import CachePolicy
+from .store import CacheStore, get_store
+
+CACHE_DIR = Path(os.getcwd(), ".cache")
+
+# Background refreshes of cache entries, keyed by cache file, so each entry is
+# only refreshed once at a time.
+_REVALIDATIONS: Dict[str, Future] = {}
+_REVALIDATIONS_LOCK = threading.Lock()
+_REVALIDATION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+# The cache events of the current thread, see `record_cache_events`.
+_EVENTS = threading.local()
+
+
+@contextmanager
+def record_cache_events() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collects how the cached DataFrames read in the current thread were served.
+
+    Each event holds the entry's `url`, its `outcome`, one of "fetched" (downloaded
+    or refreshed from the API), "revalidated" (checked with the API and found up to
+    date, or served while refreshed in the background) or "skipped" (served without
+    contacting the API), and the entry's size in `bytes`.
+
+    Yields:
+        List[Dict[str, Any]]: The events, appended as entries are read.
+
+    Examples:
+    ```
+    from seasnake.cache.client import record_cache_events
+
+    with record_cache_events() as events:
+        benthic_pit.observations(project_id)
+    print(events)
+    ```
+    """
+
+    events: List[Dict[str, Any]] = []
+    previous = getattr(_EVENTS, "events", None)
+    _EVENTS.events = events
+    try:
+        yield events
+    finally:
+        _EVENTS.events = previous
+
+
+def _record_event(url: str, outcome: str, cache_file: Path):
+    events = getattr(_EVENTS, "events", None)
+    if events is None:
+        return
+    size = cache_file.stat().st_size if cache_file.exists() else 0
+    events.append({"url": url, "outcome": outcome, "bytes": size})
+
+
+def _normalize_created_on(value: Any) -> Optional[str]:
+    # Cached frames hold parsed UTC timestamps while the API returns ISO strings,
+    # so both sides are compared in the same representation.
+    if value is None or value == "" or pd.isna(value):
+        return None
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return timestamp.tz_convert("UTC").isoformat()
+
+
+def _high_water_mark(df: DataFrame) -> Optional[str]:
+    # The newest time any cached record was created or updated.
+    marks = [
+        pd.to_datetime(df[column], utc=True, errors="coerce").max()
+        for column in ("updated_on", "created_on")
+        if column in df.columns
+    ]
+    marks = [mark for mark in marks if not pd.isna(mark)]
+    return _normalize_created_on(max(marks)) if marks else None
+
+
+def _record_hash(record: Optional[Dict[str, Any]]) -> Optional[str]:
+    # Identifies the first record of endpoints whose records have no `created_on`.
+    if record is None:
+        return None
+    content = json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _merge_delta(cached: DataFrame, delta: DataFrame) -> DataFrame:
+    # Changed records replace their cached versions and new records are added.
+    if delta.empty:
+        return cached
+    kept = cached[~cached["id"].isin(delta["id"])]
+    df = pd.concat([delta, kept], ignore_index=True)
+    df = df[[*cached.columns, *(c for c in df.columns if c not in cached.columns)]]
+    for column in cached.columns:
+        if isinstance(cached[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _replace_file(path: Path, write: Callable[[Path], None]):
+    # Writes to a temporary file next to `path` and renames it over `path`, so
+    # readers see either the old or the new file but never a partial one.
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _file_version(path: Path) -> Tuple[int, int, int]:
+    # Cache files are replaced whenever they're rewritten, so their modification
+    # time, size and inode identify the version of the cached data.
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _revalidation_executor() -> ThreadPoolExecutor:
+    global _REVALIDATION_EXECUTOR
+    with _REVALIDATIONS_LOCK:
+        if _REVALIDATION_EXECUTOR is None:
+            _REVALIDATION_EXECUTOR = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="seasnake-revalidate"
+            )
+        return _REVALIDATION_EXECUTOR
+
+
+class CacheMixin:
+    """
+    Caches DataFrames downloaded from API endpoints on disk, see `fetch_cached`.
+
+    Mixed into `seasnake.base.MermaidBase`, which sets the `cache_backend`,
+    `cache_policy`, `cache_store`, `on_refresh` and `memory_cache` attributes.
+    """
+
+    token: Optional[str]
+    cache_backend: CacheBackend
+    cache_store: Optional[CacheStore]
+    cache_policy: CachePolicy
+    on_refresh: Optional[Callable[[str, DataFrame], None]]
+    memory_cache: MemoryCache
+
+    if TYPE_CHECKING:
+        get_full_url: Callable[[str], str]
+        data_frame_from_url: Callable[..., DataFrame]
+        data_frame_from_url_async: Callable[..., Any]
+        _send: Callable[..., requests.Response]
+        _select_columns: Callable[..., DataFrame]
+
+    def fetch_cached(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+        requires_auth: bool = True,
+        per_user: bool = False,
+    ) -> DataFrame:
+        """
+        Returns a DataFrame from an API endpoint, read from the cache when it's up
+        to date and downloaded and cached otherwise.
+
+        The cache entry is identified by the URL, query parameters, columns and
+        renamed columns. It's checked for changes by requesting the endpoint's first
+        record, according to the client's `cache_policy`: the entry is outdated when
+        the total number of records, or the first record's `created_on` or contents,
+        changed. Endpoints with a delta parameter, see
+        `seasnake.schemas.register_delta_param`, are refreshed incrementally.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to all columns.
+            rename_columns (Optional[Dict[str, str]]): A dictionary of old and new
+                column names. Defaults to None.
+            requires_auth (bool): Whether authorization is required to access the API
+                endpoint. Defaults to True.
+            per_user (bool): Whether the endpoint returns different records to each
+                user, in which case every user of the token gets their own cache
+                entry. Defaults to False.
+
+        Returns:
+            DataFrame
+        """
+
+        request = self._cache_request(
+            query_params, rename_columns, requires_auth, per_user
+        )
+        cache_params = self._cache_params(columns, request)
+        started = time.time()
+        df = self._read_while_revalidating(url, columns, request)
+        full_url = self.get_full_url(url)
+        full_params = self._cache_params(None, request)
+        state = None
+        if (
+            df is None
+            and columns
+            and self.get_cache_file_paths(full_url, full_params)[0].exists()
+        ):
+            # Project the columns out of the full cached frame.
+            df, state = self._read_cache(
+                url, params=full_params, columns=self._cached_columns(columns)
+            )
+        if df is None:
+            # Entries of the same request share the API's state.
+            df, entry_state = self._read_cache(url, params=cache_params)
+            state = entry_state or state
+        if df is None:
+            df = self._download_cached(
+                url,
+                cache_params,
+                self._cached_columns(columns),
+                started,
+                request,
+                state,
+            )
+        return self._select_columns(df, columns)
+
+    async def fetch_cached_async(
+        self,
+        url: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+        requires_auth: bool = True,
+        per_user: bool = False,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> DataFrame:
+        """
+        Async version of `fetch_cached`. Cache files are read and written in the
+        event loop's default executor.
+
+        Args:
+            url (str): The URL for the API endpoint.
+            query_params (Optional[Dict[str, Any]]): The query parameters to include
+                in the request. Defaults to None.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to all columns.
+            rename_columns (Optional[Dict[str, str]]): A dictionary of old and new
+                column names. Defaults to None.
+            requires_auth (bool): Whether authorization is required to access the API
+                endpoint. Defaults to True.
+            per_user (bool): Whether every user of the token gets their own cache
+                entry, see `fetch_cached`. Defaults to False.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+
+        Returns:
+            DataFrame
+        """
+
+        loop = asyncio.get_running_loop()
+        request = self._cache_request(
+            query_params, rename_columns, requires_auth, per_user
+        )
+        cache_params = self._cache_params(columns, request)
+        started = time.time()
+        df = await loop.run_in_executor(
+            None,
+            functools.partial(self._read_while_revalidating, url, columns, request),
+        )
+        full_url = self.get_full_url(url)
+        full_params = self._cache_params(None, request)
+        state = None
+        if (
+            df is None
+            and columns
+            and self.get_cache_file_paths(full_url, full_params)[0].exists()
+        ):
+            df, state = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self._read_cache,
+                    url,
+                    params=full_params,
+                    columns=self._cached_columns(columns),
+                ),
+            )
+        if df is None:
+            df, entry_state = await loop.run_in_executor(
+                None, functools.partial(self._read_cache, url, params=cache_params)
+            )
+            state = entry_state or state
+        if df is None:
+            df = await self._download_cached_async(
+                url,
+                cache_params,
+                self._cached_columns(columns),
+                started,
+                request,
+                semaphore,
+                state,
+            )
+        return self._select_columns(df, columns)
+
+    def _cache_request(
+        self,
+        query_params: Optional[Dict[str, Any]] = None,
+        rename_columns: Optional[Dict[str, str]] = None,
+        requires_auth: bool = True,
+        per_user: bool = False,
+    ) -> Dict[str, Any]:
+        # How a cache entry's data is requested, kept in its index so the entry can
+        # be checked and refreshed without the caller. Defaults are left out.
+        request: Dict[str, Any] = {}
+        if query_params:
+            request["query_params"] = {k: str(v) for k, v in query_params.items()}
+        if rename_columns:
+            request["rename_columns"] = dict(rename_columns)
+        if not requires_auth:
+            request["requires_auth"] = False
+        if per_user:
+            request["user"] = self._token_user()
+        return request
+
+    def _token_user(self) -> str:
+        # The user the token was issued to, or a digest of the token when it can't
+        # be decoded.
+        try:
+            subject = jwt.decode(self.token or "", options={"verify_signature": False})
+        except jwt.PyJWTError:
+            subject = {}
+        user = subject.get("sub") if isinstance(subject, dict) else None
+        return user or hashlib.sha256((self.token or "").encode("utf-8")).hexdigest()
+
+    def _request_kwargs(self, request: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        request = request or {}
+        return {
+            "query_params": dict(request.get("query_params") or {}),
+            "rename_columns": request.get("rename_columns"),
+            "requires_auth": request.get("requires_auth", True),
+        }
+
+    def _download_cached(
+        self,
+        url: str,
+        cache_params: Dict[str, Any],
+        columns: Optional[List[str]] = None,
+        since: Optional[float] = None,
+        request: Optional[Dict[str, Any]] = None,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> DataFrame:
+        # Only one process or thread downloads an entry at a time; the others wait
+        # and then read what it cached.
+        since = time.time() if since is None else since
+        outcome = "skipped"
+        with file_lock(self._lock_file(url, cache_params, "fetch")):
+            df = self._read_cached_since(url, cache_params, since)
+            if df is None:
+                outcome = "fetched"
+                df = self.update_cache(
+                    url, params=cache_params, columns=columns, state=state
+                )
+            if df is None:
+                df = self.data_frame_from_url(
+                    url, columns=columns, **self._request_kwargs(request)
+                )
+                df = self.to_cache(url, df, params=cache_params, request=request)
+        url = self.get_full_url(url)
+        _record_event(url, outcome, self.get_cache_file_paths(url, cache_params)[0])
+        return df
+
+    async def _download_cached_async(
+        self,
+        url: str,
+        cache_params: Dict[str, Any],
+        columns: Optional[List[str]],
+        since: float,
+        request: Optional[Dict[str, Any]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> DataFrame:
+        # Waiting for the lock doesn't use the default executor, whose threads the
+        # coroutine holding the lock needs to download the entry.
+        loop = asyncio.get_running_loop()
+        async with async_file_lock(self._lock_file(url, cache_params, "fetch")):
+            df = await loop.run_in_executor(
+                None,
+                functools.partial(self._read_cached_since, url, cache_params, since),
+            )
+            if df is None:
+                df = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.update_cache,
+                        url,
+                        params=cache_params,
+                        columns=columns,
+                        state=state,
+                    ),
+                )
+            if df is None:
+                df = await self.data_frame_from_url_async(
+                    url,
+                    columns=columns,
+                    semaphore=semaphore,
+                    **self._request_kwargs(request),
+                )
+                df = await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.to_cache, url, df, params=cache_params, request=request
+                    ),
+                )
+        return df
+
+    def _read_cached_since(
+        self, url: str, params: Dict[str, Any], since: float
+    ) -> Optional[DataFrame]:
+        # Reads an entry cached or validated by someone else since `since`.
+        cache_file, cache_idx_file = self.get_cache_file_paths(
+            self.get_full_url(url), params
+        )
+        if not (cache_file.exists() and cache_idx_file.exists()):
+            return None
+        if self._read_cache_meta(cache_idx_file).get("validated_at", 0) < since:
+            return None
+        return self._read_cache_file(cache_file)
+
+    def _lock_file(self, url: str, params: Optional[Dict[str, Any]], kind: str) -> Path:
+        return self.cache.lock_file(
+            self._cache_key(self.get_full_url(url), params), kind
+        )
+
+    def _read_while_revalidating(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Optional[DataFrame]:
+        # Returns a cached frame that isn't fresh but may be served while it is
+        # refreshed in the background, see `CachePolicy.stale_while_revalidate`.
+        if not self.cache_policy.stale_while_revalidate:
+            return None
+
+        url = self.get_full_url(url)
+        # The entry's parameters, the columns read from it and the columns it holds.
+        entries: List[
+            Tuple[Dict[str, Any], Optional[List[str]], Optional[List[str]]]
+        ] = [
+            (
+                self._cache_params(columns, request),
+                None,
+                self._cached_columns(columns),
+            )
+        ]
+        if columns:
+            full_params = self._cache_params(None, request)
+            entries.insert(0, (full_params, self._cached_columns(columns), None))
+        for params, read_columns, entry_columns in entries:
+            cache_file, cache_idx_file = self.get_cache_file_paths(url, params)
+            if not (cache_file.exists() and cache_idx_file.exists()):
+                continue
+            meta = self._read_cache_meta(cache_idx_file)
+            if self.cache_policy.is_fresh(meta):
+                return None
+            if not self.cache_policy.revalidates_in_background(meta):
+                continue
+            df = self._read_cache_file(cache_file, columns=read_columns)
+            self.cache.record_hit(self._cache_key(url, params))
+            self.revalidate(url, params=params, columns=entry_columns)
+            _record_event(url, "revalidated", cache_file)
+            return df
+        return None
+
+    def revalidate(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Future:
+        """
+        Refreshes a cache entry on a background thread.
+
+        Only one refresh of an entry runs at a time; while it runs, further calls
+        return the running refresh. The new entry replaces the old one atomically
+        and `on_refresh` is called if the data changed.
+
+        Args:
+            url (str): The URL associated with the cached DataFrame.
+            params (Optional[Dict[str, Any]]): Parameters that identify a variant of
+                the URL's data, see `get_cache_file_paths`. Defaults to None.
+            columns (Optional[List[str]]): The columns of the cached DataFrame.
+                Defaults to all columns.
+
+        Returns:
+            Future: Resolves to the refreshed DataFrame, or None if the cached one
+                was still up to date.
+        """
+
+        url = self.get_full_url(url)
+        key = str(self.get_cache_file_paths(url, params)[0])
+        executor = _revalidation_executor()
+        with _REVALIDATIONS_LOCK:
+            future = _REVALIDATIONS.get(key)
+            if future is not None:
+                return future
+            future = executor.submit(self._revalidate, url, params or {}, columns)
+            _REVALIDATIONS[key] = future
+        future.add_done_callback(functools.partial(self._revalidated, url, key))
+        return future
+
+    def _revalidate(
+        self, url: str, params: Dict[str, Any], columns: Optional[List[str]]
+    ) -> Optional[DataFrame]:
+        cache_file, cache_idx_file = self.get_cache_file_paths(url, params)
+        request = None
+        state = None
+        if cache_idx_file.exists():
+            meta = self._read_cache_meta(cache_idx_file)
+            valid, state = self._validate_cache(url, cache_idx_file, meta, params)
+            if valid:
+                return None
+            request = meta.get("request")
+        df = self._download_cached(url, params, columns, request=request, state=state)
+        if self.on_refresh is not None:
+            self.on_refresh(url, df)
+        return df
+
+    def _revalidated(self, url: str, key: str, future: Future):
+        with _REVALIDATIONS_LOCK:
+            if _REVALIDATIONS.get(key) is future:
+                del _REVALIDATIONS[key]
+        if not future.cancelled() and future.exception() is not None:
+            warnings.warn(
+                f"Unable to refresh the cache for {url}: {future.exception()}"
+            )
+
+    def _cache_params(
+        self,
+        columns: Optional[List[str]] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        request = request or {}
+        params: Dict[str, Any] = dict(request.get("query_params") or {})
+        if columns:
+            params["columns"] = ",".join(columns)
+        if request.get("rename_columns"):
+            params["rename"] = ",".join(
+                f"{old}:{new}" for old, new in sorted(request["rename_columns"].items())
+            )
+        if not request.get("requires_auth", True):
+            params["auth"] = "0"
+        if request.get("user"):
+            params["user"] = request["user"]
+        return params
+
+    def _cached_columns(
+        self, columns: Optional[List[str]] = None
+    ) -> Optional[List[str]]:
+        # The fields used to validate and incrementally refresh cached frames are
+        # always kept in projected frames.
+        if not columns:
+            return columns
+        return [
+            *columns,
+            *(c for c in ("id", "created_on", "updated_on") if c not in columns),
+        ]
+
+    def _get_cache_state(
+        self,
+        url: str,
+        meta: Optional[Dict[str, Any]] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        # Requests the first record, conditionally on the cache entry's last check.
+        kwargs = self._request_kwargs(request)
+        headers = {}
+        if kwargs["requires_auth"]:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if meta is not None:
+            headers |= self.cache_policy.conditional_headers(meta)
+        resp = self._send(
+            url, params={**kwargs["query_params"], "limit": 1}, headers=headers
+        )
+        if resp.status_code == 304:
+            return {"not_modified": True}
+        if resp.status_code != 200:
+            raise Exception(f"Error fetching data: {resp.text}")
+
+        response = resp.json()
+        record = (response.get("results") or [None])[0]
+        created_on = None if record is None else record.get("created_on")
+        return {
+            "created_on": _normalize_created_on(created_on),
+            "count": response.get("count"),
+            "first": _record_hash(record),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+
+    def _read_cache_meta(self, cache_idx_file: Path) -> Dict[str, Any]:
+        with open(cache_idx_file, "r") as f:
+            content = f.read()
+        try:
+            meta = json.loads(content)
+        except ValueError:
+            meta = None
+        if not isinstance(meta, dict):
+            # Index files written by earlier versions only hold `created_on`.
+            meta = {"created_on": content}
+        meta["created_on"] = _normalize_created_on(meta.get("created_on"))
+        return meta
+
+    def _write_cache_meta(self, cache_idx_file: Path, meta: Dict[str, Any]):
+        def write(path: Path):
+            with open(path, "w") as f:
+                json.dump(meta, f)
+
+        _replace_file(cache_idx_file, write)
+
+    def get_cache_file_paths(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Path, Path]:
+        """
+        Generates cache file paths for the given URL.
+
+        Args:
+            url (str): The URL to generate cache file paths for.
+            params (Optional[Dict[str, Any]]): Parameters that identify a variant of
+                the URL's data, such as the selected columns. Defaults to None.
+
+        Returns:
+            Tuple[Path, Path]: A tuple containing the paths for the cache file and cache index file.
+        """
+        cache_key = self._cache_key(url, params)
+        directory = self.cache.directory
+        cache_file = Path(directory, f"{cache_key}{self.cache_backend.extension}")
+        cache_index_file = Path(directory, f"{cache_key}.idx")
+        return cache_file, cache_index_file
+
+    def to_cache(
+        self,
+        url: str,
+        df: DataFrame,
+        params: Optional[Dict[str, Any]] = None,
+        created_on: Optional[str] = None,
+        request: Optional[Dict[str, Any]] = None,
+    ) -> DataFrame:
+        """
+        Caches the given DataFrame to a file using the client's `cache_backend`.
+
+        Empty DataFrames, and DataFrames the backend can't store, e.g. columns mixing
+        numbers and strings in Parquet, are returned without being cached.
+
+        Args:
+            url (str): The URL associated with the DataFrame.
+            df (DataFrame): The DataFrame to cache.
+            params (Optional[Dict[str, Any]]): Parameters that identify a variant of
+                the URL's data, see `get_cache_file_paths`. Defaults to None.
+            created_on (Optional[str]): The `created_on` of the first record returned
+                by the API, used to validate the cache. Defaults to the first row's,
+                if the DataFrame has a `created_on` column.
+            request (Optional[Dict[str, Any]]): The query parameters, renamed columns
+                and authorization the data was requested with, used to check the
+                entry for changes. Defaults to None.
+
+        Returns:
+            DataFrame
+        """
+
+        url = self.get_full_url(url)
+
+        if df is None or df.empty:
+            return df
+
+        if self.cache.directory.exists() is False:
+            os.makedirs(self.cache.directory)
+
+        if created_on is None and "created_on" in df.columns:
+            created_on = df.iloc[0]["created_on"]
+        meta: Dict[str, Any] = {
+            "created_on": _normalize_created_on(created_on),
+            "count": len(df),
+            "high_water": _high_water_mark(df),
+            "validated_at": time.time(),
+        }
+        if request:
+            meta["request"] = request
+        cache_file, cache_idx_file = self.get_cache_file_paths(url, params)
+        # The data file is replaced before the index, and both under a lock, so
+        # readers never pair an index with a data file it doesn't describe.
+        with file_lock(self._lock_file(url, params, "write")):
+            try:
+                _replace_file(
+                    cache_file, functools.partial(self.cache_backend.write, df=df)
+                )
+            except (ValueError, TypeError, NotImplementedError) as e:
+                warnings.warn(f"Unable to cache {url}: {e}")
+                return df
+            self._write_cache_meta(cache_idx_file, meta)
+            version = _file_version(cache_file)
+
+        self.cache.record_write(
+            self._cache_key(url, params), url, [cache_file, cache_idx_file]
+        )
+
+        return self.memory_cache.put((str(cache_file), None, None), df, token=version)
+
+    def read_cache(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> Optional[DataFrame]:
+        """
+        Reads the cached DataFrame for the given URL, if it exists and is up to date.
+
+        Whether the API is asked for changes first depends on the client's
+        `cache_policy`. No request is sent when nothing is cached.
+
+        Args:
+            url (str): The URL associated with the cached DataFrame.
+            params (Optional[Dict[str, Any]]): Parameters that identify a variant of
+                the URL's data, see `get_cache_file_paths`. Defaults to None.
+            columns (Optional[List[str]]): The columns to read. With a columnar
+                backend only these columns are loaded. Defaults to all columns.
+            filters (Optional[Filters]): Only rows matching every filter, e.g.
+                `[("site_name", "==", "Reef A")]`, are read. With the Parquet
+                backend, row groups that can't match are skipped. Defaults to None.
+
+        Returns:
+            Optional[DataFrame]
+        """
+
+        return self._read_cache(url, params, columns=columns, filters=filters)[0]
+
+    def _read_cache(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> Tuple[Optional[DataFrame], Optional[Dict[str, Any]]]:
+        # Also returns the API's state an outdated entry was checked against, so
+        # refreshing the entry doesn't request it again.
+        url = self.get_full_url(url)
+
+        cache_file, cache_idx_file = self.get_cache_file_paths(url, params)
+        if Path(cache_file).exists() is False or Path(cache_idx_file).exists() is False:
+            return None, None
+
+        meta = self._read_cache_meta(cache_idx_file)
+        fresh = self.cache_policy.is_fresh(meta)
+        if not fresh:
+            valid, state = self._validate_cache(url, cache_idx_file, meta, params)
+            if not valid:
+                return None, state
+        df = self._read_cache_file(cache_file, columns=columns, filters=filters)
+        self.cache.record_hit(self._cache_key(url, params))
+        _record_event(url, "skipped" if fresh else "revalidated", cache_file)
+        return df, None
+
+    def _read_cache_file(
+        self,
+        cache_file: Path,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> DataFrame:
+        return self.memory_cache.get_or_load(
+            (
+                str(cache_file),
+                None if columns is None else tuple(columns),
+                None if not filters else repr(filters),
+            ),
+            functools.partial(
+                self.cache_backend.read, cache_file, columns=columns, filters=filters
+            ),
+            token=_file_version(cache_file),
+        )
+
+    def _validate_cache(
+        self,
+        url: str,
+        cache_idx_file: Path,
+        meta: Dict[str, Any],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        # Returns whether the entry is up to date, and the API's state when it's
+        # outdated.
+        try:
+            state = self._get_cache_state(url, meta, meta.get("request"))
+        except Exception:
+            if not self.cache_policy.serves_stale(meta):
+                raise
+            warnings.warn(f"Unable to validate the cache for {url}, serving stale data")
+            return True, None
+
+        if not state.get("not_modified"):
+            if meta["created_on"] != state["created_on"]:
+                return False, state
+            # Entries record the first record's hash the first time they're checked.
+            for key in ("count", "first"):
+                if meta.get(key) not in (None, state[key]):
+                    return False, state
+            meta["first"] = state["first"]
+            meta["etag"] = state["etag"]
+            meta["last_modified"] = state["last_modified"]
+
+        with file_lock(self._lock_file(url, params, "write")):
+            current = self._read_cache_meta(cache_idx_file)
+            # Unless the entry was rewritten meanwhile, record the validation.
+            if current.get("validated_at") == meta.get("validated_at"):
+                meta["validated_at"] = time.time()
+                self._write_cache_meta(cache_idx_file, meta)
+        return True, None
+
+    def update_cache(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> Optional[DataFrame]:
+        """
+        Refreshes an outdated cached DataFrame by downloading only the records
+        created or updated since the newest cached record.
+
+        Changed records replace their cached versions and new records are added.
+        Records deleted from the API are found by downloading only the record ids,
+        which needs the endpoint to have a fields parameter, see
+        `seasnake.schemas.register_fields_param`.
+
+        Args:
+            url (str): The URL associated with the cached DataFrame.
+            params (Optional[Dict[str, Any]]): Parameters that identify a variant of
+                the URL's data, see `get_cache_file_paths`. Defaults to None.
+            columns (Optional[List[str]]): The columns of the cached DataFrame.
+                Defaults to all columns.
+            state (Optional[Dict[str, Any]]): The API's state the entry was found
+                outdated with, if it was just checked. Defaults to requesting it.
+
+        Returns:
+            Optional[DataFrame]: The refreshed DataFrame, or None if the cache can't
+                be refreshed incrementally, e.g. the endpoint has no delta or fields
+                parameter registered with `seasnake.schemas.register_delta_param` and
+                `seasnake.schemas.register_fields_param`.
+        """
+
+        url = self.get_full_url(url)
+        # Deleted records aren't in the delta, and a deletion and an addition leave
+        # the number of records unchanged, so the merged records are checked against
+        # the ids the API holds now. Without a fields parameter that would download
+        # every record, so the entry is downloaded again instead.
+        delta_param = get_delta_param(url)
+        if delta_param is None or get_fields_param(url) is None:
+            return None
+        cache_file, cache_idx_file = self.get_cache_file_paths(url, params)
+        if not (cache_file.exists() and cache_idx_file.exists()):
+            return None
+
+        meta = self._read_cache_meta(cache_idx_file)
+        high_water = meta.get("high_water")
+        cached = self.cache_backend.read(cache_file)
+        if not high_water or "id" not in cached or cached["id"].isna().any():
+            return None
+
+        request = meta.get("request")
+        if state is None or state.get("not_modified"):
+            state = self._get_cache_state(url, request=request)
+        kwargs = self._request_kwargs(request)
+        kwargs["query_params"][delta_param] = high_water
+        delta = self.data_frame_from_url(url, columns=columns, **kwargs)
+        if not delta.empty and ("id" not in delta or delta["id"].isna().any()):
+            return None
+        df = _merge_delta(cached, delta)
+
+        records = self.data_frame_from_url(
+            url, columns=["id"], **self._request_kwargs(request)
+        )
+        # Endpoints without records return a frame without columns.
+        if not records.empty and "id" not in records:
+            return None
+        ids = records["id"] if "id" in records else pd.Series([], dtype=object)
+        df = df[df["id"].isin(ids)].reset_index(drop=True)
+        if len(df) != state["count"] or len(df) != ids.nunique():
+            return None
+
+        return self.to_cache(
+            url, df, params=params, created_on=state["created_on"], request=request
+        )
+
+    @property
+    def cache(self) -> CacheStore:
+        """
+        The store keeping track of the cache directory's files, see
+        `seasnake.cache.CacheStore`: the client's `cache_store`, or by default the
+        store of `CACHE_DIR` shared by every client.
+
+        Returns:
+            CacheStore
+        """
+
+        if self.cache_store is not None:
+            return self.cache_store
+        return get_store(CACHE_DIR)
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        # Each backend's entries have their own index and store record. Entries of
+        # the default backend keep the names used by earlier versions.
+        extension = self.cache_backend.extension
+        if extension != PickleBackend.extension:
+            url = f"{url}#{extension}"
+        return self.cache.key(url)
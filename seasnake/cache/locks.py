@@ -0,0 +1,203 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+_THREAD_LOCKS: Dict[Path, threading.RLock] = {}
+_THREAD_LOCKS_LOCK = threading.Lock()
+
+# The asyncio locks in front of the file locks taken by coroutines, per event loop
+# and lock file. Locks are dropped once no coroutine holds or waits for them.
+_ASYNC_LOCKS: "weakref.WeakKeyDictionary[Any, weakref.WeakValueDictionary]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class LockTimeout(TimeoutError):
+    """
+    Raised when a cache lock can't be acquired in time.
+    """
+
+
+@contextmanager
+def file_lock(
+    path: Path, shared: bool = False, timeout: Optional[float] = None
+) -> Iterator[None]:
+    """
+    Holds an advisory lock on a file for the duration of the block.
+
+    The lock is taken with `flock`, so it excludes other processes as well as
+    other threads of this process. Where `flock` isn't available, e.g. on
+    Windows, the lock only excludes threads of this process.
+
+    Args:
+        path (Path): The lock file, created if missing.
+        shared (bool): Whether to take a shared lock, which other shared locks
+            don't exclude. Defaults to False.
+        timeout (Optional[float]): The most seconds to wait for the lock.
+            Defaults to waiting indefinitely.
+
+    Raises:
+        LockTimeout: If the lock isn't acquired within `timeout`.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:  # pragma: no cover
+        with _thread_lock(path, timeout):
+            yield
+        return
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _flock(fd, path, shared, deadline)
+        except BaseException:
+            os.close(fd)
+            raise
+        # Lock files are deleted along with their cache entries, see
+        # `remove_lock_file`, so a lock taken on a deleted file is taken again.
+        if _is_current(fd, path):
+            break
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _flock(fd: int, path: Path, shared: bool, deadline: Optional[float]):
+    operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    if deadline is None:
+        fcntl.flock(fd, operation)
+        return
+    while True:
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"Timed out waiting for {path}") from None
+            time.sleep(0.05)
+
+
+def _is_current(fd: int, path: Path) -> bool:
+    # Whether the open lock file is still the one at `path`.
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (stat.st_dev, stat.st_ino) == (opened.st_dev, opened.st_ino)
+
+
+def remove_lock_file(path: Path) -> bool:
+    """
+    Deletes a lock file, unless a thread or process holds the lock. Those waiting
+    for the lock take it on a new file instead.
+
+    Args:
+        path (Path): The lock file.
+
+    Returns:
+        bool: Whether the file is gone.
+    """
+
+    if fcntl is None:  # pragma: no cover
+        # Threads lock `_THREAD_LOCKS` instead, which don't use the file.
+        path.unlink(missing_ok=True)
+        return True
+
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return True
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        # Deleted while locked, so whoever opened it meanwhile takes the lock again.
+        if _is_current(fd, path):
+            path.unlink(missing_ok=True)
+        return True
+    finally:
+        os.close(fd)
+
+
+@asynccontextmanager
+async def async_file_lock(
+    path: Path, timeout: Optional[float] = None
+) -> AsyncIterator[None]:
+    """
+    Async version of `file_lock`, taking an exclusive lock.
+
+    Coroutines of the same event loop queue for the lock on an `asyncio.Lock`, so
+    waiting doesn't tie up any threads, and only the first in line waits for the
+    file lock itself, on a thread of its own. That thread holds the lock until the
+    block exits, as the lock is released by the thread that took it.
+
+    Args:
+        path (Path): The lock file, created if missing.
+        timeout (Optional[float]): The most seconds to wait for the file lock.
+            Defaults to waiting indefinitely.
+
+    Raises:
+        LockTimeout: If the file lock isn't acquired within `timeout`.
+    """
+
+    loop = asyncio.get_running_loop()
+    locks = _ASYNC_LOCKS.setdefault(loop, weakref.WeakValueDictionary())
+    lock = locks.get(path)
+    if lock is None:
+        lock = locks[path] = asyncio.Lock()
+
+    async with lock:
+        acquired = loop.create_future()
+        release = threading.Event()
+
+        def resolve(error: Optional[BaseException] = None):
+            if acquired.done():
+                return
+            if error is None:
+                acquired.set_result(None)
+            else:
+                acquired.set_exception(error)
+
+        def hold():
+            try:
+                with file_lock(path, timeout=timeout):
+                    loop.call_soon_threadsafe(resolve)
+                    release.wait()
+            except BaseException as e:
+                loop.call_soon_threadsafe(resolve, e)
+
+        threading.Thread(target=hold, name="seasnake-cache-lock", daemon=True).start()
+        try:
+            await acquired
+            yield
+        finally:
+            release.set()
+
+
+@contextmanager
+def _thread_lock(path: Path, timeout: Optional[float]) -> Iterator[None]:
+    with _THREAD_LOCKS_LOCK:
+        lock = _THREAD_LOCKS.setdefault(path, threading.RLock())
+    if not lock.acquire(timeout=-1 if timeout is None else timeout):
+        raise LockTimeout(f"Timed out waiting for {path}")
+    try:
+        yield
+    finally:
+        lock.release()
@@ -0,0 +1,187 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+DEFAULT_MAX_BYTES = 256 * 1024**2
+
+
+def _copy_on_write() -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def _freeze(df: DataFrame):
+    # Makes the NumPy arrays backing a cached DataFrame read-only, so frames
+    # sharing them can't modify the cached data in place.
+    for values in df._mgr.arrays:  # type: ignore[union-attr]
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+
+
+def share(df: DataFrame) -> DataFrame:
+    """
+    Returns a view of a cached DataFrame that can't modify the cached one.
+
+    With pandas' Copy-on-Write enabled (always on from pandas 3) the view is a
+    shallow copy, and data is only copied once it's modified. Otherwise the view
+    shares the cached frame's read-only NumPy arrays, so columns can be replaced
+    but setting values in place raises a `ValueError`; call `copy()` on it first
+    to modify it in place. Columns backed by other arrays, e.g. categoricals, are
+    copied.
+
+    Args:
+        df (DataFrame): The cached DataFrame.
+
+    Returns:
+        DataFrame
+    """
+
+    shared = df.copy(deep=False)
+    if _copy_on_write():
+        return shared
+    for i, dtype in enumerate(df.dtypes):
+        if not isinstance(dtype, np.dtype):
+            shared.isetitem(i, df.iloc[:, i].array.copy())
+    return shared
+
+
+class MemoryCache:
+    """
+    A thread-safe, size-bounded LRU cache of DataFrames held in memory.
+
+    It sits in front of the disk cache: frames read from a cache file are kept
+    along with a token identifying the version of the file, so repeated reads of
+    an unchanged file skip the disk and decoding. Cached frames are handed out
+    through `share`, so callers can't modify the cached data.
+
+    Args:
+        max_bytes (int): The most memory, in bytes, the cached frames may use.
+            Frames larger than this aren't cached. Defaults to 256 MiB.
+
+    Examples:
+    ```
+    from seasnake.cache import MemoryCache
+    from seasnake.summaries import BenthicPIT
+
+    benthic_pit = BenthicPIT(memory_cache=MemoryCache(max_bytes=1024**3))
+    ```
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, DataFrame, int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, token: Any = None) -> Optional[DataFrame]:
+        """
+        Returns a cached DataFrame.
+
+        Args:
+            key (Hashable): The key the DataFrame was cached under.
+            token (Any): The version of the data the caller expects; a cached
+                DataFrame with another token is discarded. Defaults to None.
+
+        Returns:
+            Optional[DataFrame]
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != token:
+                if entry is not None:
+                    self._discard(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return share(entry[1])
+
+    def put(self, key: Hashable, df: DataFrame, token: Any = None) -> DataFrame:
+        """
+        Caches a DataFrame, evicting the least recently used ones to make room.
+
+        Args:
+            key (Hashable): The key to cache the DataFrame under.
+            df (DataFrame): The DataFrame to cache.
+            token (Any): The version of the data, see `get`. Defaults to None.
+
+        Returns:
+            DataFrame: A view of the DataFrame, see `share`, or the DataFrame itself
+                when it's too large to cache.
+        """
+
+        num_bytes = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            self._discard(key)
+            if num_bytes > self.max_bytes:
+                return df
+            if not _copy_on_write():
+                _freeze(df)
+            self._entries[key] = (token, df, num_bytes)
+            self._bytes += num_bytes
+            while self._bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return share(df)
+
+    def get_or_load(
+        self, key: Hashable, load: Callable[[], DataFrame], token: Any = None
+    ) -> DataFrame:
+        """
+        Returns a cached DataFrame, loading and caching it on a miss.
+
+        Args:
+            key (Hashable): The key of the DataFrame.
+            load (Callable[[], DataFrame]): Loads the DataFrame.
+            token (Any): The version of the data, see `get`. Defaults to None.
+
+        Returns:
+            DataFrame
+        """
+
+        df = self.get(key, token)
+        return self.put(key, load(), token) if df is None else df
+
+    def _discard(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def clear(self):
+        """
+        Removes every cached DataFrame.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a summary of the cache.
+
+        Returns:
+            Dict[str, Any]: The number of `entries`, the `bytes` they use,
+                `max_bytes`, and the number of `hits` and `misses`.
+        """
+
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+MEMORY_CACHE = MemoryCache()
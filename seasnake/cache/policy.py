@@ -0,0 +1,134 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class CachePolicy:
+    """
+    Decides when cached data can be used without asking the API whether it changed.
+
+    Each cache entry records when it was last validated against the API. Within
+    `ttl` seconds of that, the entry is served straight from disk. After that, a
+    freshness check is sent, conditional on the `ETag` and `Last-Modified` of the
+    previous check when `conditional` is set, so an unchanged endpoint answers
+    with an empty `304 Not Modified`. If the check fails, e.g. the API can't be
+    reached, the entry is still served until it is `ttl + max_stale` seconds old.
+
+    With `stale_while_revalidate`, an entry up to `ttl + stale_while_revalidate`
+    seconds old is returned at once while it is refreshed in the background.
+
+    Args:
+        ttl (float): The number of seconds a validated entry is served without
+            contacting the API. Defaults to 0, which checks on every read.
+        max_stale (float): The number of seconds past `ttl` an entry is served when
+            the freshness check fails. Defaults to 0.
+        conditional (bool): Whether freshness checks are conditional requests.
+            Defaults to True.
+        stale_while_revalidate (float): The number of seconds past `ttl` an entry is
+            served immediately while it's refreshed in the background. Defaults to 0.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth
+    from seasnake.cache import CachePolicy
+    from seasnake.summaries import FishBeltTransect
+
+    auth = MermaidAuth()
+    policy = CachePolicy(ttl=15 * 60, max_stale=24 * 60 * 60)
+    fish_belt = FishBeltTransect(token=auth.get_token(), cache_policy=policy)
+    fish_belt.sample_events("AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE")
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        max_stale: float = 0,
+        conditional: bool = True,
+        stale_while_revalidate: float = 0,
+    ):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.conditional = conditional
+        self.stale_while_revalidate = stale_while_revalidate
+
+    def age(self, meta: Dict[str, Any], now: Optional[float] = None) -> float:
+        """
+        Returns the number of seconds since a cache entry was last validated.
+
+        Args:
+            meta (Dict[str, Any]): The cache entry's index.
+            now (Optional[float]): The current time. Defaults to `time.time()`.
+
+        Returns:
+            float
+        """
+
+        validated_at = meta.get("validated_at")
+        if validated_at is None:
+            return float("inf")
+        return (time.time() if now is None else now) - validated_at
+
+    def is_fresh(self, meta: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Returns whether a cache entry can be served without a freshness check.
+
+        Args:
+            meta (Dict[str, Any]): The cache entry's index.
+            now (Optional[float]): The current time. Defaults to `time.time()`.
+
+        Returns:
+            bool
+        """
+
+        return self.age(meta, now) < self.ttl
+
+    def serves_stale(self, meta: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Returns whether a cache entry can be served when its freshness check fails.
+
+        Args:
+            meta (Dict[str, Any]): The cache entry's index.
+            now (Optional[float]): The current time. Defaults to `time.time()`.
+
+        Returns:
+            bool
+        """
+
+        return self.age(meta, now) < self.ttl + self.max_stale
+
+    def revalidates_in_background(
+        self, meta: Dict[str, Any], now: Optional[float] = None
+    ) -> bool:
+        """
+        Returns whether a cache entry that isn't fresh can be served while it is
+        refreshed in the background.
+
+        Args:
+            meta (Dict[str, Any]): The cache entry's index.
+            now (Optional[float]): The current time. Defaults to `time.time()`.
+
+        Returns:
+            bool
+        """
+
+        return self.age(meta, now) < self.ttl + self.stale_while_revalidate
+
+    def conditional_headers(self, meta: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Returns the headers making a freshness check conditional.
+
+        Args:
+            meta (Dict[str, Any]): The cache entry's index.
+
+        Returns:
+            Dict[str, str]
+        """
+
+        if not self.conditional:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
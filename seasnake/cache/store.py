@@ -0,0 +1,325 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+from .locks import remove_lock_file
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+EVICTION_POLICIES = ("lru", "lfu")
+INDEX_FILE = "index.sqlite"
+LOCKS_DIR = "locks"
+
+_PROJECT_ID = re.compile(r"/projects/([^/?]+)/")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    project_id TEXT,
+    files TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class CacheStore:
+    """
+    Keeps track of the files in a cache directory and bounds their total size.
+
+    Every cache entry is named by the SHA-256 of its URL and recorded in a SQLite
+    index with its size, creation and last access times and number of hits. Once
+    the entries grow past `max_bytes`, the least recently used ("lru") or least
+    frequently used ("lfu") entries are deleted. Hits are written to the index in
+    batches, at most every `HIT_FLUSH_INTERVAL` seconds, to keep reads cheap.
+
+    Args:
+        directory (Union[str, Path]): The cache directory.
+        max_bytes (Optional[int]): The most bytes cache files may take up, or None
+            for no limit. Defaults to 2 GiB.
+        eviction (str): Which entries are deleted first, "lru" or "lfu".
+            Defaults to "lru".
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth
+    from seasnake.summaries import FishBeltTransect
+
+    auth = MermaidAuth()
+    fish_belt = FishBeltTransect(token=auth.get_token())
+    print(fish_belt.cache.stats())
+    fish_belt.cache.clear(project_id="AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE")
+    ```
+    """
+
+    HIT_FLUSH_INTERVAL = 5.0
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        eviction: str = "lru",
+    ):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unsupported eviction policy: {eviction}")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self._lock = threading.Lock()
+        self._pending_hits: Dict[str, Tuple[int, float]] = {}
+        self._hits_flushed = time.monotonic()
+
+    def key(self, url: str) -> str:
+        """
+        Returns the name of the cache entry for a URL.
+
+        Args:
+            url (str): The URL, including any parameters identifying a variant of
+                its data.
+
+        Returns:
+            str
+        """
+
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def lock_file(self, key: str, kind: str) -> Path:
+        """
+        Returns the file locked while a cache entry is written or downloaded,
+        deleted along with the entry.
+
+        Args:
+            key (str): The entry's name, see `key`.
+            kind (str): What the lock guards, e.g. "write" or "fetch".
+
+        Returns:
+            Path
+        """
+
+        return self.directory / LOCKS_DIR / f"{key}.{kind}.lock"
+
+    def _connect(self) -> sqlite3.Connection:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.directory / INDEX_FILE, timeout=30)
+        with conn:
+            conn.execute(_SCHEMA)
+        return conn
+
+    def record_write(self, key: str, url: str, files: Iterable[Path]):
+        """
+        Records that a cache entry was written, then evicts entries if the cache is
+        over its size limit.
+
+        Args:
+            key (str): The entry's name, see `key`.
+            url (str): The URL of the cached data.
+            files (Iterable[Path]): The entry's files.
+        """
+
+        files = [Path(f) for f in files]
+        size = sum(f.stat().st_size for f in files if f.exists())
+        match = _PROJECT_ID.search(url)
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._flush_hits(conn)
+            conn.execute(
+                """
+                INSERT INTO entries (
+                    key, url, project_id, files, size, created_at, accessed_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    files = excluded.files,
+                    size = excluded.size,
+                    created_at = excluded.created_at,
+                    accessed_at = excluded.accessed_at
+                """,
+                (
+                    key,
+                    url,
+                    match.group(1) if match else None,
+                    "\n".join(f.name for f in files),
+                    size,
+                    now,
+                    now,
+                ),
+            )
+        # The new entry is kept, or with LFU eviction it would always go first.
+        self._prune(self.max_bytes, keep=key)
+
+    def record_hit(self, key: str):
+        """
+        Records that a cache entry was read.
+
+        Args:
+            key (str): The entry's name, see `key`.
+        """
+
+        with self._lock:
+            hits, _ = self._pending_hits.get(key, (0, 0.0))
+            self._pending_hits[key] = (hits + 1, time.time())
+            if time.monotonic() - self._hits_flushed < self.HIT_FLUSH_INTERVAL:
+                return
+            with closing(self._connect()) as conn, conn:
+                self._flush_hits(conn)
+
+    def _flush_hits(self, conn: sqlite3.Connection):
+        conn.executemany(
+            "UPDATE entries SET hits = hits + ?, accessed_at = ? WHERE key = ?",
+            [(hits, at, key) for key, (hits, at) in self._pending_hits.items()],
+        )
+        self._pending_hits.clear()
+        self._hits_flushed = time.monotonic()
+
+    def entries(self) -> DataFrame:
+        """
+        Returns the cache entries.
+
+        Returns:
+            DataFrame: One row per entry with its `key`, `url`, `project_id`, `size`
+                in bytes, `created_at` and `accessed_at` times and number of `hits`.
+        """
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._flush_hits(conn)
+            df = pd.read_sql_query(
+                "SELECT key, url, project_id, size, created_at, accessed_at, hits "
+                "FROM entries ORDER BY accessed_at DESC",
+                conn,
+            )
+        for column in ("created_at", "accessed_at"):
+            df[column] = pd.to_datetime(df[column], unit="s", utc=True)
+        return df
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a summary of the cache.
+
+        Returns:
+            Dict[str, Any]: The cache `directory`, number of `entries`, total `bytes`,
+                `max_bytes`, `eviction` policy and total number of `hits`.
+        """
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._flush_hits(conn)
+            entries, size, hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) "
+                "FROM entries"
+            ).fetchone()
+        return {
+            "directory": str(self.directory),
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "eviction": self.eviction,
+            "hits": hits,
+        }
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Deletes entries whose files are missing, then evicts entries until the
+        cache fits in `max_bytes`.
+
+        Args:
+            max_bytes (Optional[int]): The size to shrink the cache to. Defaults to
+                the store's `max_bytes`.
+
+        Returns:
+            int: The number of entries removed.
+        """
+
+        return self._prune(self.max_bytes if max_bytes is None else max_bytes)
+
+    def _prune(self, max_bytes: Optional[int], keep: Optional[str] = None) -> int:
+        order = "accessed_at" if self.eviction == "lru" else "hits, accessed_at"
+        removed = []
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._flush_hits(conn)
+            rows = conn.execute(
+                f"SELECT key, files, size FROM entries ORDER BY {order}"
+            ).fetchall()
+            total = sum(size for _, _, size in rows)
+            for key, files, size in rows:
+                paths = list(self._paths(files))
+                if all(path.exists() for path in paths) and (
+                    max_bytes is None or total <= max_bytes or key == keep
+                ):
+                    continue
+                removed.append(key)
+                total -= size
+                self._delete(key, paths)
+            conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in removed]
+            )
+        return len(removed)
+
+    def clear(self, project_id: Optional[str] = None) -> int:
+        """
+        Deletes cache entries.
+
+        Args:
+            project_id (Optional[str]): Only delete the entries of this project.
+                Defaults to deleting every entry.
+
+        Returns:
+            int: The number of entries removed.
+        """
+
+        query = "SELECT key, files FROM entries"
+        args: tuple = ()
+        if project_id is not None:
+            query += " WHERE project_id = ?"
+            args = (project_id,)
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._flush_hits(conn)
+            rows = conn.execute(query, args).fetchall()
+            for key, files in rows:
+                self._delete(key, self._paths(files))
+            conn.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key, _ in rows]
+            )
+        return len(rows)
+
+    def _paths(self, files: str) -> Iterator[Path]:
+        for name in files.split("\n"):
+            if name:
+                yield self.directory / name
+
+    def _delete(self, key: str, paths: Iterable[Path]):
+        for path in paths:
+            path.unlink(missing_ok=True)
+        # Locks held by a running write or download are left in place.
+        for path in (self.directory / LOCKS_DIR).glob(f"{key}.*.lock"):
+            remove_lock_file(path)
+
+
+_STORES: Dict[Path, CacheStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(directory: Union[str, Path]) -> CacheStore:
+    """
+    Returns the store of a cache directory, shared by every client using it.
+
+    Args:
+        directory (Union[str, Path]): The cache directory.
+
+    Returns:
+        CacheStore
+    """
+
+    directory = Path(directory)
+    with _STORES_LOCK:
+        if directory not in _STORES:
+            _STORES[directory] = CacheStore(directory)
+        return _STORES[directory]
@@ -0,0 +1,116 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pandas import DataFrame
+
+from ..projects import Project
+from ..summaries import SUMMARY_METHODS
+from .client import record_cache_events
+from .policy import CachePolicy
+
+TOKEN_ENV_VAR = "MERMAID_TOKEN"
+
+
+def warm(
+    token: str,
+    project_ids: Optional[Iterable[str]] = None,
+    protocols: Optional[Iterable[str]] = None,
+    max_workers: int = 4,
+    cache_policy: Optional[CachePolicy] = None,
+) -> DataFrame:
+    """
+    Fills the cache with every summary of every project, e.g. from a nightly job.
+
+    Summaries already cached are checked for changes, or skipped when the
+    `cache_policy` considers them fresh, and outdated ones are refreshed.
+
+    Args:
+        token (str): The access token for the Mermaid API.
+        project_ids (Optional[Iterable[str]]): The projects to cache. Defaults to
+            every project of `Project.my_projects`.
+        protocols (Optional[Iterable[str]]): The protocols to cache, keys of
+            `seasnake.summaries.SUMMARY_METHODS`. Defaults to all of them.
+        max_workers (int): The most summaries fetched at once. Defaults to 4.
+        cache_policy (Optional[CachePolicy]): When cached summaries are served
+            without checking the API for changes. Defaults to checking every one.
+
+    Returns:
+        DataFrame: One row per summary with its `project_id`, `protocol`, `method`,
+            `outcome` ("fetched", "revalidated", "skipped" or "failed", see
+            `seasnake.cache.client.record_cache_events`), the `seconds` it took, the
+            cache entry's size in `bytes` and the `error` of failed summaries.
+    """
+
+    if project_ids is None:
+        with Project(token=token) as project:
+            project_ids = project.my_projects()["id"].tolist()
+    protocols = list(SUMMARY_METHODS if protocols is None else protocols)
+    for protocol in protocols:
+        if protocol not in SUMMARY_METHODS:
+            raise ValueError(f"Unknown protocol: {protocol}")
+
+    clients = {
+        protocol: SUMMARY_METHODS[protocol][0](token=token, cache_policy=cache_policy)
+        for protocol in protocols
+    }
+    tasks = [
+        (project_id, protocol, method)
+        for project_id in project_ids
+        for protocol in protocols
+        for method in SUMMARY_METHODS[protocol][1]
+    ]
+
+    def run(task: Tuple[str, str, str]) -> Dict[str, Any]:
+        project_id, protocol, method = task
+        row: Dict[str, Any] = {
+            "project_id": project_id,
+            "protocol": protocol,
+            "method": method,
+            "outcome": "failed",
+            "bytes": 0,
+            "error": None,
+        }
+        started = time.perf_counter()
+        try:
+            with record_cache_events() as events:
+                getattr(clients[protocol], method)(project_id)
+        except Exception as e:
+            row["error"] = str(e)
+        else:
+            # Summaries with no records aren't cached, so have no events.
+            row["outcome"] = events[-1]["outcome"] if events else "fetched"
+            row["bytes"] = events[-1]["bytes"] if events else 0
+        row["seconds"] = time.perf_counter() - started
+        return row
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="seasnake-warm"
+        ) as executor:
+            rows: List[Dict[str, Any]] = list(executor.map(run, tasks))
+    finally:
+        for client in clients.values():
+            client.close()
+
+    columns = ["project_id", "protocol", "method", "outcome", "seconds", "bytes"]
+    return DataFrame(rows, columns=[*columns, "error"])
+
+
+def default_token() -> Optional[str]:
+    """
+    Returns the access token used by the `warm` command: the `MERMAID_TOKEN`
+    environment variable, or a token from `MermaidAuth`.
+
+    Returns:
+        Optional[str]
+    """
+
+    token = os.environ.get(TOKEN_ENV_VAR)
+    if token:
+        return token
+
+    from ..auth import MermaidAuth
+
+    return MermaidAuth().get_token(store=True)
@@ -0,0 +1,251 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from .schemas import CATEGORY, DATE, DATETIME, FLOAT32
+
+
+class _ObjectColumn:
+    def __init__(self, size: int = 0):
+        self.values: List[Any] = [None] * size
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def extend(self, values: List[Any]):
+        self.values.extend(values)
+
+    def merge(self, other: Any):
+        if not isinstance(other, _ObjectColumn):
+            other = other.to_object_column()
+        self.values.extend(other.values)
+
+    def to_object_column(self) -> "_ObjectColumn":
+        return self
+
+    def to_array(self) -> Any:
+        return self.values
+
+
+class _CategoryColumn:
+    def __init__(self, size: int = 0):
+        self.codes = array("l", [-1] * size)
+        self.categories: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def extend(self, values: List[Any]):
+        categories = self.categories
+        codes = self.codes
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                continue
+            code = categories.get(value)
+            if code is None:
+                code = categories[value] = len(categories)
+            codes.append(code)
+
+    def merge(self, other: "_CategoryColumn"):
+        if not other.categories:
+            self.codes.extend(other.codes)
+            return
+        for value in other.categories:
+            if value not in self.categories:
+                self.categories[value] = len(self.categories)
+        mapping = np.array([self.categories[value] for value in other.categories])
+        codes = np.frombuffer(other.codes, dtype=other.codes.typecode)
+        remapped = np.where(codes < 0, -1, mapping[np.maximum(codes, 0)])
+        self.codes.frombytes(remapped.astype(codes.dtype).tobytes())
+
+    def to_object_column(self) -> _ObjectColumn:
+        categories = list(self.categories)
+        column = _ObjectColumn()
+        column.extend([None if code < 0 else categories[code] for code in self.codes])
+        return column
+
+    def to_array(self) -> Any:
+        return pd.Categorical.from_codes(
+            np.frombuffer(self.codes, dtype=self.codes.typecode),
+            categories=pd.Index(list(self.categories), dtype=object),
+        )
+
+
+class _TypedColumn:
+    def __init__(self, column_type: str, size: int = 0):
+        self.column_type = column_type
+        self.chunks: List[Any] = []
+        self.size = 0
+        if size:
+            self.extend([None] * size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _convert(self, values: List[Any]) -> Any:
+        series = pd.Series(values, dtype=object)
+        if self.column_type == FLOAT32:
+            return pd.to_numeric(series, errors="coerce").astype("float32")
+        return pd.to_datetime(
+            series, utc=self.column_type == DATETIME, errors="coerce", format="ISO8601"
+        )
+
+    def extend(self, values: List[Any]):
+        self.chunks.append(self._convert(values))
+        self.size += len(values)
+
+    def merge(self, other: "_TypedColumn"):
+        self.chunks.extend(other.chunks)
+        self.size += other.size
+
+    def to_object_column(self) -> _ObjectColumn:
+        column = _ObjectColumn()
+        if self.chunks:
+            values = pd.concat(self.chunks, ignore_index=True).astype(object)
+            column.extend(values.where(values.notna(), None).tolist())
+        return column
+
+    def to_array(self) -> Any:
+        if not self.chunks:
+            return self._convert([]).array
+        return pd.concat(self.chunks, ignore_index=True).array
+
+
+def _new_column(column_type: Optional[str], size: int = 0):
+    if column_type == CATEGORY:
+        return _CategoryColumn(size)
+    if column_type in (FLOAT32, DATETIME, DATE):
+        return _TypedColumn(column_type, size)
+    return _ObjectColumn(size)
+
+
+class ColumnarDecoder:
+    """
+    Decodes pages of API records into typed column buffers.
+
+    Records are appended page by page. Columns listed in the schema are stored as
+    categoricals, float32 or datetimes as they arrive, other columns keep their
+    decoded JSON values and have their dtypes inferred by pandas.
+
+    When `columns` is given, every other key is dropped as records are decoded and
+    requested columns missing from the records are filled with nulls.
+
+    Args:
+        schema (Optional[Dict[str, str]]): A mapping of column name to column type,
+            see `seasnake.schemas`. Defaults to None.
+        columns (Optional[Iterable[str]]): The record keys to keep. Defaults to None,
+            which keeps every key.
+    """
+
+    def __init__(
+        self,
+        schema: Optional[Dict[str, str]] = None,
+        columns: Optional[Iterable[str]] = None,
+    ):
+        self.schema = schema or {}
+        self.columns: Dict[str, Any] = {}
+        self.num_rows = 0
+        self.projected = columns is not None
+        for key in columns or []:
+            self.columns[key] = _new_column(self.schema.get(key))
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def append(self, records: Iterable[Dict[str, Any]]):
+        """
+        Appends a page of records to the column buffers.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): The records to append.
+        """
+
+        records = list(records)
+        if not records:
+            return
+
+        if not self.projected:
+            for record in records:
+                for key in record:
+                    if key not in self.columns:
+                        self.columns[key] = _new_column(
+                            self.schema.get(key), self.num_rows
+                        )
+
+        for key, column in self.columns.items():
+            values = [record.get(key) for record in records]
+            try:
+                column.extend(values)
+            except TypeError:
+                # Unhashable values, e.g. lists, can't be stored as categories.
+                column = self.columns[key] = column.to_object_column()
+                column.extend(values[len(column) - self.num_rows :])
+
+        self.num_rows += len(records)
+
+    def append_iter(self, records: Iterable[Dict[str, Any]], batch_size: int = 256):
+        """
+        Appends records from an iterator in batches, so at most `batch_size`
+        decoded records are held at once.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): The records to append.
+            batch_size (int): The number of records appended at a time. Defaults to 256.
+        """
+
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                self.append(batch)
+                batch = []
+        self.append(batch)
+
+    def merge(self, other: "ColumnarDecoder"):
+        """
+        Appends the rows of another decoder, e.g. one that decoded a page in a
+        worker thread.
+
+        Args:
+            other (ColumnarDecoder): A decoder built with the same schema.
+        """
+
+        if not other.num_rows:
+            return
+
+        if not self.projected:
+            for key, column in other.columns.items():
+                if key not in self.columns:
+                    self.columns[key] = _new_column(self.schema.get(key), self.num_rows)
+
+        for key, column in self.columns.items():
+            other_column = other.columns.get(key)
+            if other_column is None:
+                column.extend([None] * other.num_rows)
+            elif type(column) is type(other_column):
+                column.merge(other_column)
+            else:
+                # One side fell back to object values, see `append`.
+                column = self.columns[key] = column.to_object_column()
+                column.merge(other_column)
+
+        self.num_rows += other.num_rows
+
+    def to_data_frame(self) -> DataFrame:
+        """
+        Builds a DataFrame from the decoded columns.
+
+        Returns:
+            DataFrame
+        """
+
+        if not self.num_rows:
+            return DataFrame()
+
+        return DataFrame(
+            {key: column.to_array() for key, column in self.columns.items()}
+        )
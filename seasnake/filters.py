@@ -0,0 +1,149 @@
+import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+from .schemas import get_filter_params
+
+DateLike = Union[str, datetime.date, datetime.datetime, pd.Timestamp]
+
+# The filters of summary methods, with the column each one applies to and its
+# operator.
+FILTERS: Dict[str, Tuple[str, str]] = {
+    "sample_date_after": ("sample_date", ">="),
+    "sample_date_before": ("sample_date", "<="),
+    "site_ids": ("site_id", "in"),
+    "management_ids": ("management_id", "in"),
+    "countries": ("country_name", "in"),
+    "reef_zones": ("reef_zone", "in"),
+    "reef_types": ("reef_type", "in"),
+}
+
+# A filter applied to a DataFrame: its column, operator and value.
+LocalFilter = Tuple[str, str, Any]
+
+
+def split_filters(
+    url: str,
+    filters: Mapping[str, Any],
+    rename_columns: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, str], List[LocalFilter]]:
+    """
+    Splits the filters of a summary method into the query parameters sent to the
+    endpoint, see `seasnake.schemas.register_filter_params`, and the filters
+    applied to the DataFrame, for filters the endpoint doesn't support.
+
+    Args:
+        url (str): The URL or URL path of the endpoint.
+        filters (Mapping[str, Any]): The filters, keys of `FILTERS`:
+
+            - `sample_date_after`, `sample_date_before`: the first and last sample
+              date, as a date or an ISO 8601 string
+            - `site_ids`, `management_ids`: site and management IDs
+            - `countries`: country names
+            - `reef_zones`, `reef_types`: reef zone and type names
+
+            Lists of values take a single value or an iterable of values. Filters
+            set to None are ignored.
+        rename_columns (Optional[Dict[str, str]]): The columns renamed in the
+            DataFrame, which local filters apply to. Defaults to None.
+
+    Returns:
+        Tuple[Dict[str, str], List[LocalFilter]]: The query parameters, which are
+            part of the cache key, and the `(column, operator, value)` filters.
+
+    Raises:
+        TypeError: If a filter isn't supported.
+    """
+
+    params = get_filter_params(url)
+    rename_columns = rename_columns or {}
+    query_params: Dict[str, str] = {}
+    local: List[LocalFilter] = []
+    for name, value in filters.items():
+        if name not in FILTERS:
+            raise TypeError(f"Unsupported filter: {name}")
+        if value is None:
+            continue
+        column, op = FILTERS[name]
+        if op == "in":
+            values = _values(value)
+            param, value = ",".join(values), values
+        else:
+            date = _date(value)
+            param, value = date.date().isoformat(), date
+        if name in params:
+            query_params[params[name]] = param
+        else:
+            local.append((rename_columns.get(column, column), op, value))
+    return query_params, local
+
+
+def _date(value: DateLike) -> pd.Timestamp:
+    return pd.Timestamp(value).normalize()
+
+
+def _values(value: Union[str, Iterable[str]]) -> List[str]:
+    values = [value] if isinstance(value, str) else value
+    return sorted({str(v) for v in values})
+
+
+def filter_columns(
+    columns: Optional[List[str]], filters: Iterable[LocalFilter]
+) -> Optional[List[str]]:
+    """
+    Returns the columns to fetch for a projection, including the columns local
+    filters apply to.
+
+    Args:
+        columns (Optional[List[str]]): The requested columns, or None for all.
+        filters (Iterable[LocalFilter]): The local filters, see `split_filters`.
+
+    Returns:
+        Optional[List[str]]
+    """
+
+    if not columns:
+        return columns
+    extra = [column for column, _, _ in filters if column not in columns]
+    return [*columns, *dict.fromkeys(extra)]
+
+
+def apply_filters(
+    df: DataFrame,
+    filters: Iterable[LocalFilter],
+    columns: Optional[List[str]] = None,
+) -> DataFrame:
+    """
+    Returns the rows of a DataFrame matching every filter.
+
+    Args:
+        df (DataFrame): The DataFrame.
+        filters (Iterable[LocalFilter]): The local filters, see `split_filters`.
+        columns (Optional[List[str]]): The columns to return, dropping the columns
+            only fetched for filtering. Defaults to all columns.
+
+    Returns:
+        DataFrame
+
+    Raises:
+        ValueError: If a filtered column isn't in the DataFrame.
+    """
+
+    filters = list(filters)
+    if df.empty or not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column not in df.columns:
+            raise ValueError(f"Can't filter on missing column: {column}")
+        if op == "in":
+            mask &= df[column].astype(str).isin(value)
+            continue
+        dates = pd.to_datetime(df[column], errors="coerce")
+        if getattr(dates.dt, "tz", None) is not None:
+            dates = dates.dt.tz_localize(None)
+        mask &= dates >= value if op == ">=" else dates <= value
+    df = df[mask].reset_index(drop=True)
+    return df[columns] if columns else df
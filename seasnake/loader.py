@@ -0,0 +1,223 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pandas import DataFrame
+
+from .base import MermaidBase, create_session, default_num_threads
+from .cache import CachePolicy
+from .cache.client import record_cache_events
+from .summaries import SUMMARY_METHODS
+
+REPORT_COLUMNS = ["protocol", "method", "rows", "seconds", "outcome", "bytes"]
+
+
+class ProjectBundle:
+    """
+    The summaries of one project loaded by `ProjectLoader.load`.
+
+    Attributes:
+        project_id (str): The project's ID.
+        frames (Dict[str, Dict[str, DataFrame]]): The summaries by protocol and
+            method name, e.g. `frames["benthicpit"]["sample_units"]`. Protocols
+            without data in the project are left out.
+        report (DataFrame): One row per summary fetched with its `protocol`,
+            `method`, number of `rows`, the `seconds` it took, how it was served
+            (`outcome`, see `seasnake.cache.client.record_cache_events`) and the
+            cache entry's size in `bytes`.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        frames: Dict[str, Dict[str, DataFrame]],
+        report: DataFrame,
+    ):
+        self.project_id = project_id
+        self.frames = frames
+        self.report = report
+
+    def __getitem__(self, protocol: str) -> Dict[str, DataFrame]:
+        return self.frames[protocol]
+
+    def __contains__(self, protocol: str) -> bool:
+        return protocol in self.frames
+
+    def __repr__(self) -> str:
+        return f"ProjectBundle({self.project_id!r}, protocols={list(self.frames)})"
+
+    @property
+    def protocols(self) -> List[str]:
+        """
+        The protocols with data in the project.
+        """
+
+        return list(self.frames)
+
+
+class ProjectLoader:
+    """
+    Loads every summary of a project at once.
+
+    The summary clients of all protocols share one pooled session and one pool of
+    worker threads for fetching pages, so the whole project is fetched with at most
+    `num_threads` requests in flight. Each protocol's sample events are fetched
+    first and the rest of its summaries only when there are any, so protocols
+    the project has no data for cost a single request.
+
+    Args:
+        token (Optional[str]): The access token for the Mermaid API.
+        num_threads (Optional[int]): The most pages fetched at once across all
+            summaries. Defaults to `default_num_threads()`.
+        max_summaries (Optional[int]): The most summaries fetched at once.
+            Defaults to `num_threads`.
+        cache_policy (Optional[CachePolicy]): When cached summaries are served
+            without checking the API for changes.
+        **kwargs: Passed to every summary client, see `MermaidBase`.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth, ProjectLoader
+
+    auth = MermaidAuth()
+    with ProjectLoader(token=auth.get_token()) as loader:
+        bundle = loader.load("AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE")
+    print(bundle["benthicpit"]["sample_units"])
+    print(bundle.report)
+    ```
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        max_summaries: Optional[int] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        **kwargs: Any,
+    ):
+        self.num_threads = num_threads or default_num_threads()
+        self.max_summaries = max_summaries or self.num_threads
+        # Summaries wait on their pages, so they run on their own threads and the
+        # page pool is never blocked by them.
+        self._pages = ThreadPoolExecutor(
+            max_workers=self.num_threads, thread_name_prefix="seasnake-pages"
+        )
+        self._summaries = ThreadPoolExecutor(
+            max_workers=self.max_summaries, thread_name_prefix="seasnake-summaries"
+        )
+        # Summaries also make requests themselves, e.g. to check the cache.
+        self.session = create_session(self.num_threads + self.max_summaries)
+        self.clients: Dict[str, MermaidBase] = {
+            protocol: summary_class(
+                token=token,
+                num_threads=self.num_threads,
+                cache_policy=cache_policy,
+                session=self.session,
+                executor=self._pages,
+                **kwargs,
+            )
+            for protocol, (summary_class, _) in SUMMARY_METHODS.items()
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker threads and closes the shared session.
+        """
+
+        self._summaries.shutdown(wait=True)
+        self._pages.shutdown(wait=True)
+        self.session.close()
+
+    def load(
+        self, project_id: str, protocols: Optional[Iterable[str]] = None
+    ) -> ProjectBundle:
+        """
+        Fetches the summaries of a project.
+
+        Args:
+            project_id (str): The project's ID.
+            protocols (Optional[Iterable[str]]): The protocols to load, keys of
+                `seasnake.summaries.SUMMARY_METHODS`. Defaults to all of them.
+
+        Returns:
+            ProjectBundle
+        """
+
+        protocols = list(SUMMARY_METHODS if protocols is None else protocols)
+        for protocol in protocols:
+            if protocol not in SUMMARY_METHODS:
+                raise ValueError(f"Unknown protocol: {protocol}")
+
+        rows: List[Dict[str, Any]] = []
+        frames: Dict[str, Dict[str, DataFrame]] = {}
+        pending: Dict[Future, Tuple[str, str]] = {
+            self._submit(project_id, protocol, "sample_events"): (
+                protocol,
+                "sample_events",
+            )
+            for protocol in protocols
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    protocol, method = pending.pop(future)
+                    df, row = future.result()
+                    rows.append(row)
+                    if method == "sample_events" and df.empty:
+                        continue
+                    frames.setdefault(protocol, {})[method] = df
+                    if method != "sample_events":
+                        continue
+                    for other in SUMMARY_METHODS[protocol][1]:
+                        if other != method:
+                            other_future = self._submit(project_id, protocol, other)
+                            pending[other_future] = (protocol, other)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        # Summaries are listed in the order of `SUMMARY_METHODS`.
+        order = [
+            (protocol, method)
+            for protocol in protocols
+            for method in SUMMARY_METHODS[protocol][1]
+        ]
+        rows.sort(key=lambda row: order.index((row["protocol"], row["method"])))
+        frames = {
+            protocol: {
+                method: frames[protocol][method]
+                for method in SUMMARY_METHODS[protocol][1]
+            }
+            for protocol in protocols
+            if protocol in frames
+        }
+        return ProjectBundle(
+            project_id, frames, DataFrame(rows, columns=REPORT_COLUMNS)
+        )
+
+    def _submit(self, project_id: str, protocol: str, method: str) -> Future:
+        return self._summaries.submit(self._fetch, project_id, protocol, method)
+
+    def _fetch(
+        self, project_id: str, protocol: str, method: str
+    ) -> Tuple[DataFrame, Dict[str, Any]]:
+        started = time.perf_counter()
+        with record_cache_events() as events:
+            df = getattr(self.clients[protocol], method)(project_id)
+        row = {
+            "protocol": protocol,
+            "method": method,
+            "rows": len(df),
+            "seconds": time.perf_counter() - started,
+            # Summaries with no records aren't cached, so have no events.
+            "outcome": events[-1]["outcome"] if events else "fetched",
+            "bytes": events[-1]["bytes"] if events else 0,
+        }
+        return df, row
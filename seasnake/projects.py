@@ -16,12 +16,20 @@ class Project(MermaidBase):
 
     PROJECT_STATUS_OPEN = 90
 
-    def my_projects(self) -> DataFrame:
+    def my_projects(self, cache: bool = False) -> DataFrame:
         """
         Get a list of your projects.
 
         This method retrieves a list of your projects.
 
+        Args:
+            cache (bool): Whether to cache the list for the user the token belongs
+                to, see `MermaidBase.fetch_cached`. A cached list is only checked for
+                changes by its number of projects and its first project, so an edit
+                to another project isn't noticed until the entry expires; set a
+                `CachePolicy(ttl=...)` to bound how long it's served. Defaults to
+                False.
+
         Returns:
             DataFrame
 
@@ -36,6 +44,8 @@ class Project(MermaidBase):
         """
 
         url = "/projects/"
+        if cache:
+            return self.fetch_cached(url, per_user=True)
         return self.data_frame_from_url(url)
 
     def search_projects(
@@ -44,6 +54,7 @@ class Project(MermaidBase):
         countries: Union[None, str, List[str]] = None,
         tags: Union[None, str, List[str]] = None,
         include_test_projects: bool = False,
+        cache: bool = False,
     ) -> DataFrame:
         """
         Searches all MERMAID projects and filters results based on the specified criteria.
@@ -57,6 +68,8 @@ class Project(MermaidBase):
                 for in projects. Defaults to None.
             include_test_projects (bool, optional): Whether to include test projects in
                 the search results. Defaults to False.
+            cache (bool, optional): Whether to cache the results of the search, which
+                are checked for changes like `my_projects`. Defaults to False.
 
         Returns:
             DataFrame
@@ -78,7 +91,10 @@ class Project(MermaidBase):
         if not include_test_projects:
             query_params["status"] = str(self.PROJECT_STATUS_OPEN)
 
-        df = self.data_frame_from_url(url, query_params=query_params)
+        if cache:
+            df = self.fetch_cached(url, query_params=query_params)
+        else:
+            df = self.data_frame_from_url(url, query_params=query_params)
 
         if name:
             raise NotImplementedError("Searching by name is not yet implemented.")
@@ -0,0 +1,202 @@
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Union, cast
+
+import pandas as pd
+from pandas import DataFrame
+
+from .filters import apply_filters, filter_columns, split_filters
+
+if TYPE_CHECKING:
+    from .summaries.base import BaseSummary
+
+
+class SummaryQuery:
+    """
+    A summary that is fetched only when it's needed, returned by summary methods
+    called with `lazy=True`.
+
+    `filter`, `select` and `head` return a new query, and nothing is requested
+    until `collect` is called. The query is then sent in as few requests as
+    possible: filters are sent to the API where the endpoint supports them, see
+    `seasnake.filters`, selected columns are read from the cache or decoded from
+    the API response without the others, `head` requests only the first page, and
+    `len` reads the API's record count without downloading any records.
+
+    Filters, selections and `head` are applied in that order, whatever order
+    they're called in.
+
+    Args:
+        client (BaseSummary): The summary client fetching the records.
+        url (str): The URL of the summary endpoint.
+        columns (Optional[List[str]]): The columns to include. Defaults to all.
+        filters (Optional[Dict[str, Any]]): The filters, see
+            `seasnake.filters.split_filters`. Defaults to None.
+        limit (Optional[int]): The most records to return. Defaults to all.
+
+    Examples:
+    ```
+    from seasnake import MermaidAuth, FishBeltTransect
+
+    auth = MermaidAuth()
+    fish_belt = FishBeltTransect(token=auth.get_token())
+    project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+    query = fish_belt.observations(project_id, lazy=True)
+    print(len(query))
+    recent = query.filter(sample_date_after="2022-01-01").select("fish_taxon", "size")
+    print(recent.head(10).collect())
+    ```
+    """
+
+    def __init__(
+        self,
+        client: "BaseSummary",
+        url: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ):
+        self.client = client
+        self.url = url
+        self.columns = list(columns) if columns else None
+        self.filters = dict(filters or {})
+        self.limit = limit
+        # Raise for unsupported filters now rather than when the query is collected.
+        split_filters(url, self.filters)
+
+    def __repr__(self) -> str:
+        return (
+            f"SummaryQuery({self.url!r}, columns={self.columns!r}, "
+            f"filters={self.filters!r}, limit={self.limit!r})"
+        )
+
+    def _replace(self, **changes: Any) -> "SummaryQuery":
+        options: Dict[str, Any] = {
+            "columns": self.columns,
+            "filters": self.filters,
+            "limit": self.limit,
+        }
+        options.update(changes)
+        return type(self)(self.client, self.url, **options)
+
+    def filter(self, **filters: Any) -> "SummaryQuery":
+        """
+        Returns a query of the records matching these filters as well, see
+        `seasnake.filters.split_filters`. A filter given again replaces the
+        previous one.
+
+        Args:
+            **filters: The filters, e.g. `site_ids=[...]`.
+
+        Returns:
+            SummaryQuery
+
+        Raises:
+            TypeError: If a filter isn't supported.
+        """
+
+        return self._replace(filters={**self.filters, **filters})
+
+    def select(self, *columns: Union[str, List[str]]) -> "SummaryQuery":
+        """
+        Returns a query of only these columns.
+
+        Args:
+            *columns (Union[str, List[str]]): The column names, or lists of names.
+
+        Returns:
+            SummaryQuery
+
+        Raises:
+            ValueError: If a column was left out by a previous selection.
+        """
+
+        names: List[str] = []
+        for column in columns:
+            names.extend([column] if isinstance(column, str) else column)
+        if self.columns is not None:
+            missing = [name for name in names if name not in self.columns]
+            if missing:
+                raise ValueError(f"Columns not in the selection: {missing}")
+        return self._replace(columns=names)
+
+    def head(self, n: int = 5) -> "SummaryQuery":
+        """
+        Returns a query of the first `n` records.
+
+        Args:
+            n (int): The number of records. Defaults to 5.
+
+        Returns:
+            SummaryQuery
+        """
+
+        n = max(n, 0)
+        return self._replace(limit=n if self.limit is None else min(self.limit, n))
+
+    def collect(self) -> DataFrame:
+        """
+        Fetches the records.
+
+        Without a `head`, the whole summary is fetched through the cache, see
+        `MermaidBase.fetch_cached`. With one, only the pages needed for the first
+        records are requested, and the records aren't cached.
+
+        Returns:
+            DataFrame
+        """
+
+        if self.limit is None:
+            return self.client._read_summary(
+                self.url, columns=self.columns, filters=self.filters
+            )
+        if self.limit == 0:
+            return DataFrame(columns=self.columns)
+
+        query_params, local = split_filters(self.url, self.filters)
+        # Without local filters the first page holds all the records needed. With
+        # them, full pages are requested and the limit applied once filtered.
+        page_size = self.client.page_size if local else self.limit
+        chunks = cast(
+            Generator[DataFrame, None, None],
+            self.client.iter_data_frames(
+                self.url,
+                query_params={**query_params, "limit": page_size},
+                columns=filter_columns(self.columns, local),
+            ),
+        )
+        frames: List[DataFrame] = []
+        rows = 0
+        try:
+            for chunk in chunks:
+                chunk = apply_filters(chunk, local, self.columns)
+                frames.append(chunk)
+                rows += len(chunk)
+                if rows >= self.limit:
+                    break
+        finally:
+            # Stops the pages requested ahead of the records needed.
+            chunks.close()
+        frames = [df for df in frames if not df.empty]
+        if not frames:
+            return DataFrame(columns=self.columns)
+        return pd.concat(frames, ignore_index=True).head(self.limit)
+
+    def __bool__(self) -> bool:
+        # Defined so truth tests don't fall back to `__len__`, which sends a request.
+        return True
+
+    def __len__(self) -> int:
+        """
+        Returns the number of records, from the count reported by the API, so no
+        records are downloaded. Filters the endpoint doesn't support are applied to
+        the fetched summary instead.
+        """
+
+        query_params, local = split_filters(self.url, self.filters)
+        if local:
+            return len(self.collect())
+        headers = {"Authorization": f"Bearer {self.client.token}"}
+        page = self.client.fetch(
+            self.url, params={**query_params, "limit": 1}, headers=headers
+        )
+        count = int(page.get("count") or 0)
+        return count if self.limit is None else min(count, self.limit)
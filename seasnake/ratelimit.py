@@ -0,0 +1,136 @@
+import datetime
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by every client and worker thread.
+
+    Each request takes a token; tokens are refilled at `rate` per second up to
+    `burst`. When the API throttles a request, `throttle()` pauses every caller
+    until the backoff has passed and halves the rate, which then recovers
+    gradually as requests succeed. Waiting callers are released with a little
+    jitter so they don't all retry at the same instant.
+
+    Args:
+        rate (float): The sustained number of requests per second. Defaults to 10.
+        burst (int): The number of requests that can be sent at once after an idle
+            period. Defaults to 10.
+        min_rate (float): The lowest rate throttling can reduce `rate` to.
+            Defaults to 0.5.
+        max_backoff (float): The longest pause, in seconds, for a single throttled
+            request. Defaults to 60.
+        jitter (float): The most random delay, in seconds, added when callers are
+            released after a pause. Defaults to 0.5.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: float = 0.5,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now + random.uniform(0, self.jitter)
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def throttle(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Pauses all callers after a throttled request and lowers the rate.
+
+        Args:
+            attempt (int): The number of times the request has been throttled
+                before, used for exponential backoff.
+            retry_after (Optional[float]): The delay, in seconds, requested by the
+                server. Defaults to None.
+
+        Returns:
+            float: The pause, in seconds.
+        """
+
+        if retry_after is None:
+            delay = min(self.max_backoff, 2**attempt) * random.uniform(0.5, 1.0)
+        else:
+            delay = min(self.max_backoff, max(retry_after, 0.0))
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + delay)
+            self.rate = max(self.min_rate, self.rate / 2)
+        return delay
+
+    def succeeded(self):
+        """
+        Records a successful request, letting a throttled rate recover.
+        """
+
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 100)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a `Retry-After` header value.
+
+    Args:
+        value (Optional[str]): Either a number of seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if the value is missing
+            or invalid.
+    """
+
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+
+
+RATE_LIMITER = RateLimiter()
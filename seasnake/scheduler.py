@@ -0,0 +1,185 @@
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, List, Optional, Tuple
+
+_Task = Tuple[Future, Callable[[], None]]
+
+DEFAULT_MAX_WORKERS = 6
+
+
+class PageScheduler(Executor):
+    """
+    A pool of worker threads that shares its capacity fairly between groups of
+    tasks, e.g. the pages of several projects downloaded at once.
+
+    Tasks are queued per group and the workers take them from each group with
+    queued tasks in turn, so a project with many pages doesn't hold up the others
+    and every project progresses under one concurrency budget. The group of a task
+    is set by the thread submitting it, see `group`. Worker threads are started as
+    tasks are submitted.
+
+    The scheduler can be passed to a client as its `executor`, and is used by the
+    `*_many` summary methods, see `BaseSummary.fetch_many`.
+
+    Args:
+        max_workers (int): The number of worker threads. Defaults to 6.
+        thread_name_prefix (str): The prefix of the worker threads' names.
+
+    Examples:
+    ```
+    from seasnake.scheduler import PageScheduler
+
+    scheduler = PageScheduler(max_workers=4)
+    with scheduler.group("AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"):
+        future = scheduler.submit(pow, 2, 10)
+    print(future.result())
+    ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        thread_name_prefix: str = "seasnake-scheduler",
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._queues: Dict[Hashable, Deque[_Task]] = {}
+        # The groups with queued tasks, in the order they're served.
+        self._turns: Deque[Hashable] = deque()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+        self._local = threading.local()
+
+    @contextmanager
+    def group(self, key: Hashable) -> Iterator[None]:
+        """
+        Puts the tasks submitted by the current thread in a group.
+
+        Args:
+            key (Hashable): The group, e.g. a project ID.
+        """
+
+        previous = getattr(self._local, "group", None)
+        self._local.group = key
+        try:
+            yield
+        finally:
+            self._local.group = previous
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """
+        Queues a task in the current thread's group.
+
+        Args:
+            fn (Callable[..., Any]): The task.
+            *args: The task's positional arguments.
+            **kwargs: The task's keyword arguments.
+
+        Returns:
+            Future: The task's result.
+        """
+
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        key = getattr(self._local, "group", None)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit tasks after shutdown")
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                self._turns.append(key)
+            queue.append((future, run))
+            if self._idle:
+                self._idle -= 1
+                self._condition.notify()
+            elif len(self._threads) < self.max_workers:
+                self._start_worker()
+        return future
+
+    def _start_worker(self):
+        thread = threading.Thread(
+            target=self._work,
+            name=f"{self.thread_name_prefix}_{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_task(self) -> Optional[_Task]:
+        with self._condition:
+            while not self._turns:
+                if self._shutdown:
+                    return None
+                self._idle += 1
+                self._condition.wait()
+            key = self._turns.popleft()
+            queue = self._queues[key]
+            task = queue.popleft()
+            if queue:
+                self._turns.append(key)
+            else:
+                del self._queues[key]
+            return task
+
+    def _work(self):
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            _, run = task
+            run()
+
+    def queued(self) -> Dict[Hashable, int]:
+        """
+        Returns the number of tasks waiting in each group.
+
+        Returns:
+            Dict[Hashable, int]
+        """
+
+        with self._condition:
+            return {key: len(queue) for key, queue in self._queues.items()}
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """
+        Stops the worker threads once the queued tasks have run.
+
+        Args:
+            wait (bool): Whether to wait for the workers to finish. Defaults to True.
+            cancel_futures (bool): Whether to cancel the queued tasks instead of
+                running them. Defaults to False.
+        """
+
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    for future, _ in queue:
+                        future.cancel()
+                self._queues.clear()
+                self._turns.clear()
+            self._idle = 0
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+PAGE_SCHEDULER = PageScheduler()
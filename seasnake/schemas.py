@@ -0,0 +1,250 @@
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+CATEGORY = "category"
+FLOAT32 = "float32"
+DATETIME = "datetime"
+DATE = "date"
+
+COLUMN_TYPES = (CATEGORY, FLOAT32, DATETIME, DATE)
+
+COMMON_SCHEMA: Dict[str, str] = {
+    "project": CATEGORY,
+    "project_id": CATEGORY,
+    "project_name": CATEGORY,
+    "country": CATEGORY,
+    "country_id": CATEGORY,
+    "country_name": CATEGORY,
+    "site": CATEGORY,
+    "site_id": CATEGORY,
+    "site_name": CATEGORY,
+    "management": CATEGORY,
+    "management_id": CATEGORY,
+    "management_name": CATEGORY,
+    "management_est_year": FLOAT32,
+    "reef_type": CATEGORY,
+    "reef_zone": CATEGORY,
+    "reef_exposure": CATEGORY,
+    "tide": CATEGORY,
+    "current": CATEGORY,
+    "visibility": CATEGORY,
+    "relative_depth": CATEGORY,
+    "sample_event_id": CATEGORY,
+    "sample_unit_id": CATEGORY,
+    "data_policy_beltfish": CATEGORY,
+    "data_policy_benthiclit": CATEGORY,
+    "data_policy_benthicpit": CATEGORY,
+    "data_policy_benthicpqt": CATEGORY,
+    "data_policy_habitatcomplexity": CATEGORY,
+    "data_policy_bleachingqc": CATEGORY,
+    "latitude": FLOAT32,
+    "longitude": FLOAT32,
+    "sample_date": DATE,
+    "created_on": DATETIME,
+    "updated_on": DATETIME,
+}
+
+BENTHIC_SCHEMA: Dict[str, str] = {
+    **COMMON_SCHEMA,
+    "benthic_category": CATEGORY,
+    "benthic_attribute": CATEGORY,
+    "growth_form": CATEGORY,
+}
+
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "beltfishes": {
+        **COMMON_SCHEMA,
+        "fish_family": CATEGORY,
+        "fish_genus": CATEGORY,
+        "fish_taxon": CATEGORY,
+        "trophic_group": CATEGORY,
+        "functional_group": CATEGORY,
+        "transect_width_name": CATEGORY,
+        "size_bin": CATEGORY,
+        "label": CATEGORY,
+    },
+    "benthiclits": BENTHIC_SCHEMA,
+    "benthicpits": BENTHIC_SCHEMA,
+    "benthicpqts": BENTHIC_SCHEMA,
+    "bleachingqcs": BENTHIC_SCHEMA,
+    "habitatcomplexities": COMMON_SCHEMA,
+    "summarysampleevents": COMMON_SCHEMA,
+    "projects": {
+        "countries": CATEGORY,
+        "created_on": DATETIME,
+        "updated_on": DATETIME,
+    },
+}
+
+# Endpoints that accept a query parameter limiting the fields of each record.
+FIELDS_PARAMS: Dict[str, str] = {}
+
+# Endpoints that accept a query parameter returning only records updated since a
+# timestamp, used to refresh cached summaries incrementally.
+DELTA_PARAMS: Dict[str, str] = {
+    endpoint: "updated_on_after"
+    for endpoint in (
+        "beltfishes",
+        "benthiclits",
+        "benthicpits",
+        "benthicpqts",
+        "bleachingqcs",
+        "habitatcomplexities",
+    )
+}
+
+
+# Endpoints that accept filters of summary methods as query parameters, with the
+# parameter of each filter, see `seasnake.filters`.
+FILTER_PARAMS: Dict[str, Dict[str, str]] = {
+    endpoint: {
+        "sample_date_after": "sample_date_after",
+        "sample_date_before": "sample_date_before",
+        "site_ids": "site_id",
+        "management_ids": "management_id",
+        "countries": "country_name",
+        "reef_zones": "reef_zone",
+        "reef_types": "reef_type",
+    }
+    for endpoint in (
+        "beltfishes",
+        "benthiclits",
+        "benthicpits",
+        "benthicpqts",
+        "bleachingqcs",
+        "habitatcomplexities",
+    )
+}
+
+
+def _lookup(registry: Dict[str, Any], url: str) -> Any:
+    segments = [segment for segment in urlparse(url).path.split("/") if segment]
+    for segment in reversed(segments):
+        if segment in registry:
+            return registry[segment]
+    return None
+
+
+def register_schema(endpoint: str, schema: Dict[str, str]):
+    """
+    Registers the column types used to decode an endpoint's records.
+
+    Args:
+        endpoint (str): The endpoint path segment, for example `"beltfishes"`.
+        schema (Dict[str, str]): A mapping of column name to column type, one of
+            `"category"`, `"float32"`, `"datetime"` or `"date"`.
+
+    Raises:
+        ValueError: If a column type is not supported.
+    """
+
+    for column, column_type in schema.items():
+        if column_type not in COLUMN_TYPES:
+            raise ValueError(f"Unsupported column type for '{column}': {column_type}")
+    SCHEMAS[endpoint] = schema
+
+
+def get_schema(url: str) -> Optional[Dict[str, str]]:
+    """
+    Returns the registered schema for the given URL.
+
+    The most specific endpoint wins, e.g. `/projects/<id>/beltfishes/sampleunits/`
+    uses the `beltfishes` schema rather than the `projects` one.
+
+    Args:
+        url (str): The URL or URL path of the endpoint.
+
+    Returns:
+        Optional[Dict[str, str]]
+    """
+
+    return _lookup(SCHEMAS, url)
+
+
+def register_fields_param(endpoint: str, param: str = "fields"):
+    """
+    Registers the query parameter an endpoint accepts to limit the fields returned.
+
+    When columns are requested from a registered endpoint, they are sent to the
+    API so unneeded fields are never transferred.
+
+    Args:
+        endpoint (str): The endpoint path segment, for example `"summarysampleevents"`.
+        param (str): The name of the query parameter. Defaults to `"fields"`.
+    """
+
+    FIELDS_PARAMS[endpoint] = param
+
+
+def get_fields_param(url: str) -> Optional[str]:
+    """
+    Returns the fields query parameter registered for the given URL.
+
+    Args:
+        url (str): The URL or URL path of the endpoint.
+
+    Returns:
+        Optional[str]
+    """
+
+    return _lookup(FIELDS_PARAMS, url)
+
+
+def register_delta_param(endpoint: str, param: str = "updated_on_after"):
+    """
+    Registers the query parameter an endpoint accepts to return only the records
+    created or updated since a timestamp.
+
+    Cached summaries of registered endpoints are refreshed by downloading the
+    records changed since the newest cached record and merging them into the cache.
+
+    Args:
+        endpoint (str): The endpoint path segment, for example `"beltfishes"`.
+        param (str): The name of the query parameter. Defaults to `"updated_on_after"`.
+    """
+
+    DELTA_PARAMS[endpoint] = param
+
+
+def get_delta_param(url: str) -> Optional[str]:
+    """
+    Returns the delta query parameter registered for the given URL.
+
+    Args:
+        url (str): The URL or URL path of the endpoint.
+
+    Returns:
+        Optional[str]
+    """
+
+    return _lookup(DELTA_PARAMS, url)
+
+
+def register_filter_params(endpoint: str, params: Dict[str, str]):
+    """
+    Registers the query parameters an endpoint accepts to filter its records.
+
+    Filters of summary methods with a registered parameter are sent to the API, and
+    the others are applied to the DataFrame, see `seasnake.filters`.
+
+    Args:
+        endpoint (str): The endpoint path segment, for example `"summarysampleevents"`.
+        params (Dict[str, str]): A mapping of filter name, e.g. `"site_ids"`, to
+            query parameter, e.g. `"site_id"`.
+    """
+
+    FILTER_PARAMS[endpoint] = params
+
+
+def get_filter_params(url: str) -> Dict[str, str]:
+    """
+    Returns the filter query parameters registered for the given URL.
+
+    Args:
+        url (str): The URL or URL path of the endpoint.
+
+    Returns:
+        Dict[str, str]
+    """
+
+    return _lookup(FILTER_PARAMS, url) or {}
@@ -0,0 +1,67 @@
+from typing import Any, Dict, Iterator
+
+from requests import Response
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+PAGE_KEYS = ("count", "next", "previous")
+
+
+def _iter_results(events: Iterator) -> Iterator[Dict[str, Any]]:
+    builder = None
+    for prefix, event, value in events:
+        if prefix == "results" and event == "end_array":
+            break
+        if prefix == "results.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "results.item" and event == "end_map":
+                yield builder.value
+                builder = None
+
+
+def _stream_results(events: Iterator, resp: Response) -> Iterator[Dict[str, Any]]:
+    try:
+        yield from _iter_results(events)
+    finally:
+        resp.close()
+
+
+def parse_page(resp: Response) -> Dict[str, Any]:
+    """
+    Parses a paginated API response without loading the whole body into memory.
+
+    The page's `count`, `next` and `previous` values are read up front, while
+    `results` is returned as an iterator that decodes one record at a time from
+    the response stream and closes the response once exhausted. Records are only
+    streamed when `ijson` is installed, otherwise the body is decoded at once.
+
+    Args:
+        resp (Response): A response requested with `stream=True`.
+
+    Returns:
+        Dict[str, Any]: The page, with `results` as an iterator of records.
+    """
+
+    if ijson is None:
+        return resp.json()
+
+    resp.raw.decode_content = True
+    events = ijson.parse(resp.raw, use_float=True)
+    page: Dict[str, Any] = {}
+    for prefix, event, value in events:
+        if prefix in PAGE_KEYS:
+            page[prefix] = value
+        elif prefix == "results" and event == "start_array":
+            if "count" in page:
+                page["results"] = _stream_results(events, resp)
+                return page
+            # `count` comes after `results`, so the records are needed up front.
+            page["results"] = list(_iter_results(events))
+
+    resp.close()
+    return page
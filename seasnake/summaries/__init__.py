@@ -5,3 +5,28 @@ from .bleaching import Bleaching  # noqa: F401
 from .fish_belt import FishBeltTransect  # noqa: F401
 from .habitat_complexity import HabitatComplexity  # noqa: F401
 from .sample_event import SampleEvent  # noqa: F401
+
+# The summary class and summary methods of each protocol, keyed by the protocol's
+# name in the API, e.g. in `SampleEvent.summary`'s `protocols` column.
+SUMMARY_METHODS = {
+    "beltfish": (FishBeltTransect, ("observations", "sample_units", "sample_events")),
+    "benthiclit": (BenthicLIT, ("observations", "sample_units", "sample_events")),
+    "benthicpit": (BenthicPIT, ("observations", "sample_units", "sample_events")),
+    "benthicpqt": (
+        BenthicPhotoQuadrat,
+        ("observations", "sample_units", "sample_events"),
+    ),
+    "bleachingqc": (
+        Bleaching,
+        (
+            "colonies_bleached_observations",
+            "percent_cover_observations",
+            "sample_units",
+            "sample_events",
+        ),
+    ),
+    "habitatcomplexity": (
+        HabitatComplexity,
+        ("observations", "sample_units", "sample_events"),
+    ),
+}
@@ -1,105 +1,370 @@
-import base64
-import os
-from pathlib import Path
-from typing import Optional, Tuple
+import asyncio
+import copy
+import sys
+import types
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 from pandas import DataFrame
 
+from .. import aggregate as local
+from ..cache import client as cache_client
 from ..base import MermaidBase
 from ..base import requires_token  # noqa: F401
-
-CACHE_DIR = Path(os.getcwd(), ".cache")
+from ..filters import apply_filters, filter_columns, split_filters
+from ..query import SummaryQuery
+from ..scheduler import PAGE_SCHEDULER, PageScheduler
 
 
 class BaseSummary(MermaidBase):
     """
     Base class for MERMAID sample method summary classes.
+
+    Summaries are cached on disk, see `MermaidBase.fetch_cached`, and are
+    refreshed incrementally when they change. The summaries of many projects can be
+    fetched at once with `fetch_many` and the `*_many` methods.
+
+    Every summary method takes filters as keyword arguments, see
+    `seasnake.filters.split_filters`. Filters the endpoint supports are sent to the
+    API and are part of the cache key, and the others are applied to the cached
+    DataFrame. Called with `lazy=True`, they return a `SummaryQuery` that fetches
+    the summary only when it's collected.
+
+    Attributes:
+        PROTOCOL (Optional[str]): The protocol's name in the API, e.g. "beltfish".
+        OBSERVATION_METHODS (Tuple[str, ...]): The methods returning the protocol's
+            observations, used by `aggregate`.
     """
 
-    def _get_created_on(self, url: str) -> Optional[str]:
-        response = self.fetch(
-            url, params={"limit": 1}, headers={"Authorization": f"Bearer {self.token}"}
+    PROTOCOL: Optional[str] = None
+    OBSERVATION_METHODS: Tuple[str, ...] = ("observations",)
+
+    def summary_methods(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the protocol's summary methods, which return a
+        project's summary as a DataFrame and can be fetched for many projects at
+        once, see `iter_many`.
+
+        Returns:
+            Tuple[str, ...]
+        """
+
+        return (*self.OBSERVATION_METHODS, "sample_units", "sample_events")
+
+    def _fetch_summary(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        lazy: bool = False,
+    ) -> Union[DataFrame, SummaryQuery]:
+        if lazy:
+            return SummaryQuery(self, url, columns=columns, filters=filters)
+        return self._read_summary(url, columns=columns, filters=filters)
+
+    def _read_summary(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> DataFrame:
+        query_params, local = split_filters(url, filters or {})
+        df = self.fetch_cached(
+            url,
+            query_params=query_params or None,
+            columns=filter_columns(columns, local),
+        )
+        return apply_filters(df, local, columns)
+
+    async def _fetch_summary_async(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> DataFrame:
+        query_params, local = split_filters(url, filters or {})
+        df = await self.fetch_cached_async(
+            url,
+            query_params=query_params or None,
+            columns=filter_columns(columns, local),
+            semaphore=semaphore,
+        )
+        return apply_filters(df, local, columns)
+
+    def _iter_summary(
+        self,
+        url: str,
+        columns: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[DataFrame]:
+        query_params, local = split_filters(url, filters or {})
+        chunks = self.iter_data_frames(
+            url,
+            query_params=query_params or None,
+            columns=filter_columns(columns, local),
+            chunk_size=chunk_size,
+        )
+        for df in chunks:
+            yield apply_filters(df, local, columns)
+
+    @requires_token
+    def iter_many(
+        self,
+        method: str,
+        project_ids: Iterable[str],
+        columns: Optional[List[str]] = None,
+        max_projects: Optional[int] = None,
+        scheduler: Optional[PageScheduler] = None,
+        **filters: Any,
+    ) -> Iterator[Tuple[str, DataFrame]]:
+        """
+        Retrieves a summary of many projects, yielding each project's summary as
+        soon as it's fetched.
+
+        The pages of all projects are fetched by one `PageScheduler`, which takes
+        pages from each project in turn, so the projects share its worker threads
+        fairly instead of each starting its own.
+
+        Args:
+            method (str): The name of the summary method, one of
+                `summary_methods()`, e.g. "observations".
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrames.
+                Defaults to None, which includes all columns.
+            max_projects (Optional[int]): The most projects fetched at once, each
+                requesting its first page and checking its cache on its own thread.
+                Defaults to the scheduler's `max_workers`.
+            scheduler (Optional[PageScheduler]): Fetches the pages. Defaults to
+                `seasnake.scheduler.PAGE_SCHEDULER`, shared by every client.
+            **filters: Only records matching these filters, see
+                `seasnake.filters.split_filters`.
+
+        Yields:
+            Tuple[str, DataFrame]: The project ID and its summary, in the order the
+                projects finish.
+
+        Raises:
+            ValueError: If `method` isn't a summary method.
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, FishBeltTransect
+
+        auth = MermaidAuth()
+        fish_belt = FishBeltTransect(token=auth.get_token())
+        project_ids = ["AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"]
+        for project_id, df in fish_belt.iter_many("observations", project_ids):
+            print(project_id, len(df))
+        ```
+        """
+
+        methods = self.summary_methods()
+        if method not in methods:
+            raise ValueError(
+                f"Unknown summary method: {method}, expected one of {methods}"
+            )
+        project_ids = list(dict.fromkeys(project_ids))
+        scheduler = scheduler or PAGE_SCHEDULER
+
+        # A copy of the client sharing its session, whose pages are fetched by the
+        # scheduler.
+        client = copy.copy(self)
+        client._session = self.session
+        client._owns_session = False
+        client.executor = scheduler
+
+        def fetch(project_id: str) -> DataFrame:
+            with scheduler.group(project_id):
+                return getattr(client, method)(project_id, columns=columns, **filters)
+
+        projects = ThreadPoolExecutor(
+            max_workers=max_projects or scheduler.max_workers,
+            thread_name_prefix="seasnake-projects",
         )
-        record = (response.get("results") or [None])[0]
-        return None if record is None else record.get("created_on")
+        futures = {
+            projects.submit(fetch, project_id): project_id for project_id in project_ids
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            projects.shutdown(wait=False)
 
-    def get_cache_file_paths(self, url: str) -> Tuple[Path, Path]:
+    @requires_token
+    def fetch_many(
+        self,
+        method: str,
+        project_ids: Iterable[str],
+        columns: Optional[List[str]] = None,
+        max_projects: Optional[int] = None,
+        scheduler: Optional[PageScheduler] = None,
+        **filters: Any,
+    ) -> DataFrame:
         """
-        Generates cache file paths for the given URL.
+        Retrieves a summary of many projects as one DataFrame, see `iter_many`.
 
         Args:
-            url (str): The URL to generate cache file paths for.
+            method (str): The name of the summary method, e.g. "observations".
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            max_projects (Optional[int]): The most projects fetched at once.
+                Defaults to the scheduler's `max_workers`.
+            scheduler (Optional[PageScheduler]): Fetches the pages. Defaults to
+                `seasnake.scheduler.PAGE_SCHEDULER`.
+            **filters: Only records matching these filters, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            Tuple[Path, Path]: A tuple containing the paths for the cache file and cache index file.
+            DataFrame: The projects' summaries in the order of `project_ids`, with a
+                `project_id` column.
         """
-        cache_key = self._cache_key(url)
-        cache_file = Path(CACHE_DIR, f"{cache_key}.tar.gz")
-        cache_index_file = Path(CACHE_DIR, f"{cache_key}.idx")
-        return cache_file, cache_index_file
 
-    def to_cache(self, url: str, df: DataFrame) -> DataFrame:
+        project_ids = list(dict.fromkeys(project_ids))
+        frames = dict(
+            self.iter_many(
+                method,
+                project_ids,
+                columns=columns,
+                max_projects=max_projects,
+                scheduler=scheduler,
+                **filters,
+            )
+        )
+        tagged = [
+            _tag_project(frames[project_id], project_id)
+            for project_id in project_ids
+            if not frames[project_id].empty
+        ]
+        if not tagged:
+            return DataFrame()
+        return pd.concat(tagged, ignore_index=True)
+
+    def sample_units_many(
+        self, project_ids: Iterable[str], columns: Optional[List[str]] = None, **kwargs
+    ) -> DataFrame:
         """
-        Caches the given DataFrame to a file with gzip compression.
+        Retrieves the sample units of many projects as one DataFrame, see
+        `fetch_many`.
 
         Args:
-            url (str): The URL associated with the DataFrame.
-            df (DataFrame): The DataFrame to cache.
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            **kwargs: Passed to `fetch_many`.
 
         Returns:
             DataFrame
         """
 
-        url = self.get_full_url(url)
+        return self.fetch_many("sample_units", project_ids, columns=columns, **kwargs)
 
-        if df is None or df.empty or "created_on" not in df.columns:
-            return df
-
-        if Path(CACHE_DIR).exists() is False:
-            os.makedirs(CACHE_DIR)
+    def sample_events_many(
+        self, project_ids: Iterable[str], columns: Optional[List[str]] = None, **kwargs
+    ) -> DataFrame:
+        """
+        Retrieves the sample events of many projects as one DataFrame, see
+        `fetch_many`.
 
-        created_on = df.iloc[0]["created_on"]
-        cache_file, cache_idx_file = self.get_cache_file_paths(url)
-        with open(cache_idx_file, "w") as f:
-            f.write(created_on)
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            **kwargs: Passed to `fetch_many`.
 
-        df.to_pickle(
-            cache_file, compression={"method": "gzip", "compresslevel": 1, "mtime": 1}
-        )
+        Returns:
+            DataFrame
+        """
 
-        return df
+        return self.fetch_many("sample_events", project_ids, columns=columns, **kwargs)
 
-    def read_cache(self, url: str) -> Optional[DataFrame]:
+    @requires_token
+    def aggregate(
+        self, project_id: str, level: str = "sample_units", **filters: Any
+    ) -> DataFrame:
         """
-        Reads the cached DataFrame for the given URL, if it exists and is up to date.
+        Computes a project's sample units or sample events locally from its
+        observations, instead of downloading them, see `seasnake.aggregate`.
+
+        The observations are read from the cache when they're up to date, so only
+        one endpoint per protocol is transferred.
 
         Args:
-            url (str): The URL associated with the cached DataFrame.
+            project_id (str): The ID of the project.
+            level (str): "sample_units" or "sample_events". Defaults to
+                "sample_units".
+            **filters: Only observations matching these filters, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            Optional[DataFrame]
+            DataFrame
+
+        Raises:
+            ValueError: If the level is not supported.
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, FishBeltTransect
+        from seasnake.aggregate import validate
+
+        auth = MermaidAuth()
+        fish_belt = FishBeltTransect(token=auth.get_token())
+        project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+        sample_units = fish_belt.aggregate(project_id)
+        print(validate(sample_units, fish_belt.sample_units(project_id), "sample_unit_id"))
+        ```
         """
 
-        url = self.get_full_url(url)
+        if level not in ("sample_units", "sample_events"):
+            raise ValueError(f"Unsupported aggregation level: {level}")
+        if self.PROTOCOL is None:
+            raise ValueError(f"{type(self).__name__} has no protocol to aggregate")
+        observations = [
+            getattr(self, method)(project_id, **filters)
+            for method in self.OBSERVATION_METHODS
+        ]
+        sample_units = local.sample_units(self.PROTOCOL, *observations)
+        if level == "sample_units":
+            return sample_units
+        return local.sample_events(sample_units)
+
 
-        cache_file, cache_idx_file = self.get_cache_file_paths(url)
-        created_on = self._get_created_on(url)
+def _tag_project(df: DataFrame, project_id: str) -> DataFrame:
+    if "project_id" in df.columns:
+        return df
+    return df.assign(project_id=project_id)[["project_id", *df.columns]]
 
-        if Path(cache_file).exists() is False or Path(cache_idx_file).exists() is False:
-            return None
 
-        with open(cache_idx_file, "r") as f:
-            cached_created_on = f.read()
+class _Module(types.ModuleType):
+    # `CACHE_DIR` moved to `seasnake.cache.client`. Setting it here, as earlier
+    # versions allowed, still moves the cache.
+    def __setattr__(self, name: str, value: Any):
+        if name == "CACHE_DIR":
+            _warn_cache_dir()
+            cache_client.CACHE_DIR = value
+            return
+        super().__setattr__(name, value)
+
+
+def _warn_cache_dir():
+    warnings.warn(
+        "seasnake.summaries.base.CACHE_DIR moved to seasnake.cache.client.CACHE_DIR",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "CACHE_DIR":
+        _warn_cache_dir()
+        return cache_client.CACHE_DIR
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        return (
-            None
-            if cached_created_on != created_on
-            else pd.read_pickle(
-                cache_file,
-                compression={"method": "gzip", "compresslevel": 1, "mtime": 1},
-            )
-        )
 
-    def _cache_key(self, url) -> str:
-        return base64.b64encode(bytes(f"{url}", "utf-8")).decode("utf-8")
+sys.modules[__name__].__class__ = _Module
@@ -1,3 +1,7 @@
+import asyncio
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Union, overload
+
+from ..query import SummaryQuery
 from .base import BaseSummary, DataFrame, requires_token
 
 
@@ -10,16 +14,59 @@ class BenthicPIT(BaseSummary):
     for a specified project.
     """
 
+    PROTOCOL = "benthicpit"
+
+    @overload
+    def observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
+
     @requires_token
-    def observations(self, project_id: str) -> DataFrame:
+    def observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Benthic PIT observations.
 
         Args:
             project_id (str): The ID of the project for which to fetch Benthic PIT observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -31,20 +78,165 @@ class BenthicPIT(BaseSummary):
         print(benthic_pit.sample_events(project_id))
         ```
         """
+
         url = f"/projects/{project_id}/benthicpits/obstransectbenthicpits/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
 
     @requires_token
-    def sample_units(self, project_id: str) -> DataFrame:
+    async def observations_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `observations`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Benthic PIT observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/benthicpits/obstransectbenthicpits/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
+
+    @requires_token
+    def iter_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[DataFrame]:
+        """
+        Retrieves a project's Benthic PIT observations as a stream of DataFrames.
+
+        Records are streamed page by page from the API and are not cached, so the
+        whole project is never held in memory at once.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Benthic PIT observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            chunk_size (Optional[int]): The number of rows in each DataFrame.
+                Defaults to None, which yields one DataFrame per page.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Yields:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, BenthicPIT
+
+        auth = MermaidAuth()
+        benthic_pit = BenthicPIT(token=auth.get_token())
+        project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+        for df in benthic_pit.iter_observations(project_id, chunk_size=5000):
+            print(len(df))
+        ```
+        """
+
+        url = f"/projects/{project_id}/benthicpits/obstransectbenthicpits/"
+        return self._iter_summary(
+            url, columns=columns, chunk_size=chunk_size, filters=filters
+        )
+
+    def observations_many(
+        self, project_ids: Iterable[str], columns: Optional[List[str]] = None, **kwargs
+    ) -> DataFrame:
+        """
+        Retrieves the Benthic PIT observations of many
+        projects as one DataFrame, fetching their pages concurrently, see
+        `BaseSummary.fetch_many`.
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            **kwargs: Passed to `fetch_many`.
+
+        Returns:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, BenthicPIT
+
+        auth = MermaidAuth()
+        benthic_pit = BenthicPIT(token=auth.get_token())
+        project_ids = ["AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"]
+        print(benthic_pit.observations_many(project_ids))
+        ```
+        """
+
+        return self.fetch_many("observations", project_ids, columns=columns, **kwargs)
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
+
+    @requires_token
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Benthic PIT observations aggregated by sample units.
 
         Args:
             project_id (str): The ID of the project for which to fetch Benthic PIT sample units.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
         Examples:
         ```
         from seasnake import MermaidAuth, BenthicPIT
@@ -57,19 +249,89 @@ class BenthicPIT(BaseSummary):
         """
 
         url = f"/projects/{project_id}/benthicpits/sampleunits/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
+
+    @requires_token
+    async def sample_units_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `sample_units`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Benthic PIT sample units.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/benthicpits/sampleunits/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
 
     @requires_token
-    def sample_events(self, project_id: str) -> DataFrame:
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Benthic PIT observations aggregated by sample events.
 
         Args:
             project_id (str): The ID of the project for which to fetch Benthic PIT sample events.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -83,5 +345,34 @@ class BenthicPIT(BaseSummary):
         """
 
         url = f"/projects/{project_id}/benthicpits/sampleevents/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
+
+    @requires_token
+    async def sample_events_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `sample_events`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Benthic PIT sample events.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/benthicpits/sampleevents/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
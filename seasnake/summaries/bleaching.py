@@ -1,3 +1,7 @@
+import asyncio
+from typing import Any, Iterable, Iterator, List, Literal, Optional, Union, overload
+
+from ..query import SummaryQuery
 from .base import BaseSummary, DataFrame, requires_token
 
 
@@ -10,16 +14,63 @@ class Bleaching(BaseSummary):
     for a specified project.
     """
 
+    PROTOCOL = "bleachingqc"
+    OBSERVATION_METHODS = (
+        "colonies_bleached_observations",
+        "percent_cover_observations",
+    )
+
+    @overload
+    def colonies_bleached_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def colonies_bleached_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def colonies_bleached_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
+
     @requires_token
-    def colonies_bleached_observations(self, project_id: str) -> DataFrame:
+    def colonies_bleached_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Bleaching colonies bleached observations.
 
         Args:
             project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -33,20 +84,166 @@ class Bleaching(BaseSummary):
         """
 
         url = f"/projects/{project_id}/bleachingqcs/obscoloniesbleacheds/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
+
+    @requires_token
+    async def colonies_bleached_observations_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `colonies_bleached_observations`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/obscoloniesbleacheds/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
+
+    @requires_token
+    def iter_colonies_bleached_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[DataFrame]:
+        """
+        Retrieves a project's Bleaching colonies bleached observations as a stream of DataFrames.
+
+        Records are streamed page by page from the API and are not cached, so the
+        whole project is never held in memory at once.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            chunk_size (Optional[int]): The number of rows in each DataFrame.
+                Defaults to None, which yields one DataFrame per page.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Yields:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, Bleaching
+
+        auth = MermaidAuth()
+        bleaching = Bleaching(token=auth.get_token())
+        project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+        for df in bleaching.iter_colonies_bleached_observations(project_id, chunk_size=5000):
+            print(len(df))
+        ```
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/obscoloniesbleacheds/"
+        return self._iter_summary(
+            url, columns=columns, chunk_size=chunk_size, filters=filters
+        )
+
+    def colonies_bleached_observations_many(
+        self, project_ids: Iterable[str], columns: Optional[List[str]] = None, **kwargs
+    ) -> DataFrame:
+        """
+        Retrieves the Bleaching colonies bleached observations of many
+        projects as one DataFrame, fetching their pages concurrently, see
+        `BaseSummary.fetch_many`.
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            **kwargs: Passed to `fetch_many`.
+
+        Returns:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, Bleaching
+
+        auth = MermaidAuth()
+        bleaching = Bleaching(token=auth.get_token())
+        project_ids = ["AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"]
+        print(bleaching.colonies_bleached_observations_many(project_ids))
+        ```
+        """
+
+        return self.fetch_many(
+            "colonies_bleached_observations", project_ids, columns=columns, **kwargs
+        )
+
+    @overload
+    def percent_cover_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def percent_cover_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def percent_cover_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
 
     @requires_token
-    def percent_cover_observations(self, project_id: str) -> DataFrame:
+    def percent_cover_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Bleaching percent cover of hard coral, macroalgae and
         soft coral observations.
 
         Args:
             project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -60,19 +257,166 @@ class Bleaching(BaseSummary):
         """
 
         url = f"/projects/{project_id}/bleachingqcs/obsquadratbenthicpercents/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
+
+    @requires_token
+    async def percent_cover_observations_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `percent_cover_observations`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/obsquadratbenthicpercents/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
 
     @requires_token
-    def sample_units(self, project_id: str) -> DataFrame:
+    def iter_percent_cover_observations(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[DataFrame]:
+        """
+        Retrieves a project's Bleaching percent cover of hard coral, macroalgae and
+        soft coral observations as a stream of DataFrames.
+
+        Records are streamed page by page from the API and are not cached, so the
+        whole project is never held in memory at once.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching observations.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            chunk_size (Optional[int]): The number of rows in each DataFrame.
+                Defaults to None, which yields one DataFrame per page.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Yields:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, Bleaching
+
+        auth = MermaidAuth()
+        bleaching = Bleaching(token=auth.get_token())
+        project_id = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+        for df in bleaching.iter_percent_cover_observations(project_id, chunk_size=5000):
+            print(len(df))
+        ```
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/obsquadratbenthicpercents/"
+        return self._iter_summary(
+            url, columns=columns, chunk_size=chunk_size, filters=filters
+        )
+
+    def percent_cover_observations_many(
+        self, project_ids: Iterable[str], columns: Optional[List[str]] = None, **kwargs
+    ) -> DataFrame:
+        """
+        Retrieves the Bleaching percent cover observations of many
+        projects as one DataFrame, fetching their pages concurrently, see
+        `BaseSummary.fetch_many`.
+
+        Args:
+            project_ids (Iterable[str]): The IDs of the projects.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            **kwargs: Passed to `fetch_many`.
+
+        Returns:
+            DataFrame
+
+        Examples:
+        ```
+        from seasnake import MermaidAuth, Bleaching
+
+        auth = MermaidAuth()
+        bleaching = Bleaching(token=auth.get_token())
+        project_ids = ["AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"]
+        print(bleaching.percent_cover_observations_many(project_ids))
+        ```
+        """
+
+        return self.fetch_many(
+            "percent_cover_observations", project_ids, columns=columns, **kwargs
+        )
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
+
+    @requires_token
+    def sample_units(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Bleaching observations aggregated by sample units.
 
         Args:
             project_id (str): The ID of the project for which to fetch Bleaching sample units.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -86,19 +430,89 @@ class Bleaching(BaseSummary):
         """
 
         url = f"/projects/{project_id}/bleachingqcs/sampleunits/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
 
     @requires_token
-    def sample_events(self, project_id: str) -> DataFrame:
+    async def sample_units_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `sample_units`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching sample units.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/sampleunits/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: Literal[False] = False,
+        **filters: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        *,
+        lazy: Literal[True],
+        **filters: Any,
+    ) -> SummaryQuery: ...
+
+    @overload
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]: ...
+
+    @requires_token
+    def sample_events(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        lazy: bool = False,
+        **filters: Any,
+    ) -> Union[DataFrame, SummaryQuery]:
         """
         Retrieves a project's Bleaching observations aggregated by sample events.
 
         Args:
             project_id (str): The ID of the project for which to fetch Bleaching sample events.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            lazy (bool): Whether to return a `SummaryQuery` that fetches the
+                summary only when it's collected. Defaults to False.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
-            DataFrame
+            Union[DataFrame, SummaryQuery]
 
         Examples:
         ```
@@ -112,5 +526,34 @@ class Bleaching(BaseSummary):
         """
 
         url = f"/projects/{project_id}/bleachingqcs/sampleevents/"
-        df = self.read_cache(url)
-        return self.to_cache(url, self.data_frame_from_url(url)) if df is None else df
+        return self._fetch_summary(url, columns=columns, filters=filters, lazy=lazy)
+
+    @requires_token
+    async def sample_events_async(
+        self,
+        project_id: str,
+        columns: Optional[List[str]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **filters: Any,
+    ) -> DataFrame:
+        """
+        Async version of `sample_events`.
+
+        Args:
+            project_id (str): The ID of the project for which to fetch Bleaching sample events.
+            columns (Optional[List[str]]): The columns to include in the DataFrame.
+                Defaults to None, which includes all columns.
+            semaphore (Optional[asyncio.Semaphore]): Limits the number of requests in
+                flight. Defaults to None.
+            **filters: Only records matching these filters, e.g.
+                `sample_date_after="2020-01-01"` or `site_ids=[...]`, see
+                `seasnake.filters.split_filters`.
+
+        Returns:
+            DataFrame
+        """
+
+        url = f"/projects/{project_id}/bleachingqcs/sampleevents/"
+        return await self._fetch_summary_async(
+            url, columns=columns, semaphore=semaphore, filters=filters
+        )
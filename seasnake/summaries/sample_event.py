@@ -1,4 +1,7 @@
+from typing import Any, List, Optional
+
 from ..base import DataFrame, MermaidBase
+from ..filters import apply_filters, filter_columns, split_filters
 
 
 class SampleEvent(MermaidBase):
@@ -7,7 +10,14 @@ class SampleEvent(MermaidBase):
     across various projects.
     """
 
-    def summary(self, limit_columns: bool = True, flatten: bool = True) -> DataFrame:
+    def summary(
+        self,
+        limit_columns: bool = True,
+        flatten: bool = True,
+        columns: Optional[List[str]] = None,
+        cache: bool = False,
+        **filters: Any,
+    ) -> DataFrame:
         """
         Get a summary of sample events data from MERMAID.
 
@@ -21,6 +31,18 @@ class SampleEvent(MermaidBase):
                 in the DataFrame. Defaults to True.
             flatten (bool, optional): Whether to flatten the 'protocols' column in
                 the DataFrame. Defaults to True.
+            columns (Optional[List[str]], optional): The columns to include in the
+                DataFrame, overriding the columns chosen by `limit_columns`. Only these
+                fields are decoded from the API response. Defaults to None.
+            cache (bool, optional): Whether to cache the summary, see
+                `MermaidBase.fetch_cached`. A cached summary is only checked for
+                changes by its number of sample events and its first sample event,
+                so other edits aren't noticed until the entry expires; set a
+                `CachePolicy(ttl=...)` to bound how long it's served. Defaults to
+                False.
+            **filters: Only sample events matching these filters, e.g.
+                `countries=["Fiji"]` or `sample_date_after="2020-01-01"`, see
+                `seasnake.filters.split_filters`.
 
         Returns:
             DataFrame
@@ -31,9 +53,10 @@ class SampleEvent(MermaidBase):
 
         sample_event = SampleEvent()
         print(sample_event.summary())
+        print(sample_event.summary(countries=["Fiji"], reef_types=["fringing"]))
         ```
         """
-        columns = [
+        default_columns = [
             "project",
             "tags",
             "country",
@@ -65,9 +88,15 @@ class SampleEvent(MermaidBase):
         }
 
         url = "/summarysampleevents/"
-        df = self.data_frame_from_url(
+        rename_columns = column_rename_map if limit_columns else None
+        columns = columns or (default_columns if limit_columns else None)
+        query_params, local = split_filters(url, filters, rename_columns)
+        fetch = self.fetch_cached if cache else self.data_frame_from_url
+        df = fetch(
             url,
-            columns=columns if limit_columns else None,
-            rename_columns=column_rename_map if limit_columns else None,
+            query_params=query_params or None,
+            columns=filter_columns(columns, local),
+            rename_columns=rename_columns,
         )
-        return self.flatten(df, "protocols") if flatten else df
+        df = apply_filters(df, local, columns)
+        return self.flatten(df, "protocols") if flatten and "protocols" in df else df
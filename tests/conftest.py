@@ -1,6 +1,30 @@
 import pandas as pd
 import pytest
 
+from seasnake import base
+from seasnake.cache import MEMORY_CACHE, client
+from seasnake.ratelimit import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter(monkeypatch):
+    limiter = RateLimiter(rate=1000, burst=1000, jitter=0)
+    monkeypatch.setattr(base, "RATE_LIMITER", limiter)
+    return limiter
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    # Every client caches downloads, so tests never share the working directory's cache.
+    monkeypatch.setattr(client, "CACHE_DIR", tmp_path / ".cache")
+    return client.CACHE_DIR
+
+
+@pytest.fixture(autouse=True)
+def memory_cache():
+    yield MEMORY_CACHE
+    MEMORY_CACHE.clear()
+
 
 @pytest.fixture
 def dataframe():
@@ -0,0 +1,35 @@
+from seasnake.adaptive import AdaptiveController
+from seasnake.base import MERMAID_API_URL, MermaidBase
+
+
+def test_backs_off_on_errors():
+    controller = AdaptiveController(page_size=1000, workers=8)
+    controller.record(0.1, errors=1)
+    assert controller.workers == 4
+
+    stats = controller.finish()
+    assert stats["errors"] == 1
+    assert controller.page_size == 500
+
+
+def test_grows_while_throughput_improves():
+    controller = AdaptiveController(page_size=1000, workers=2, max_workers=3)
+    for _ in range(2):
+        controller.record(0.1, num_bytes=10)
+    assert controller.workers == 3
+
+    controller.finish()
+    assert controller.page_size == 2000
+    assert controller.stats()["bytes"] == 20
+
+
+def test_adaptive_client(requests_mock):
+    url = f"{MERMAID_API_URL}/records/"
+    requests_mock.get(url, json={"count": 3000, "results": [{"id": "1"}]})
+    client = MermaidBase(adaptive=True, num_threads=2)
+
+    assert len(list(client.fetch_list(url, query_params={"limit": 1000}))) == 3
+    stats = client.controller.stats()
+    assert stats["responses"] == 3
+    assert stats["pages_per_second"] > 0
+    assert client.page_size == 2000
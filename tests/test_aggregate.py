@@ -0,0 +1,168 @@
+import re
+
+import pandas as pd
+import pytest
+
+from seasnake import aggregate
+from seasnake.base import MERMAID_API_URL
+from seasnake.summaries import BenthicPIT
+
+
+@pytest.fixture
+def fish_observations():
+    return pd.DataFrame(
+        {
+            "sample_event_id": ["se1", "se1", "se1", "se2"],
+            "sample_unit_id": ["su1", "su1", "su2", "su3"],
+            "site_name": ["Site A", "Site A", "Site A", "Site B"],
+            "transect_number": [1, 1, 2, 1],
+            "depth": [5.0, 5.0, 7.0, 3.0],
+            "trophic_group": ["piscivore", "omnivore", "piscivore", "omnivore"],
+            "fish_family": ["Lutjanidae", "Pomacentridae", "Lutjanidae", "Labridae"],
+            "count": [2, 10, 1, 4],
+            "biomass_kgha": [20.0, 5.0, 40.0, 8.0],
+        }
+    ).astype({"trophic_group": "category", "sample_unit_id": "category"})
+
+
+def test_beltfish_sample_units(fish_observations):
+    df = aggregate.sample_units("beltfish", fish_observations)
+
+    assert df["sample_unit_id"].tolist() == ["su1", "su2", "su3"]
+    assert df["biomass_kgha"].tolist() == [25.0, 40.0, 8.0]
+    assert df["total_abundance"].tolist() == [12, 1, 4]
+    assert df["site_name"].tolist() == ["Site A", "Site A", "Site B"]
+    assert df["biomass_kgha_trophic_group"][0] == {"omnivore": 5.0, "piscivore": 20.0}
+    assert df["biomass_kgha_fish_family"][2]["Labridae"] == 8.0
+
+
+def test_beltfish_sample_events(fish_observations):
+    df = aggregate.sample_events(aggregate.sample_units("beltfish", fish_observations))
+
+    assert df["sample_event_id"].tolist() == ["se1", "se2"]
+    assert df["sample_unit_count"].tolist() == [2, 1]
+    assert df["biomass_kgha_avg"].tolist() == [32.5, 8.0]
+    assert df["biomass_kgha_sd"][0] == pytest.approx(10.6066, rel=1e-4)
+    assert df["depth_avg"].tolist() == [6.0, 3.0]
+    assert df["biomass_kgha_trophic_group_avg"][0] == {
+        "omnivore": 2.5,
+        "piscivore": 30.0,
+    }
+    assert "transect_number_avg" not in df.columns
+
+
+def test_benthic_percent_cover():
+    observations = pd.DataFrame(
+        {
+            "sample_event_id": ["se1"] * 5,
+            "sample_unit_id": ["su1"] * 4 + ["su2"],
+            "benthic_category": ["Hard coral", "Hard coral", "Sand", "Sand", "Sand"],
+            "length": [10.0, 30.0, 60.0, 0.0, 5.0],
+        }
+    )
+
+    pit = aggregate.sample_units("benthicpit", observations)
+    assert pit["percent_cover_benthic_category"][0] == {"Hard coral": 50, "Sand": 50}
+    lit = aggregate.sample_units("benthiclit", observations)
+    assert lit["percent_cover_benthic_category"][0] == {"Hard coral": 40, "Sand": 60}
+    assert lit["percent_cover_benthic_category"][1] == {"Hard coral": 0, "Sand": 100}
+
+    events = aggregate.sample_events(lit)
+    assert events["percent_cover_benthic_category_avg"][0] == {
+        "Hard coral": 20,
+        "Sand": 80,
+    }
+
+
+def test_bleaching_sample_units():
+    colonies = pd.DataFrame(
+        {
+            "sample_unit_id": ["su1", "su1"],
+            "benthic_attribute": ["Acropora", "Porites"],
+            "count_normal": [6, 2],
+            "count_pale": [1, 0],
+            "count_20": [1, 0],
+            "count_50": [0, 0],
+            "count_80": [0, 0],
+            "count_100": [0, 0],
+            "count_dead": [0, 0],
+        }
+    )
+    percent_cover = pd.DataFrame(
+        {
+            "sample_unit_id": ["su1", "su1", "su2"],
+            "quadrat_number": [1, 2, 1],
+            "percent_hard": [10.0, 30.0, 5.0],
+        }
+    )
+
+    df = aggregate.sample_units("bleachingqc", colonies, percent_cover)
+    assert df["sample_unit_id"].tolist() == ["su1", "su2"]
+    assert df["count_total"][0] == 10
+    assert df["count_genera"][0] == 2
+    assert df["percent_normal"][0] == 80
+    assert df["percent_bleached"][0] == 10
+    assert df["quadrat_count"].tolist() == [2, 1]
+    assert df["percent_hard_avg"].tolist() == [20.0, 5.0]
+
+
+def test_unknown_protocol():
+    with pytest.raises(ValueError):
+        aggregate.sample_units("unknown", pd.DataFrame())
+
+
+def test_validate(fish_observations):
+    local = aggregate.sample_units("beltfish", fish_observations)
+    server = pd.DataFrame(
+        {
+            "id": ["psu1", "psu2"],
+            "sample_unit_ids": [["su1"], ["su2", "su3"]],
+            "biomass_kgha": [25.0, 40.0],
+            "biomass_kgha_trophic_group": [
+                {"piscivore": 20.0, "omnivore": 5.0},
+                {"piscivore": 40.0},
+            ],
+        }
+    )
+
+    differences = aggregate.validate(local, server, "sample_unit_id")
+    assert differences["sample_unit_id"].tolist() == ["su3", "su3"]
+    assert differences["column"].tolist() == [
+        "biomass_kgha",
+        "biomass_kgha_trophic_group",
+    ]
+
+    matching = server.assign(biomass_kgha=[25.0, 40.0000001])
+    assert aggregate.validate(local[:2], matching[:1], "sample_unit_id")[
+        "column"
+    ].tolist() == ["sample_unit_id"]
+
+
+def test_summary_aggregate(requests_mock):
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/abc/benthicpits/obstransect.+"),
+        json={
+            "count": 2,
+            "results": [
+                {
+                    "id": str(i),
+                    "sample_event_id": "se1",
+                    "sample_unit_id": "su1",
+                    "benthic_category": category,
+                    "created_on": "2023-01-01T00:00:00Z",
+                }
+                for i, category in enumerate(["Hard coral", "Sand"])
+            ],
+        },
+    )
+    benthic_pit = BenthicPIT(token="token")
+
+    sample_units = benthic_pit.aggregate("abc")
+    assert sample_units["percent_cover_benthic_category"][0] == {
+        "Hard coral": 50,
+        "Sand": 50,
+    }
+    sample_events = benthic_pit.aggregate("abc", level="sample_events")
+    assert sample_events["sample_unit_count"].tolist() == [1]
+    with pytest.raises(ValueError):
+        benthic_pit.aggregate("abc", level="observations")
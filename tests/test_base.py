@@ -0,0 +1,211 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from seasnake.base import MERMAID_API_URL, MermaidBase
+from seasnake.schemas import FIELDS_PARAMS
+
+
+@pytest.fixture
+def records_url():
+    return f"{MERMAID_API_URL}/records/"
+
+
+def test_session_is_reused(requests_mock, records_url):
+    requests_mock.get(records_url, json={"count": 0, "results": []})
+    client = MermaidBase()
+    session = client.session
+
+    client.fetch(records_url)
+    client.fetch(records_url)
+
+    assert client.session is session
+    assert requests_mock.call_count == 2
+
+
+def test_session_pool_size():
+    client = MermaidBase(num_threads=3)
+    adapter = client.session.get_adapter(MERMAID_API_URL)
+    assert adapter._pool_maxsize == 3
+
+
+def test_close_session():
+    with MermaidBase() as client:
+        session = client.session
+    assert client._session is None
+    assert client.session is not session
+
+
+@pytest.fixture
+def paged_records_mock(requests_mock, records_url):
+    requests_mock.get(
+        records_url,
+        json={"count": 2500, "results": [{"id": "1"}]},
+    )
+    requests_mock.get(
+        f"{records_url}?page=2", json={"count": 2500, "results": [{"id": "2"}]}
+    )
+    requests_mock.get(
+        f"{records_url}?page=3", json={"count": 2500, "results": [{"id": "3"}]}
+    )
+
+
+def test_fetch_list_async(paged_records_mock, records_url):
+    async def collect():
+        client = MermaidBase()
+        return [r async for r in client.fetch_list_async(records_url)]
+
+    records = asyncio.run(collect())
+    assert [r["id"] for r in records] == ["1", "2", "3"]
+
+
+def test_data_frame_from_url_async_shared_semaphore(paged_records_mock, records_url):
+    async def collect():
+        semaphore = asyncio.Semaphore(2)
+        client = MermaidBase()
+        return await asyncio.gather(
+            client.data_frame_from_url_async(records_url, semaphore=semaphore),
+            client.data_frame_from_url_async(records_url, semaphore=semaphore),
+        )
+
+    for df in asyncio.run(collect()):
+        assert df["id"].tolist() == ["1", "2", "3"]
+
+
+def test_fetch_list_ordered_bounded_prefetch(requests_mock, records_url):
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def page_records(request, context):
+        page = int(request.qs.get("page", ["1"])[0])
+        with lock:
+            in_flight.append(page)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01 * (10 - page))
+        with lock:
+            in_flight.remove(page)
+        return {"count": 9000, "results": [{"page": page}]}
+
+    requests_mock.get(records_url, json=page_records)
+    client = MermaidBase(num_threads=4)
+    records = list(client.fetch_list(records_url, prefetch=2))
+
+    assert [r["page"] for r in records] == list(range(1, 10))
+    assert max(max_in_flight) <= 2
+
+
+def test_fetch_pages_async_bounded_prefetch(requests_mock, records_url):
+    requested = []
+
+    def page_records(request, context):
+        page = int(request.qs.get("page", ["1"])[0])
+        requested.append(page)
+        return {"count": 9000, "results": [{"page": page}]}
+
+    requests_mock.get(records_url, json=page_records)
+
+    async def collect():
+        client = MermaidBase(num_threads=4)
+        pages = []
+        async for result in client.fetch_pages_async(records_url, prefetch=2):
+            page = result["results"][0]["page"]
+            await asyncio.sleep(0.02)
+            assert max(requested) <= page + 2
+            pages.append(page)
+        return pages
+
+    assert asyncio.run(collect()) == list(range(1, 10))
+
+
+def test_iter_data_frames(paged_records_mock, records_url):
+    client = MermaidBase()
+    pages = list(client.iter_data_frames(records_url))
+    assert [df["id"].tolist() for df in pages] == [["1"], ["2"], ["3"]]
+
+    chunks = list(client.iter_data_frames(records_url, chunk_size=2))
+    assert [df["id"].tolist() for df in chunks] == [["1", "2"], ["3"]]
+
+
+def test_data_frame_from_url_projection(requests_mock, records_url, monkeypatch):
+    monkeypatch.setitem(FIELDS_PARAMS, "records", "fields")
+    requests_mock.get(
+        records_url,
+        json={"count": 1, "results": [{"id": "1", "site_name": "A", "notes": "x"}]},
+    )
+    client = MermaidBase()
+    df = client.data_frame_from_url(
+        records_url, columns=["site", "id"], rename_columns={"site_name": "site"}
+    )
+
+    assert df.columns.tolist() == ["site", "id"]
+    assert requests_mock.last_request.qs["fields"] == ["site_name,id"]
+
+
+def test_data_frame_from_url_stream(requests_mock):
+    records_url = f"{MERMAID_API_URL}/projects/abc/beltfishes/obstransectbeltfishes/"
+    records = [
+        {"id": str(n), "site_name": f"Reef {n % 3}", "latitude": n} for n in range(7)
+    ]
+    for page in range(1, 8):
+        requests_mock.get(
+            f"{records_url}?page={page}" if page > 1 else records_url,
+            json={"count": 7000, "results": [records[page - 1]]},
+        )
+    client = MermaidBase(num_threads=3)
+
+    streamed = client.data_frame_from_url(records_url, stream=True)
+    decoded = client.data_frame_from_url(records_url)
+
+    assert streamed["id"].tolist() == [str(n) for n in range(7)]
+    assert str(streamed["site_name"].dtype) == "category"
+    assert streamed.equals(decoded)
+
+
+def test_fetch_timeout(requests_mock, records_url):
+    requests_mock.get(records_url, json={"count": 0, "results": []})
+    client = MermaidBase(timeout=(1, 2))
+
+    client.fetch(records_url)
+    client.fetch(records_url, timeout=(3, 4))
+
+    assert [r.timeout for r in requests_mock.request_history] == [(1, 2), (3, 4)]
+
+
+def test_fetch_pages_deadline(requests_mock, records_url):
+    def page_records(request, context):
+        time.sleep(0.05)
+        return {"count": 9000, "results": [{"id": "1"}]}
+
+    requests_mock.get(records_url, json=page_records)
+    client = MermaidBase(num_threads=1)
+
+    with pytest.raises(TimeoutError):
+        list(client.fetch_list(records_url, deadline=0.12))
+    assert requests_mock.request_history[-1].timeout[1] <= 0.12
+
+
+def test_fetch_pages_hedged(records_url):
+    # requests_mock serializes requests, so stub `fetch` to let pages overlap.
+    slow_requests = []
+
+    def fetch(url, payload=None, params=None, **kwargs):
+        page = (params or {}).get("page", 1)
+        if page == 8 and not slow_requests:
+            slow_requests.append(page)
+            time.sleep(1)
+            return {"count": 9000, "results": [{"page": page, "hedged": False}]}
+        time.sleep(0.01)
+        return {"count": 9000, "results": [{"page": page, "hedged": page == 8}]}
+
+    client = MermaidBase(num_threads=2, hedge_percentile=90)
+    client.fetch = fetch
+
+    started = time.monotonic()
+    records = list(client.fetch_list(records_url))
+
+    assert time.monotonic() - started < 0.8
+    assert [r["page"] for r in records] == list(range(1, 10))
+    assert records[7]["hedged"]
@@ -0,0 +1,23 @@
+from seasnake.cache import ParquetBackend, PickleBackend
+from seasnake.cache.benchmark import benchmark, synthetic_observations
+
+
+def test_synthetic_observations():
+    df = synthetic_observations(num_rows=100)
+    assert len(df) == 100
+    assert df["id"].is_unique
+    assert df["site_name"].dtype == "category"
+
+
+def test_benchmark(tmp_path):
+    backends = [PickleBackend(compression="none"), ParquetBackend()]
+    results = benchmark(
+        synthetic_observations(num_rows=100),
+        backends=backends,
+        repeat=1,
+        directory=tmp_path,
+    )
+
+    assert sorted(results["backend"]) == ["ParquetBackend", "PickleBackend"]
+    assert (results[["bytes", "write_mb_s", "read_mb_s"]] > 0).all().all()
+    assert not list(tmp_path.iterdir())
@@ -1,12 +1,24 @@
-import os
-import shutil
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import jwt
 import pytest
-from pandas import DataFrame
+from pandas import Categorical, DataFrame, to_datetime
 
+from seasnake import Project
 from seasnake.base import MERMAID_API_URL
-from seasnake.summaries import BenthicPIT, base
+from seasnake.cache import (
+    ArrowBackend,
+    CachePolicy,
+    ParquetBackend,
+    PickleBackend,
+    client,
+)
+from seasnake.schemas import FIELDS_PARAMS
+from seasnake.summaries import BenthicPIT, SampleEvent
 
 
 @pytest.fixture
@@ -16,8 +28,10 @@ def project_id():
 
 @pytest.fixture
 def api_one_record(project_id):
+    # The response to the `limit=1` request used to validate the cache, so `count`
+    # is the total number of records.
     return {
-        "count": 1,
+        "count": 2,
         "results": [
             {
                 "id": "1",
@@ -72,13 +86,8 @@ def benthic_pit_obs_url(benthic_pit_obs_url_path):
 
 
 @pytest.fixture
-def cache_dir_path():
-    original_cache_dir = base.CACHE_DIR
-    test_cache_dir = Path(os.getcwd(), ".cache-test")
-    base.CACHE_DIR = test_cache_dir
-    yield
-    base.CACHE_DIR = original_cache_dir
-    shutil.rmtree(test_cache_dir, ignore_errors=True)
+def cache_dir_path(cache_dir):
+    return cache_dir
 
 
 @pytest.fixture
@@ -114,9 +123,7 @@ def test_write_cache(
     benthic_pit_mock_limit_1000,
 ):
     pit = BenthicPIT()
-    cache_file_path, cache_idx_file_path = pit.get_cache_file_paths(
-        benthic_pit_obs_url
-    )
+    cache_file_path, cache_idx_file_path = pit.get_cache_file_paths(benthic_pit_obs_url)
 
     assert Path(cache_file_path).exists() is False
     assert Path(cache_idx_file_path).exists() is False
@@ -155,3 +162,579 @@ def test_read_no_cache(project_id, benthic_pit_mock_limit_1, benthic_pit_obs_url
     pit = BenthicPIT()
     df = pit.read_cache(benthic_pit_obs_url_path)
     assert df is None
+
+
+def test_read_cache_async(project_id, bentic_pit_cache, benthic_pit_mock_limit_1):
+    pit = BenthicPIT()
+    df = asyncio.run(pit.observations_async(project_id=project_id))
+    assert len(df) == 2
+
+
+def test_write_cache_async(
+    project_id,
+    cache_dir_path,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    benthic_pit_mock_limit_1000,
+):
+    pit = BenthicPIT()
+    cache_file_path, _ = pit.get_cache_file_paths(benthic_pit_obs_url)
+
+    df = asyncio.run(pit.observations_async(project_id=project_id))
+    assert len(df) == 2
+    assert Path(cache_file_path).exists()
+
+
+def test_iter_observations_skips_cache(
+    project_id, cache_dir_path, benthic_pit_obs_url, benthic_pit_mock_limit_1000
+):
+    pit = BenthicPIT()
+    cache_file_path, _ = pit.get_cache_file_paths(benthic_pit_obs_url)
+
+    chunks = list(pit.iter_observations(project_id=project_id, chunk_size=1))
+    assert [len(df) for df in chunks] == [1, 1]
+    assert Path(cache_file_path).exists() is False
+
+
+def test_projected_columns_cache(
+    project_id,
+    cache_dir_path,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    benthic_pit_mock_limit_1000,
+):
+    pit = BenthicPIT()
+    df = pit.observations(project_id=project_id, columns=["name"])
+    assert df.columns.tolist() == ["name"]
+
+    cache_file_path, _ = pit.get_cache_file_paths(
+        benthic_pit_obs_url, {"columns": "name"}
+    )
+    assert Path(cache_file_path).exists()
+    assert pit.read_cache(benthic_pit_obs_url) is None
+
+    df = pit.observations(project_id=project_id, columns=["name"])
+    assert df["name"].tolist() == ["John Doe", "Jane Doe"]
+
+
+@pytest.mark.parametrize("backend", [PickleBackend(), ParquetBackend(), ArrowBackend()])
+def test_cache_backend_projection(tmp_path, backend):
+    df = DataFrame(
+        {
+            "site_name": Categorical(["Reef A", "Reef B", "Reef A"]),
+            "count": [1, 2, 3],
+            "created_on": to_datetime(["2023-01-01"] * 3, utc=True),
+        }
+    )
+    path = tmp_path / f"frame{backend.extension}"
+    backend.write(path, df)
+
+    assert backend.read(path).equals(df)
+    projected = backend.read(
+        path, columns=["count", "missing"], filters=[("site_name", "==", "Reef A")]
+    )
+    assert projected.columns.tolist() == ["count"]
+    assert projected["count"].tolist() == [1, 3]
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "bz2", "xz"])
+def test_pickle_backend_codecs(tmp_path, compression):
+    backend = PickleBackend(compression=compression, compression_level=5)
+    df = DataFrame({"site_name": ["Reef A", "Reef B"], "count": [1, 2]})
+    path = tmp_path / f"frame{backend.extension}"
+    backend.write(path, df)
+
+    assert backend.read(path).equals(df)
+    assert PickleBackend().extension == ".tar.gz"
+    assert len({PickleBackend(c).extension for c in ("none", "bz2", "xz")}) == 3
+
+
+def test_unsupported_codec():
+    with pytest.raises(ValueError):
+        ParquetBackend(compression="xz")
+    with pytest.raises(ValueError):
+        ArrowBackend(compression="gzip")
+
+
+def test_read_cache_columns(
+    project_id,
+    cache_dir_path,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    benthic_pit_mock_limit_1000,
+):
+    pit = BenthicPIT(cache_backend=ArrowBackend())
+    pit.to_cache(benthic_pit_obs_url, pit.data_frame_from_url(benthic_pit_obs_url))
+    cache_file_path, _ = pit.get_cache_file_paths(benthic_pit_obs_url)
+    assert cache_file_path.suffix == ".arrow"
+
+    df = pit.observations(project_id=project_id, columns=["name"])
+    assert df["name"].tolist() == ["John Doe", "Jane Doe"]
+    assert not pit.get_cache_file_paths(benthic_pit_obs_url, {"columns": "name"})[
+        0
+    ].exists()
+
+
+def test_backends_share_cache_dir(
+    project_id, cache_dir_path, requests_mock, benthic_pit_obs_url, delta_records
+):
+    parquet_pit = BenthicPIT(cache_backend=ParquetBackend())
+    pickle_pit = BenthicPIT(cache_backend=PickleBackend())
+    record = delta_records["cached"][0]
+    requests_mock.get(benthic_pit_obs_url, json={"count": 1, "results": [record]})
+    # The second read records the first record's hash in the entry's index.
+    parquet_pit.observations(project_id=project_id)
+    parquet_pit.observations(project_id=project_id)
+
+    changed = {**record, "name": "Jim Doe"}
+    requests_mock.get(benthic_pit_obs_url, json={"count": 1, "results": [changed]})
+    pickle_pit.observations(project_id=project_id)
+
+    df = parquet_pit.observations(project_id=project_id)
+    assert df["name"].tolist() == ["Jim Doe"]
+    assert len(parquet_pit.cache.entries()) == 2
+    assert (
+        parquet_pit.get_cache_file_paths(benthic_pit_obs_url)[1]
+        != pickle_pit.get_cache_file_paths(benthic_pit_obs_url)[1]
+    )
+
+
+def test_unsupported_frame_not_cached(cache_dir_path, benthic_pit_obs_url):
+    pit = BenthicPIT(cache_backend=ParquetBackend())
+    df = DataFrame({"count": [1, "a"], "created_on": ["2023-01-01"] * 2})
+
+    with pytest.warns(UserWarning):
+        assert pit.to_cache(benthic_pit_obs_url, df) is df
+    assert not pit.get_cache_file_paths(benthic_pit_obs_url)[0].exists()
+
+
+@pytest.fixture
+def delta_records(project_id):
+    def record(id, name, created_on, updated_on):
+        return {
+            "id": id,
+            "name": name,
+            "project_id": project_id,
+            "created_on": created_on,
+            "updated_on": updated_on,
+        }
+
+    return {
+        "cached": [
+            record("1", "John Doe", "2023-01-01T00:00:00Z", "2023-01-01T00:00:00Z"),
+            record("2", "Jane Doe", "2023-01-01T00:00:00Z", "2023-01-01T00:00:00Z"),
+        ],
+        "delta": [
+            record("3", "Jim Doe", "2023-02-01T00:00:00Z", "2023-02-01T00:00:00Z"),
+            record("2", "Jane Roe", "2023-01-01T00:00:00Z", "2023-02-01T00:00:00Z"),
+        ],
+    }
+
+
+def test_delta_refresh(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    delta_records,
+    monkeypatch,
+):
+    monkeypatch.setitem(FIELDS_PARAMS, "benthicpits", "fields")
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    def changed_records(request, context):
+        if "updated_on_after" in request.qs:
+            return {"count": 2, "results": delta_records["delta"]}
+        if "fields" in request.qs:
+            return {"count": 3, "results": [{"id": id} for id in ("1", "2", "3")]}
+        return {"count": 3, "results": delta_records["delta"][:1]}
+
+    requests_mock.get(benthic_pit_obs_url, json=changed_records)
+    requests_mock.reset_mock()
+    df = pit.observations(project_id=project_id)
+
+    assert sorted(df["name"].tolist()) == ["Jane Roe", "Jim Doe", "John Doe"]
+    assert any(
+        r.qs.get("updated_on_after") == ["2023-01-01t00:00:00+00:00"]
+        for r in requests_mock.request_history
+    )
+    # The state the cache was checked against isn't requested again.
+    assert [r.qs.get("limit") for r in requests_mock.request_history].count(["1"]) == 1
+    assert pit.read_cache(benthic_pit_obs_url)["id"].tolist() == ["3", "2", "1"]
+
+
+def test_delta_refresh_deletions(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    delta_records,
+    monkeypatch,
+):
+    monkeypatch.setitem(FIELDS_PARAMS, "benthicpits", "fields")
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    def remaining_records(request, context):
+        if "updated_on_after" in request.qs:
+            return {"count": 0, "results": []}
+        if "fields" in request.qs:
+            return {"count": 1, "results": [{"id": "1"}]}
+        return {"count": 1, "results": delta_records["cached"][:1]}
+
+    requests_mock.get(benthic_pit_obs_url, json=remaining_records)
+    df = pit.observations(project_id=project_id)
+
+    assert df["id"].tolist() == ["1"]
+
+
+def test_delta_refresh_deletion_and_addition(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    delta_records,
+    monkeypatch,
+):
+    monkeypatch.setitem(FIELDS_PARAMS, "benthicpits", "fields")
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    # Record 1 is deleted and record 3 added, so the count is unchanged.
+    added = delta_records["delta"][0]
+
+    def changed_records(request, context):
+        if "updated_on_after" in request.qs:
+            return {"count": 1, "results": [added]}
+        if "fields" in request.qs:
+            return {"count": 2, "results": [{"id": "2"}, {"id": "3"}]}
+        return {"count": 2, "results": [added]}
+
+    requests_mock.get(benthic_pit_obs_url, json=changed_records)
+    df = pit.observations(project_id=project_id)
+
+    assert sorted(df["id"].tolist()) == ["2", "3"]
+
+
+def test_delta_refresh_without_fields_param(
+    project_id, cache_dir_path, requests_mock, benthic_pit_obs_url, delta_records
+):
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    current = [delta_records["delta"][0], delta_records["cached"][1]]
+    requests_mock.get(benthic_pit_obs_url, json={"count": 2, "results": current})
+    df = pit.observations(project_id=project_id)
+
+    # Deletions can't be ruled out, so the entry is downloaded in full.
+    assert sorted(df["id"].tolist()) == ["2", "3"]
+
+
+def test_delta_refresh_without_fields_param_requests(
+    project_id, cache_dir_path, requests_mock, benthic_pit_obs_url, delta_records
+):
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    current = [delta_records["delta"][0], delta_records["cached"][1]]
+    requests_mock.get(benthic_pit_obs_url, json={"count": 2, "results": current})
+    requests_mock.reset_mock()
+    pit.observations(project_id=project_id)
+
+    # The cache is checked once and then downloaded, without a delta request.
+    limits = [r.qs.get("limit") for r in requests_mock.request_history]
+    assert limits[0] == ["1"]
+    assert ["1"] not in limits[1:]
+    assert not any("updated_on_after" in r.qs for r in requests_mock.request_history)
+
+
+def test_delta_refresh_all_deleted(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    delta_records,
+    monkeypatch,
+):
+    monkeypatch.setitem(FIELDS_PARAMS, "benthicpits", "fields")
+    pit = BenthicPIT()
+    requests_mock.get(
+        benthic_pit_obs_url, json={"count": 2, "results": delta_records["cached"]}
+    )
+    pit.observations(project_id=project_id)
+
+    requests_mock.get(benthic_pit_obs_url, json={"count": 0, "results": []})
+    df = pit.observations(project_id=project_id)
+
+    assert df.empty
+
+
+def test_read_cache_miss_sends_no_request(
+    requests_mock, cache_dir_path, benthic_pit_obs_url
+):
+    pit = BenthicPIT()
+    assert pit.read_cache(benthic_pit_obs_url) is None
+    assert requests_mock.call_count == 0
+
+
+def test_cache_policy_ttl(
+    project_id, bentic_pit_cache, requests_mock, benthic_pit_obs_url
+):
+    pit = BenthicPIT(cache_policy=CachePolicy(ttl=60))
+    df = pit.observations(project_id=project_id)
+
+    assert len(df) == 2
+    assert requests_mock.call_count == 0
+
+
+def test_cache_policy_conditional_request(
+    project_id, bentic_pit_cache, requests_mock, benthic_pit_obs_url, api_one_record
+):
+    requests_mock.get(
+        f"{benthic_pit_obs_url}?limit=1", json=api_one_record, headers={"ETag": '"v1"'}
+    )
+    pit = BenthicPIT()
+    pit.observations(project_id=project_id)
+
+    requests_mock.get(f"{benthic_pit_obs_url}?limit=1", status_code=304)
+    df = pit.observations(project_id=project_id)
+
+    assert len(df) == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+
+def test_cache_policy_max_stale(
+    project_id, bentic_pit_cache, requests_mock, benthic_pit_obs_url
+):
+    requests_mock.get(f"{benthic_pit_obs_url}?limit=1", status_code=500)
+
+    with pytest.raises(Exception):
+        BenthicPIT().observations(project_id=project_id)
+
+    pit = BenthicPIT(cache_policy=CachePolicy(max_stale=60))
+    with pytest.warns(UserWarning):
+        assert len(pit.observations(project_id=project_id)) == 2
+
+
+def test_stale_while_revalidate(
+    project_id, bentic_pit_cache, requests_mock, benthic_pit_obs_url, api_records
+):
+    api_records["results"][0]["created_on"] = "2023-02-01 00:00:00"
+    requests_mock.get(benthic_pit_obs_url, json=api_records)
+    refreshed = []
+    done = threading.Event()
+
+    def on_refresh(url, df):
+        refreshed.append(df)
+        done.set()
+
+    pit = BenthicPIT(
+        cache_policy=CachePolicy(stale_while_revalidate=60), on_refresh=on_refresh
+    )
+    df = pit.observations(project_id=project_id)
+
+    assert len(df) == 2
+    assert done.wait(5)
+    assert str(refreshed[0]["created_on"].max()) == "2023-02-01 00:00:00+00:00"
+    assert pit.read_cache(benthic_pit_obs_url)["created_on"].max() == (
+        refreshed[0]["created_on"].max()
+    )
+
+
+def test_revalidate_single_flight(
+    bentic_pit_cache, requests_mock, benthic_pit_obs_url, api_one_record
+):
+    def slow_record(request, context):
+        time.sleep(0.1)
+        return api_one_record
+
+    requests_mock.get(benthic_pit_obs_url, json=slow_record)
+    pit = BenthicPIT()
+    future = pit.revalidate(benthic_pit_obs_url)
+
+    assert pit.revalidate(benthic_pit_obs_url) is future
+    assert future.result(timeout=5) is None
+    assert requests_mock.call_count == 1
+
+
+def test_cache_store_records_entries(
+    project_id,
+    cache_dir_path,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    benthic_pit_mock_limit_1000,
+):
+    pit = BenthicPIT()
+    pit.observations(project_id=project_id)
+    pit.observations(project_id=project_id)
+
+    stats = pit.cache.stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1
+    assert pit.cache.clear(project_id=project_id) == 1
+    assert not pit.get_cache_file_paths(benthic_pit_obs_url)[0].exists()
+
+
+def test_download_single_flight(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    api_records,
+):
+    def slow_records(request, context):
+        time.sleep(0.2)
+        return api_records
+
+    requests_mock.get(f"{benthic_pit_obs_url}?limit=1000", json=slow_records)
+    results = []
+
+    def observations():
+        results.append(BenthicPIT().observations(project_id=project_id))
+
+    threads = [threading.Thread(target=observations) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(df) for df in results] == [2, 2, 2]
+    downloads = [r for r in requests_mock.request_history if r.qs["limit"] == ["1000"]]
+    assert len(downloads) == 1
+    assert not list(client.CACHE_DIR.glob("*.tmp"))
+
+
+def test_download_single_flight_async(
+    project_id,
+    cache_dir_path,
+    requests_mock,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    api_records,
+):
+    def slow_records(request, context):
+        time.sleep(0.2)
+        return api_records
+
+    requests_mock.get(f"{benthic_pit_obs_url}?limit=1000", json=slow_records)
+
+    async def observations():
+        # More identical calls than the default executor has threads.
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+        calls = [BenthicPIT().observations_async(project_id) for _ in range(6)]
+        return await asyncio.wait_for(asyncio.gather(*calls), timeout=10)
+
+    results = asyncio.run(observations())
+
+    assert [len(df) for df in results] == [2] * 6
+    downloads = [r for r in requests_mock.request_history if r.qs["limit"] == ["1000"]]
+    assert len(downloads) == 1
+
+
+def test_memory_cache_skips_disk(
+    project_id,
+    cache_dir_path,
+    benthic_pit_obs_url,
+    benthic_pit_mock_limit_1,
+    benthic_pit_mock_limit_1000,
+    monkeypatch,
+):
+    pit = BenthicPIT(cache_policy=CachePolicy(ttl=60))
+    pit.observations(project_id=project_id)
+
+    def read(*args, **kwargs):
+        raise AssertionError("read from disk")
+
+    monkeypatch.setattr(pit.cache_backend, "read", read)
+    df = pit.observations(project_id=project_id)
+    df["name"] = "changed"
+
+    assert pit.observations(project_id=project_id)["name"].tolist() == [
+        "John Doe",
+        "Jane Doe",
+    ]
+
+
+def test_my_projects_cached_per_user(requests_mock):
+    url = f"{MERMAID_API_URL}/projects/"
+    requests_mock.get(url, json={"count": 1, "results": [{"id": "1", "name": "A"}]})
+    tokens = [jwt.encode({"sub": sub}, "x" * 32) for sub in ("user-1", "user-2")]
+
+    for token in (tokens[0], tokens[0], tokens[1]):
+        assert Project(token=token).my_projects(cache=True)["name"].tolist() == ["A"]
+
+    limits = [r.qs["limit"] for r in requests_mock.request_history]
+    assert limits == [["1000"], ["1"], ["1000"]]
+    assert Project().cache.stats()["entries"] == 2
+
+
+def test_projects_uncached_by_default(requests_mock):
+    url = f"{MERMAID_API_URL}/projects/"
+    records = [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]
+    requests_mock.get(url, json={"count": 2, "results": records})
+    project = Project()
+    project.search_projects()
+
+    # A project other than the first one changes.
+    records[1]["name"] = "C"
+    assert project.search_projects()["name"].tolist() == ["A", "C"]
+    assert project.cache.stats()["entries"] == 0
+
+
+def test_search_projects_cache_without_created_on(requests_mock):
+    url = f"{MERMAID_API_URL}/projects/"
+    records = [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]
+    requests_mock.get(url, json={"count": 2, "results": records})
+    project = Project()
+
+    assert len(project.search_projects(tags="WCS Fiji", cache=True)) == 2
+    assert len(project.search_projects(tags="WCS Fiji", cache=True)) == 2
+    probe = requests_mock.request_history[-1]
+    assert probe.qs["limit"] == ["1"]
+    assert probe.qs["tags"] == ["wcs fiji"]
+    assert probe.qs["showall"] == ["t"]
+
+    # The first record changes without changing the number of records.
+    records[0]["name"] = "C"
+    df = project.search_projects(tags="WCS Fiji", cache=True)
+    assert df["name"].tolist() == ["C", "B"]
+    assert requests_mock.request_history[-1].qs["limit"] == ["1000"]
+
+
+def test_sample_event_summary_cached(requests_mock):
+    url = f"{MERMAID_API_URL}/summarysampleevents/"
+    record = {
+        "id": "1",
+        "project_name": "Project A",
+        "site_name": "Reef A",
+        "protocols": {"beltfish": {"sample_unit_count": 2}},
+    }
+    requests_mock.get(url, json={"count": 1, "results": [record]})
+    sample_event = SampleEvent(cache_policy=CachePolicy(ttl=60))
+
+    df = sample_event.summary(cache=True)
+    assert sample_event.summary(cache=True).equals(df)
+    assert df["protocols.beltfish.sample_unit_count"].tolist() == [2]
+    assert df["site"].tolist() == ["Reef A"]
+    assert requests_mock.call_count == 1
+
+    assert sample_event.summary().equals(df)
+    assert requests_mock.call_count == 2
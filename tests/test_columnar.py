@@ -0,0 +1,81 @@
+import pytest
+
+from seasnake.columnar import ColumnarDecoder
+from seasnake.schemas import SCHEMAS, get_schema, register_schema
+
+
+def test_get_schema():
+    assert get_schema("/projects/abc/beltfishes/sampleunits/") is SCHEMAS["beltfishes"]
+    assert get_schema("https://api.example.org/v1/projects/") is SCHEMAS["projects"]
+    assert get_schema("/unknown/") is None
+
+
+def test_register_schema_invalid_type():
+    with pytest.raises(ValueError):
+        register_schema("things", {"name": "text"})
+
+
+def test_decoder_dtypes():
+    decoder = ColumnarDecoder(SCHEMAS["beltfishes"])
+    decoder.append(
+        [
+            {
+                "site_name": "Reef A",
+                "latitude": "-17.1",
+                "sample_date": "2023-01-02",
+                "created_on": "2023-01-03T04:05:06Z",
+                "count": 3,
+            }
+        ]
+    )
+    decoder.append([{"site_name": "Reef A", "latitude": None, "count": 4}])
+    df = decoder.to_data_frame()
+
+    assert str(df["site_name"].dtype) == "category"
+    assert df["site_name"].tolist() == ["Reef A", "Reef A"]
+    assert str(df["latitude"].dtype) == "float32"
+    assert df["sample_date"].dt.tz is None
+    assert str(df["created_on"].dt.tz) == "UTC"
+    assert df["count"].tolist() == [3, 4]
+
+
+def test_decoder_pads_missing_columns():
+    decoder = ColumnarDecoder(SCHEMAS["beltfishes"])
+    decoder.append([{"id": "1"}])
+    decoder.append(
+        [{"id": "2", "site_name": "Reef B", "website": "https://example.com"}]
+    )
+    df = decoder.to_data_frame()
+
+    assert df["site_name"].isna().tolist() == [True, False]
+    assert df["website"].isna().tolist() == [True, False]
+
+
+def test_decoder_unhashable_category_values():
+    decoder = ColumnarDecoder({"tags": "category"})
+    decoder.append([{"tags": "a"}, {"tags": ["b", "c"]}])
+    df = decoder.to_data_frame()
+
+    assert df["tags"].tolist() == ["a", ["b", "c"]]
+
+
+def test_decoder_projection():
+    decoder = ColumnarDecoder(SCHEMAS["beltfishes"], columns=["site_name", "missing"])
+    decoder.append([{"id": "1", "site_name": "Reef A"}])
+    df = decoder.to_data_frame()
+
+    assert df.columns.tolist() == ["site_name", "missing"]
+    assert df["missing"].isna().all()
+
+
+def test_decoder_merge():
+    decoder = ColumnarDecoder(SCHEMAS["beltfishes"])
+    decoder.append([{"site_name": "Reef A", "latitude": 1}])
+    other = ColumnarDecoder(SCHEMAS["beltfishes"])
+    other.append([{"site_name": "Reef B", "count": 2}, {"site_name": "Reef A"}])
+    decoder.merge(other)
+    df = decoder.to_data_frame()
+
+    assert df["site_name"].tolist() == ["Reef A", "Reef B", "Reef A"]
+    assert df["latitude"].isna().tolist() == [False, True, True]
+    assert df["count"].isna().tolist() == [True, False, True]
@@ -0,0 +1,109 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from seasnake.base import MERMAID_API_URL
+from seasnake.cache import CachePolicy
+from seasnake.filters import apply_filters, split_filters
+from seasnake.summaries import FishBeltTransect, SampleEvent
+
+
+def test_split_filters():
+    url = "/projects/abc/beltfishes/obstransectbeltfishes/"
+    query_params, local = split_filters(
+        url,
+        {
+            "sample_date_after": datetime.date(2020, 1, 1),
+            "site_ids": ["s2", "s1"],
+            "reef_types": "fringing",
+            "countries": None,
+        },
+    )
+    assert query_params == {
+        "sample_date_after": "2020-01-01",
+        "site_id": "s1,s2",
+        "reef_type": "fringing",
+    }
+    assert local == []
+
+    query_params, local = split_filters(
+        "/summarysampleevents/", {"countries": ["Fiji"]}, {"country_name": "country"}
+    )
+    assert query_params == {}
+    assert local == [("country", "in", ["Fiji"])]
+
+    with pytest.raises(TypeError):
+        split_filters(url, {"site": "s1"})
+
+
+def test_apply_filters():
+    df = pd.DataFrame(
+        {
+            "sample_date": ["2019-12-31", "2020-01-01", "2021-06-01"],
+            "site_id": ["s1", "s2", "s1"],
+        }
+    )
+    filters = [
+        ("sample_date", ">=", pd.Timestamp("2020-01-01")),
+        ("sample_date", "<=", pd.Timestamp("2021-01-01")),
+    ]
+    assert apply_filters(df, filters)["site_id"].tolist() == ["s2"]
+    assert apply_filters(df, [("site_id", "in", ["s1"])], columns=["sample_date"])[
+        "sample_date"
+    ].tolist() == ["2019-12-31", "2021-06-01"]
+    with pytest.raises(ValueError):
+        apply_filters(df, [("reef_zone", "in", ["crest"])])
+
+
+def test_filters_are_pushed_down(requests_mock):
+    url = f"{MERMAID_API_URL}/projects/abc/beltfishes/obstransectbeltfishes/"
+    record = {"id": "1", "site_id": "s1", "created_on": "2023-01-01T00:00:00Z"}
+    requests_mock.get(url, json={"count": 1, "results": [record]})
+    fish_belt = FishBeltTransect(token="token", cache_policy=CachePolicy(ttl=60))
+
+    df = fish_belt.observations("abc", site_ids=["s1"], sample_date_before="2022-12-31")
+    assert df["id"].tolist() == ["1"]
+    assert requests_mock.last_request.qs["site_id"] == ["s1"]
+    assert requests_mock.last_request.qs["sample_date_before"] == ["2022-12-31"]
+
+    # Filtered summaries are cached by their filters.
+    fish_belt.observations("abc", site_ids="s1", sample_date_before="2022-12-31")
+    assert requests_mock.call_count == 1
+    fish_belt.observations("abc", site_ids=["s2"])
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.qs["site_id"] == ["s2"]
+
+
+def test_sample_event_summary_filtered_locally(requests_mock):
+    url = f"{MERMAID_API_URL}/summarysampleevents/"
+    records = [
+        {
+            "id": "1",
+            "country_name": "Fiji",
+            "site_id": "s1",
+            "sample_date": "2020-05-01",
+        },
+        {
+            "id": "2",
+            "country_name": "Kenya",
+            "site_id": "s1",
+            "sample_date": "2021-05-01",
+        },
+        {
+            "id": "3",
+            "country_name": "Fiji",
+            "site_id": "s2",
+            "sample_date": "2022-05-01",
+        },
+    ]
+    requests_mock.get(url, json={"count": 3, "results": records})
+    sample_event = SampleEvent(cache_policy=CachePolicy(ttl=60))
+
+    df = sample_event.summary(countries=["Fiji"], site_ids=["s1"])
+    assert df["country"].tolist() == ["Fiji"]
+    assert "site_id" not in df.columns
+    assert "country_name" not in requests_mock.last_request.qs
+
+    df = sample_event.summary(limit_columns=False, sample_date_after="2021-01-01")
+    assert df["id"].tolist() == ["2", "3"]
@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from seasnake import ProjectLoader
+from seasnake.base import MERMAID_API_URL
+
+
+@pytest.fixture
+def api(requests_mock):
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/abc/.+"),
+        json={"count": 0, "results": []},
+    )
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/abc/beltfishes/.+"),
+        json={
+            "count": 1,
+            "results": [{"id": "1", "created_on": "2023-01-01T00:00:00Z"}],
+        },
+    )
+    return requests_mock
+
+
+def test_load(api):
+    with ProjectLoader(token="token", num_threads=2) as loader:
+        bundle = loader.load("abc")
+
+    assert bundle.protocols == ["beltfish"]
+    assert "beltfish" in bundle and "benthicpit" not in bundle
+    assert list(bundle["beltfish"]) == ["observations", "sample_units", "sample_events"]
+    assert bundle["beltfish"]["observations"]["id"].tolist() == ["1"]
+
+    report = bundle.report
+    assert report["method"][report["protocol"] == "beltfish"].tolist() == [
+        "observations",
+        "sample_units",
+        "sample_events",
+    ]
+    # Protocols without sample events are only asked for those.
+    assert report["method"][report["protocol"] != "beltfish"].unique().tolist() == [
+        "sample_events"
+    ]
+    assert (report["seconds"] >= 0).all()
+    assert report["rows"].sum() == 3
+
+    requested = [r.path for r in api.request_history]
+    assert not any("benthicpits/obstransect" in path for path in requested)
+
+
+def test_load_shares_session(api):
+    loader = ProjectLoader(token="token", num_threads=2)
+    sessions = {client.session for client in loader.clients.values()}
+    assert sessions == {loader.session}
+    loader.close()
+
+
+def test_load_unknown_protocol():
+    with ProjectLoader(token="token") as loader, pytest.raises(ValueError):
+        loader.load("abc", protocols=["unknown"])
+
+
+def test_load_errors(api):
+    api.get(f"{MERMAID_API_URL}/projects/abc/beltfishes/sampleunits/", status_code=500)
+
+    with ProjectLoader(token="token", num_threads=2) as loader:
+        with pytest.raises(Exception):
+            loader.load("abc", protocols=["beltfish"])
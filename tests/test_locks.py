@@ -0,0 +1,101 @@
+import multiprocessing
+import threading
+import time
+from contextlib import ExitStack
+
+import pytest
+
+from seasnake.cache.locks import LockTimeout, file_lock, remove_lock_file
+
+
+def hold_lock(path, locked, release):
+    with file_lock(path):
+        locked.set()
+        release.wait(5)
+
+
+def test_file_lock_excludes_threads(tmp_path):
+    path = tmp_path / "entry.lock"
+    locked = threading.Event()
+    release = threading.Event()
+    thread = threading.Thread(target=hold_lock, args=(path, locked, release))
+    thread.start()
+    locked.wait(5)
+
+    with pytest.raises(LockTimeout):
+        with file_lock(path, timeout=0.1):
+            pass
+    release.set()
+    thread.join()
+
+    with file_lock(path, timeout=0.1):
+        pass
+
+
+def test_file_lock_excludes_processes(tmp_path):
+    path = tmp_path / "entry.lock"
+    context = multiprocessing.get_context("spawn")
+    locked = context.Event()
+    release = context.Event()
+    process = context.Process(target=hold_lock, args=(path, locked, release))
+    process.start()
+    try:
+        assert locked.wait(10)
+        with pytest.raises(LockTimeout):
+            with file_lock(path, timeout=0.1):
+                pass
+    finally:
+        release.set()
+        process.join(10)
+
+
+def test_file_lock_shared(tmp_path):
+    path = tmp_path / "entry.lock"
+    with file_lock(path, shared=True):
+        with file_lock(path, shared=True, timeout=0.1):
+            pass
+        with pytest.raises(LockTimeout):
+            with file_lock(path, timeout=0.1):
+                pass
+
+
+def test_remove_lock_file(tmp_path):
+    path = tmp_path / "entry.lock"
+    locked = threading.Event()
+    release = threading.Event()
+    thread = threading.Thread(target=hold_lock, args=(path, locked, release))
+    thread.start()
+    locked.wait(5)
+
+    assert not remove_lock_file(path)
+    release.set()
+    thread.join()
+    assert remove_lock_file(path)
+    assert not path.exists()
+    assert remove_lock_file(path)
+
+
+def test_file_lock_retakes_removed_file(tmp_path):
+    path = tmp_path / "entry.lock"
+    waiting = threading.Event()
+    acquired = threading.Event()
+
+    def wait_for_lock():
+        waiting.set()
+        with file_lock(path):
+            acquired.set()
+
+    with ExitStack() as old_lock:
+        old_lock.enter_context(file_lock(path))
+        thread = threading.Thread(target=wait_for_lock)
+        thread.start()
+        waiting.wait(5)
+        time.sleep(0.1)
+        # The file the waiter opened is replaced while it waits.
+        path.unlink()
+        with file_lock(path, timeout=1):
+            old_lock.close()
+            time.sleep(0.1)
+            assert not acquired.is_set()
+    thread.join(5)
+    assert acquired.is_set()
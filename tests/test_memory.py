@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from seasnake.cache import MemoryCache
+from seasnake.cache.memory import _copy_on_write
+
+
+def frame(size):
+    return pd.DataFrame({"value": range(size)}, dtype="int64")
+
+
+def test_memory_cache_returns_views():
+    cache = MemoryCache()
+    cache.put("a", frame(3))
+    df = cache.get("a")
+    if _copy_on_write():
+        df.loc[0, "value"] = 100
+    else:
+        # Without Copy-on-Write the cached arrays are shared read-only.
+        with pytest.raises(ValueError):
+            df.loc[0, "value"] = 100
+    df["value"] = 0
+
+    assert cache.get("a")["value"].tolist() == [0, 1, 2]
+
+
+def test_memory_cache_returns_uncached_frame():
+    cache = MemoryCache(max_bytes=1)
+    df = frame(3)
+
+    assert cache.put("a", df) is df
+    assert cache.get("a") is None
+
+
+def test_memory_cache_token():
+    cache = MemoryCache()
+    cache.put("a", frame(3), token=1)
+
+    assert cache.get("a", token=1) is not None
+    assert cache.get("a", token=2) is None
+    assert cache.get("a", token=1) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_memory_cache_lru_eviction():
+    size = int(frame(100).memory_usage(index=True, deep=True).sum())
+    cache = MemoryCache(max_bytes=size * 2)
+    cache.put("a", frame(100))
+    cache.put("b", frame(100))
+    cache.get("a")
+    cache.put("c", frame(100))
+    cache.put("d", frame(1000))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.get("d") is None
+    assert cache.stats()["bytes"] == size * 2
+
+
+def test_memory_cache_get_or_load():
+    cache = MemoryCache()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return frame(3)
+
+    cache.get_or_load("a", load)
+    cache.get_or_load("a", load)
+
+    assert len(loads) == 1
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,96 @@
+import pytest
+
+from seasnake.base import MERMAID_API_URL
+from seasnake.query import SummaryQuery
+from seasnake.schemas import FILTER_PARAMS
+from seasnake.summaries import FishBeltTransect
+
+URL = f"{MERMAID_API_URL}/projects/abc/beltfishes/obstransectbeltfishes/"
+
+
+@pytest.fixture
+def api(requests_mock):
+    records = [
+        {
+            "id": str(i),
+            "site_id": f"s{i % 2}",
+            "fish_taxon": f"Taxon {i}",
+            "created_on": "2023-01-01T00:00:00Z",
+        }
+        for i in range(25)
+    ]
+
+    def page(request, context):
+        limit = int(request.qs["limit"][0])
+        offset = (int(request.qs.get("page", ["1"])[0]) - 1) * limit
+        return {"count": len(records), "results": records[offset : offset + limit]}
+
+    requests_mock.get(URL, json=page)
+    return requests_mock
+
+
+def test_lazy_query_is_not_fetched(api):
+    query = FishBeltTransect(token="token").observations("abc", lazy=True)
+
+    assert isinstance(query, SummaryQuery)
+    query = query.filter(site_ids=["s1"]).select("id", "fish_taxon")
+    assert query
+    assert api.call_count == 0
+    with pytest.raises(TypeError):
+        query.filter(site="s1")
+    with pytest.raises(ValueError):
+        query.select("site_id")
+
+
+def test_head_fetches_one_page(api):
+    query = FishBeltTransect(token="token").observations("abc", lazy=True)
+
+    df = query.select("id").head(10).collect()
+    assert df["id"].tolist() == [str(i) for i in range(10)]
+    assert df.columns.tolist() == ["id"]
+    assert api.call_count == 1
+    assert api.last_request.qs["limit"] == ["10"]
+
+
+def test_len_reads_count(api):
+    query = FishBeltTransect(token="token").observations("abc", lazy=True)
+
+    assert len(query) == 25
+    assert len(query.head(5)) == 5
+    assert api.call_count == 2
+    assert api.last_request.qs["limit"] == ["1"]
+
+    len(query.filter(site_ids=["s1"]))
+    assert api.last_request.qs["site_id"] == ["s1"]
+
+
+def test_collect(api):
+    fish_belt = FishBeltTransect(token="token")
+    query = fish_belt.observations("abc", lazy=True).select("id", "fish_taxon")
+
+    df = query.collect()
+    assert len(df) == 25
+    assert df.columns.tolist() == ["id", "fish_taxon"]
+    assert query.head(0).collect().empty
+
+
+def test_head_with_local_filter_requests_full_pages(requests_mock, monkeypatch):
+    monkeypatch.delitem(FILTER_PARAMS, "beltfishes")
+    records = [
+        {"id": str(i), "country_name": "Fiji" if i % 5 == 0 else "Belize"}
+        for i in range(25)
+    ]
+
+    def page(request, context):
+        limit = int(request.qs["limit"][0])
+        offset = (int(request.qs.get("page", ["1"])[0]) - 1) * limit
+        return {"count": len(records), "results": records[offset : offset + limit]}
+
+    requests_mock.get(URL, json=page)
+    fish_belt = FishBeltTransect(token="token")
+    query = fish_belt.observations("abc", lazy=True).filter(countries=["Fiji"])
+
+    df = query.head(2).collect()
+    assert df["id"].tolist() == ["0", "5"]
+    assert requests_mock.call_count == 1
+    assert requests_mock.last_request.qs["limit"] == [str(fish_belt.page_size)]
@@ -0,0 +1,40 @@
+import time
+
+from seasnake.base import MERMAID_API_URL, MermaidBase
+from seasnake.ratelimit import RateLimiter, retry_after_seconds
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds("3") == 3
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") < 0
+
+
+def test_throttle_pauses_all_callers():
+    limiter = RateLimiter(rate=100, burst=100, jitter=0)
+    limiter.throttle(0, retry_after=0.2)
+    assert limiter.rate == 50
+
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.19
+
+    limiter.succeeded()
+    assert limiter.rate == 51
+
+
+def test_fetch_retries_throttled_request(requests_mock, rate_limiter):
+    url = f"{MERMAID_API_URL}/records/"
+    requests_mock.get(
+        url,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "0.1"}},
+            {"json": {"count": 0, "results": []}},
+        ],
+    )
+    client = MermaidBase()
+
+    assert client.fetch(url) == {"count": 0, "results": []}
+    assert requests_mock.call_count == 2
+    assert client.rate_limiter is rate_limiter
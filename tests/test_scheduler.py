@@ -0,0 +1,108 @@
+import re
+import threading
+
+import pytest
+
+from seasnake.base import MERMAID_API_URL
+from seasnake.scheduler import PageScheduler
+from seasnake.summaries import Bleaching, FishBeltTransect
+
+
+def test_scheduler_round_robin():
+    scheduler = PageScheduler(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def block():
+        started.set()
+        release.wait()
+
+    scheduler.submit(block)
+    started.wait()
+    futures = []
+    with scheduler.group("a"):
+        futures += [scheduler.submit(order.append, f"a{i}") for i in range(3)]
+    with scheduler.group("b"):
+        futures += [scheduler.submit(order.append, f"b{i}") for i in range(2)]
+    assert scheduler.queued() == {"a": 3, "b": 2}
+
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert order == ["a0", "b0", "a1", "b1", "a2"]
+    scheduler.shutdown()
+
+
+def test_scheduler_errors_and_cancel():
+    scheduler = PageScheduler(max_workers=1)
+    release = threading.Event()
+    scheduler.submit(release.wait)
+    failed = scheduler.submit(lambda: 1 / 0)
+    queued = scheduler.submit(pow, 2, 3)
+
+    scheduler.shutdown(wait=False, cancel_futures=True)
+    release.set()
+    assert failed.cancelled() and queued.cancelled()
+    with pytest.raises(RuntimeError):
+        scheduler.submit(pow, 2, 3)
+
+    scheduler = PageScheduler(max_workers=2)
+    with pytest.raises(ZeroDivisionError):
+        scheduler.submit(lambda: 1 / 0).result(timeout=5)
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def api(requests_mock):
+    def observations(request, context):
+        project_id = re.search("/projects/([^/]+)/", request.path).group(1)
+        page = int(request.qs.get("page", ["1"])[0])
+        return {
+            "count": 6,
+            "results": [
+                {"id": f"{project_id}-{page}-{i}", "created_on": "2023-01-01T00:00:00Z"}
+                for i in range(2)
+            ],
+        }
+
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/.+/obstransectbeltfishes/"),
+        json=observations,
+    )
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/empty/.+"),
+        json={"count": 0, "results": []},
+    )
+    return requests_mock
+
+
+def test_observations_many(api):
+    fish_belt = FishBeltTransect(token="token", num_threads=1)
+    fish_belt.REQUEST_LIMIT = 2
+    scheduler = PageScheduler(max_workers=2)
+
+    df = fish_belt.observations_many(["p1", "p2", "p1"], scheduler=scheduler)
+    assert df["project_id"].tolist() == ["p1"] * 6 + ["p2"] * 6
+    assert df["id"].tolist()[:3] == ["p1-1-0", "p1-1-1", "p1-2-0"]
+
+    results = dict(
+        fish_belt.iter_many("observations", ["p1", "p2"], scheduler=scheduler)
+    )
+    assert sorted(results) == ["p1", "p2"]
+    assert len(results["p2"]) == 6
+    scheduler.shutdown()
+
+
+def test_sample_events_many_empty(api):
+    fish_belt = FishBeltTransect(token="token")
+    assert fish_belt.sample_events_many(["empty"]).empty
+
+
+@pytest.mark.parametrize(
+    "method",
+    ["observations", "observations_async", "iter_observations", "aggregate", "close"],
+)
+def test_fetch_many_unknown_method(method):
+    with pytest.raises(ValueError):
+        list(Bleaching(token="token").iter_many(method, ["p1"]))
@@ -0,0 +1,125 @@
+import pytest
+
+from seasnake.base import MermaidBase
+from seasnake.cache import CacheStore, PickleBackend, client
+from seasnake.cache.locks import file_lock
+
+
+def write_entry(store, url, size=10):
+    key = store.key(url)
+    path = store.directory / f"{key}.bin"
+    store.directory.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    store.record_write(key, url, [path])
+    return key, path
+
+
+def test_store_stats(tmp_path):
+    store = CacheStore(tmp_path)
+    key, _ = write_entry(store, "https://example.org/projects/abc/beltfishes/")
+    store.record_hit(key)
+    store.record_hit(key)
+
+    assert len(key) == 64
+    stats = store.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 10
+    assert stats["hits"] == 2
+    assert store.entries()["project_id"].tolist() == ["abc"]
+
+
+def test_store_invalid_eviction(tmp_path):
+    with pytest.raises(ValueError):
+        CacheStore(tmp_path, eviction="fifo")
+
+
+def test_store_lru_eviction(tmp_path):
+    store = CacheStore(tmp_path, max_bytes=25)
+    first, first_path = write_entry(store, "https://example.org/a/")
+    second, second_path = write_entry(store, "https://example.org/b/")
+    store.record_hit(first)
+    write_entry(store, "https://example.org/c/")
+
+    assert first_path.exists()
+    assert not second_path.exists()
+    assert store.stats()["entries"] == 2
+
+
+def test_store_lfu_eviction(tmp_path):
+    store = CacheStore(tmp_path, max_bytes=25, eviction="lfu")
+    first, first_path = write_entry(store, "https://example.org/a/")
+    second, second_path = write_entry(store, "https://example.org/b/")
+    store.record_hit(first)
+    store.record_hit(second)
+    store.record_hit(second)
+    _, third_path = write_entry(store, "https://example.org/c/")
+
+    assert not first_path.exists()
+    assert second_path.exists()
+    assert third_path.exists()
+    assert store.prune(max_bytes=10) == 1
+    assert not third_path.exists()
+
+
+def test_store_clear_project(tmp_path):
+    store = CacheStore(tmp_path)
+    _, abc_path = write_entry(store, "https://example.org/projects/abc/beltfishes/")
+    _, xyz_path = write_entry(store, "https://example.org/projects/xyz/beltfishes/")
+
+    assert store.clear(project_id="abc") == 1
+    assert not abc_path.exists()
+    assert xyz_path.exists()
+    assert store.clear() == 1
+    assert store.stats()["entries"] == 0
+
+
+def test_store_deletes_lock_files(tmp_path):
+    store = CacheStore(tmp_path, max_bytes=25)
+    first, _ = write_entry(store, "https://example.org/a/")
+    second, _ = write_entry(store, "https://example.org/b/")
+    for key in (first, second):
+        with file_lock(store.lock_file(key, "fetch")):
+            pass
+    write_entry(store, "https://example.org/c/")
+
+    assert not store.lock_file(first, "fetch").exists()
+    second_lock = store.lock_file(second, "fetch")
+    with file_lock(second_lock):
+        store.clear()
+        # A held lock is left in place.
+        assert second_lock.exists()
+    write_entry(store, "https://example.org/b/")
+    store.clear()
+    assert not second_lock.exists()
+
+
+def test_store_prune_missing_files(tmp_path):
+    store = CacheStore(tmp_path)
+    _, path = write_entry(store, "https://example.org/a/")
+    path.unlink()
+
+    assert store.prune() == 1
+    assert store.stats()["entries"] == 0
+
+
+def test_client_cache_store(tmp_path, dataframe):
+    store = CacheStore(tmp_path / "custom", max_bytes=1, eviction="lfu")
+    client = MermaidBase(cache_store=store, cache_backend=PickleBackend())
+    client.to_cache("/a/", dataframe)
+    client.to_cache("/b/", dataframe)
+
+    assert client.cache is store
+    assert client.get_cache_file_paths("/b/")[0].parent == tmp_path / "custom"
+    # Only the newest entry is kept under the store's size limit.
+    assert client.read_cache("/a/") is None
+    assert store.stats()["entries"] == 1
+
+
+def test_summaries_cache_dir_alias(tmp_path):
+    from seasnake.summaries import base
+
+    # The `cache_dir` fixture restores `client.CACHE_DIR` afterwards.
+    with pytest.warns(DeprecationWarning):
+        base.CACHE_DIR = tmp_path / "moved"
+    with pytest.warns(DeprecationWarning):
+        assert base.CACHE_DIR == client.CACHE_DIR == tmp_path / "moved"
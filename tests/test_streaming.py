@@ -0,0 +1,25 @@
+import requests
+
+from seasnake.streaming import parse_page
+
+
+def test_parse_page(requests_mock):
+    url = "https://example.com/records/"
+    requests_mock.get(
+        url,
+        text='{"count": 2, "next": null, "results": [{"id": 1, "x": [1.5]}, {"id": 2}]}',
+    )
+    page = parse_page(requests.get(url, stream=True))
+
+    assert page["count"] == 2
+    assert page["next"] is None
+    assert list(page["results"]) == [{"id": 1, "x": [1.5]}, {"id": 2}]
+
+
+def test_parse_page_count_after_results(requests_mock):
+    url = "https://example.com/records/"
+    requests_mock.get(url, text='{"results": [{"id": 1}], "count": 1}')
+    page = parse_page(requests.get(url, stream=True))
+
+    assert page["count"] == 1
+    assert list(page["results"]) == [{"id": 1}]
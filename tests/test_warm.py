@@ -0,0 +1,55 @@
+import re
+
+import pytest
+
+from seasnake.base import MERMAID_API_URL
+from seasnake.cache import CachePolicy
+from seasnake.cache.__main__ import main
+from seasnake.cache.warm import warm
+from seasnake.summaries import SUMMARY_METHODS
+
+
+@pytest.fixture
+def api(requests_mock):
+    requests_mock.get(
+        f"{MERMAID_API_URL}/projects/",
+        json={"count": 1, "results": [{"id": "abc", "name": "Project A"}]},
+    )
+    requests_mock.get(
+        re.compile(f"{MERMAID_API_URL}/projects/abc/.+"),
+        json={
+            "count": 1,
+            "results": [{"id": "1", "created_on": "2023-01-01T00:00:00Z"}],
+        },
+    )
+    return requests_mock
+
+
+def test_warm(api):
+    report = warm("token", max_workers=3)
+
+    num_methods = sum(len(methods) for _, methods in SUMMARY_METHODS.values())
+    assert len(report) == num_methods
+    assert set(report["project_id"]) == {"abc"}
+    assert set(report["outcome"]) == {"fetched"}
+    assert (report["bytes"] > 0).all()
+
+    report = warm("token", protocols=["benthicpit"])
+    assert report["outcome"].tolist() == ["revalidated"] * 3
+
+    report = warm("token", protocols=["benthicpit"], cache_policy=CachePolicy(ttl=60))
+    assert report["outcome"].tolist() == ["skipped"] * 3
+
+
+def test_warm_failures(api):
+    api.get(f"{MERMAID_API_URL}/projects/abc/beltfishes/sampleunits/", status_code=500)
+
+    report = warm("token", project_ids=["abc"], protocols=["beltfish"])
+    failed = report[report["outcome"] == "failed"]
+    assert failed["method"].tolist() == ["sample_units"]
+    assert failed["error"].notna().all()
+
+
+def test_warm_command(api, capsys):
+    assert main(["warm", "--token", "token", "--protocol", "benthicpit"]) == 0
+    assert "3 fetched" in capsys.readouterr().out